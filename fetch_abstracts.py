@@ -1,25 +1,149 @@
-from Bio import Entrez
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pandas as pd
+import requests
 
-Entrez.email = "example@email.com"  # required by NCBI (Put your email here)
+EMAIL = "example@email.com"  # required by NCBI (Put your email here)
 INPUT_CSV = "data/publications.csv"
 OUTPUT_CSV = "data/publications_with_abstracts.csv"
+CHECKPOINT = "data/abstracts_checkpoint.jsonl"  # append-only, one line per fetched ID
+
+# Point at a local stub server for testing with EUTILS_BASE=http://127.0.0.1:8000
+EUTILS_BASE = os.environ.get("EUTILS_BASE", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils")
+API_KEY = os.environ.get("NCBI_API_KEY")
+
+BATCH_SIZE = 50   # IDs per efetch request
+MAX_WORKERS = 3   # concurrent requests in flight
+REQUESTS_PER_SECOND = 10 if API_KEY else 3  # NCBI E-utilities limits
+MAX_RETRIES = 4
+
+class RateLimiter:
+    """Thread-safe limiter that spaces request starts evenly"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(max(0.0, slot - now))
+
+_local = threading.local()
+
+def get_session():
+    """One keep-alive session per worker thread"""
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
+def pmc_id_from_link(link):
+    """Numeric PMC ID from a link like .../pmc/articles/PMC4136787/"""
+    return link.rstrip("/").split("/")[-1].replace("PMC", "")
+
+def parse_articles(xml_text):
+    """Map numeric PMC ID -> abstract text for every article in an efetch response"""
+    abstracts = {}
+    root = ET.fromstring(xml_text)
+    for article in root.iter("article"):
+        pmc_id = None
+        for article_id in article.iter("article-id"):
+            if article_id.get("pub-id-type") in ("pmc", "pmcid", "pmcaid"):
+                pmc_id = (article_id.text or "").strip().replace("PMC", "")
+                break
+        if not pmc_id:
+            continue
+        abstract = article.find(".//abstract")
+        text = " ".join("".join(abstract.itertext()).split()) if abstract is not None else ""
+        abstracts[pmc_id] = text
+    return abstracts
+
+def fetch_batch(ids, limiter):
+    """Fetch abstracts for a batch of PMC IDs with one multi-ID efetch call"""
+    params = {"db": "pmc", "id": ",".join(ids), "retmode": "xml", "email": EMAIL}
+    if API_KEY:
+        params["api_key"] = API_KEY
+
+    for attempt in range(MAX_RETRIES):
+        limiter.wait()
+        try:
+            response = get_session().post(f"{EUTILS_BASE}/efetch.fcgi", data=params, timeout=60)
+            if response.status_code == 429 or response.status_code >= 500:
+                raise requests.HTTPError(f"HTTP {response.status_code}")
+            response.raise_for_status()
+            abstracts = parse_articles(response.text)
+            # IDs missing from the response have no abstract; record them so they are not refetched
+            return {pmc_id: abstracts.get(pmc_id, "") for pmc_id in ids}
+        except (requests.RequestException, ET.ParseError) as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            delay = 2 ** attempt
+            print(f"Batch starting {ids[0]} failed ({e}), retrying in {delay}s")
+            time.sleep(delay)
+
+def load_checkpoint(path=CHECKPOINT):
+    """Abstracts already fetched by earlier (possibly interrupted) runs"""
+    done = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from an interrupted write
+                done[record["pmc_id"]] = record["abstract"]
+    return done
+
+def main():
+    df = pd.read_csv(INPUT_CSV)
+    pmc_ids = [pmc_id_from_link(link) for link in df["Link"]]
+
+    done = load_checkpoint(CHECKPOINT)
+    pending = [pmc_id for pmc_id in dict.fromkeys(pmc_ids) if pmc_id not in done]
+    batches = [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+    print(f"{len(done)} abstracts already fetched, {len(pending)} remaining in {len(batches)} batches")
+
+    limiter = RateLimiter(REQUESTS_PER_SECOND)
+    fetched = 0
+    failed = 0
+    start = time.monotonic()
+
+    with open(CHECKPOINT, "a", encoding="utf-8") as checkpoint, \
+            ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(fetch_batch, batch, limiter): batch for batch in batches}
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                failed += len(batch)
+                print(f"Error fetching batch starting PMC{batch[0]}: {e}")
+                continue
+            for pmc_id, abstract in results.items():
+                checkpoint.write(json.dumps({"pmc_id": pmc_id, "abstract": abstract}) + "\n")
+            checkpoint.flush()
+            done.update(results)
+            fetched += len(results)
+            elapsed = time.monotonic() - start
+            print(f"Fetched {fetched}/{len(pending)} ({fetched / elapsed:.1f} docs/s)")
+
+    elapsed = time.monotonic() - start
+    if fetched:
+        print(f"Fetched {fetched} abstracts in {elapsed:.1f}s ({fetched / elapsed:.1f} docs/s)")
+    if failed:
+        print(f"{failed} IDs failed; rerun to resume from the checkpoint")
+
+    df["Abstract"] = [done.get(pmc_id, "") for pmc_id in pmc_ids]
+    df.to_csv(OUTPUT_CSV, index=False)
+    print(f"Saved abstracts to {OUTPUT_CSV}")
 
-df = pd.read_csv(INPUT_CSV)
-abstracts = []
-
-for i, link in enumerate(df['Link']):
-    print(f"Fetching {i+1}/{len(df)}: {link}")
-    try:
-        pmc_id = link.split("/")[-2]  # get PMC ID from URL
-        handle = Entrez.efetch(db="pmc", id=pmc_id, rettype="abstract", retmode="text")
-        abstract_text = handle.read().strip()
-        handle.close()
-    except Exception as e:
-        print(f"Error fetching {link}: {e}")
-        abstract_text = ""
-    abstracts.append(abstract_text)
-
-df['Abstract'] = abstracts
-df.to_csv(OUTPUT_CSV, index=False)
-print(f"Saved abstracts to {OUTPUT_CSV}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
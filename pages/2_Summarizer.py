@@ -1,13 +1,12 @@
 # pages/2_Summarizer.py
 import streamlit as st
 import pandas as pd
-import re
-import plotly.express as px
-from src.preprocess import load_and_clean
-from src.search import search_publications
-from src.summarizer import summarize
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+from src.corpus import get_corpus
+from src.summary_cache import get_summary_cache
+from src.aggregates import FOCUS_AREAS, word_cloud_image
+from src.cards import DEFAULT_ANALYSIS_SECTIONS, analysis_request
+from src.search import SearchIndex
+from src.taxonomy import CATEGORY_FILTERS
 import numpy as np
 from datetime import datetime
 
@@ -32,16 +31,41 @@ with col2:
     Analyze research trends, identify knowledge gaps, and explore cross-mission findings.
     """)
 
-# Load and process data
-@st.cache_data
-def load_data():
-    df = load_and_clean("data/publications_with_abstracts.csv")
-    # Add research impact score (example metric)
-    df['impact_score'] = df['abstract'].str.len() + df['title'].str.len()
-    df['impact_score'] = (df['impact_score'] - df['impact_score'].min()) / (df['impact_score'].max() - df['impact_score'].min())
-    return df
+@st.cache_resource
+def load_precomputed_summaries():
+    # Written by `python -m src.batch`; empty until the job has run
+    from src.batch import load_summaries_table
+    return load_summaries_table()
 
-df = load_data()
+# Charts import Plotly when they are drawn, so the header and sidebar render before it loads
+def focus_impact_chart(focus_data):
+    import plotly.express as px
+    return px.scatter(focus_data,
+                      x='Publications',
+                      y='Impact Score',
+                      size='Publications',
+                      color='Area',
+                      title='Research Impact by Focus Area')
+
+def timeline_chart(yearly):
+    import plotly.express as px
+    return px.line(yearly, x='Year', y='Publications', title='Publication Trends Over Time')
+
+def focus_share_chart(focus):
+    import plotly.express as px
+    return px.pie(focus, values='Publications', names='Focus Area',
+                  title='Distribution of Research Focus Areas')
+
+def coverage_chart(gaps_data):
+    import plotly.express as px
+    return px.bar(gaps_data, x='Research Area', y='Coverage', color='Priority',
+                  title='Research Coverage by Area')
+
+# One processed corpus per process, shared with the Chat page
+corpus = get_corpus()
+df = corpus.frame
+keyword_index = corpus.keyword_index()
+aggregates = corpus.aggregates()
 
 # Sidebar Navigation and Filters
 with st.sidebar:
@@ -49,13 +73,7 @@ with st.sidebar:
     
     # Research Focus
     st.markdown("### Research Focus")
-    focus_areas = {
-        "Human Health": ["physiology", "medical", "health"],
-        "Life Support": ["plants", "agriculture", "oxygen"],
-        "Radiation Protection": ["radiation", "shielding", "cosmic"],
-        "Microgravity Effects": ["microgravity", "weightlessness"],
-        "Mars Mission Prep": ["mars", "long-duration", "habitat"]
-    }
+    focus_areas = FOCUS_AREAS
     selected_focus = st.multiselect(
         "Select Research Areas",
         list(focus_areas.keys()),
@@ -71,21 +89,8 @@ with st.sidebar:
             ["All", "Organism", "Experiment", "Mission"]
         )
     with col2:
-        if filter_category == "Organism":
-            filter_value = st.selectbox("Type", [
-                "All", "Human", "Mice", "Plants", 
-                "Cells", "Microorganisms"
-            ])
-        elif filter_category == "Experiment":
-            filter_value = st.selectbox("Type", [
-                "All", "Genomics", "Physiology", 
-                "Radiation", "Behavior", "Systems"
-            ])
-        elif filter_category == "Mission":
-            filter_value = st.selectbox("Type", [
-                "All", "ISS", "Shuttle", "Artemis",
-                "Mars Analog", "Ground Control"
-            ])
+        if filter_category in CATEGORY_FILTERS:
+            filter_value = st.selectbox("Type", ["All", *CATEGORY_FILTERS[filter_category]])
         else:
             filter_value = "All"
     
@@ -101,8 +106,8 @@ with st.sidebar:
     st.markdown("### AI Analysis")
     ai_choice = st.selectbox(
         "Select AI Model",
-        ["openai", "ollama"],
-        help="Choose the AI model for research analysis"
+        ["openai", "ollama", "auto"],
+        help="Choose the AI model for research analysis; auto picks the fastest healthy backend"
     )
     
     analysis_depth = st.select_slider(
@@ -115,7 +120,13 @@ with st.sidebar:
     include_sections = st.multiselect(
         "Include Sections",
         ["Abstract", "Methods", "Results", "Discussion"],
-        default=["Abstract", "Results"]
+        default=DEFAULT_ANALYSIS_SECTIONS
+    )
+
+    cache_stats = get_summary_cache().stats()
+    st.caption(
+        f"Summary cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+        f"{cache_stats['entries']} stored"
     )
 
 # Main Content Area
@@ -147,26 +158,10 @@ with tab1:
         'Impact Score': [0.85, 0.75, 0.90, 0.80, 0.95]
     })
     
-    fig = px.scatter(focus_data, 
-                    x='Publications', 
-                    y='Impact Score',
-                    size='Publications',
-                    color='Area',
-                    title='Research Impact by Focus Area')
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Generate and display word cloud
-    text = ' '.join(df['abstract'].fillna(''))
-    wordcloud = WordCloud(
-        width=800, height=400,
-        background_color='rgba(255, 255, 255, 0)',
-        mode='RGBA'
-    ).generate(text)
-    
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.imshow(wordcloud, interpolation='bilinear')
-    ax.axis('off')
-    st.pyplot(fig)
+    st.plotly_chart(focus_impact_chart(focus_data), use_container_width=True)
+
+    # Word cloud rendered once per corpus version and cached as a PNG
+    st.image(str(word_cloud_image(aggregates)))
 
 # Research Explorer Tab
 with tab2:
@@ -188,36 +183,34 @@ with tab2:
         st.markdown(f"*Active Filters: {' | '.join(active_filters)}*")
     
     # Filter publications based on all criteria
-    filtered_df = df.copy()
+    matches = keyword_index.all()
     
-    # Apply text search
+    # Apply text search; matches are ranked with the ingest-time TF-IDF index
+    query_scores = None
     if query:
-        filtered_df = filtered_df[
-            filtered_df['title'].str.contains(query, case=False, na=False) |
-            filtered_df['abstract'].str.contains(query, case=False, na=False)
-        ]
+        matches = np.intersect1d(matches, keyword_index.match(query), assume_unique=True)
+        query_scores = corpus.search_index().relevance(query)
     
-    # Apply category filters
+    # Apply category filters; each option stands for a list of whole-word terms
     if filter_category != "All" and filter_value != "All":
-        col_map = {
-            'Organism': 'organism',
-            'Experiment': 'experiment_type',
-            'Mission': 'mission'
-        }
-        if col_map.get(filter_category) in filtered_df.columns:
-            filtered_df = filtered_df[
-                filtered_df[col_map[filter_category]].str.contains(filter_value, case=False, na=False)
-            ]
+        matches = np.intersect1d(
+            matches,
+            keyword_index.match_any(CATEGORY_FILTERS[filter_category][filter_value], prefix=False),
+            assume_unique=True
+        )
     
     # Apply research focus filters
     if selected_focus:
         focus_keywords = []
         for focus in selected_focus:
             focus_keywords.extend(focus_areas[focus])
-        focus_pattern = '|'.join(focus_keywords)
-        filtered_df = filtered_df[
-            filtered_df['abstract'].str.contains(focus_pattern, case=False, na=False)
-        ]
+        matches = np.intersect1d(
+            matches,
+            keyword_index.match_any(focus_keywords, fields=('abstract',)),
+            assume_unique=True
+        )
+
+    filtered_df = corpus.rows(matches)
     
     # Apply date filter
     if 'year' in filtered_df.columns:
@@ -237,148 +230,47 @@ with tab2:
             key="sort_publications"
         )
     
-    # Display publications
-    for idx, row in filtered_df.head(10).iterrows():
-        # Clean and process publication data
-        def clean_abstract(text):
-            """Clean and format abstract text"""
-            if pd.isna(text) or not text:
-                return "Abstract not available."
-            
-            # Remove metadata-like patterns
-            patterns = [
-                r'PMC\d+',                      # PMC IDs
-                r'\d{4}-\d{4}',                 # ISSN numbers
-                r'PONE-D-\d+-\d+',             # PLOS submission IDs
-                r'10\.\d{4}/[^\s]+',           # DOIs
-                r'PLoS\s+ONE?',                 # Journal names
-                r'\d+\s*\.\s*\d+',             # Decimal numbers
-                r'Research Article',            # Article type labels
-                r'journal\.\s*[^\s]+',         # Journal references
-                r'Biology and Life Sciences',   # Subject categories
-                r'Physical Sciences',
-                r'Astronomical Sciences',
-                r'Space Exploration',
-                r'Research and Analysis Methods',
-                r'Medicine and Health Sciences',
-                r'Animal Studies',
-                r'Model Organisms',
-                r'Animal Models',
-                r'Mouse Models',
-                r'Bioethics',
-                r'Veterinary Science',
-                r'Animal Management',
-                r'Animal Welfare',
-                r'Zoology',
-                r'Animal Behavior',
-                r'Agriculture',
-            ]
-            
-            for pattern in patterns:
-                text = re.sub(pattern, '', text)
-            
-            # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text)
-            text = text.strip()
-            
-            # If the cleaned text is too short or seems like metadata
-            if len(text) < 100 or not any(char.islower() for char in text):
-                return "Abstract content is being processed. Please check the source publication for complete details."
-            
-            return text
-
-        def calculate_relevance_score(text, title):
-            """Calculate research relevance score based on key space biology terms"""
-            relevance_factors = {
-                'microgravity': 5,
-                'space': 4,
-                'astronaut': 4,
-                'mission': 3,
-                'bion': 4,
-                'iss': 4,
-                'shuttle': 3,
-                'lunar': 4,
-                'mars': 5,
-                'radiation': 4,
-                'bone': 3,
-                'muscle': 3,
-                'immune': 3,
-                'health': 3,
-                'medicine': 2,
-                'biology': 2,
-                'experiment': 2,
-                'research': 1
-            }
-            
-            combined_text = f"{title} {text}".lower()
-            score = sum(weight for term, weight in relevance_factors.items() 
-                       if term in combined_text)
-            
-            # Normalize to 0-1 range, using 40% of max possible as denominator
-            # to make scores more meaningful (since no paper will have all terms)
-            max_possible_score = sum(relevance_factors.values())
-            normalized_score = min(score / (max_possible_score * 0.4), 1.0)
-            
-            return normalized_score
+    # Sort key per corpus position, from the query scores or the precomputed card columns
+    if sort_by == "Relevance" and query_scores is not None:
+        sort_key = query_scores
+    elif sort_by == "Relevance":
+        sort_key = corpus.frame['card_relevance'].to_numpy()
+    elif sort_by == "Date" and 'year' in corpus.frame.columns:
+        # Undated publications go last
+        sort_key = np.nan_to_num(corpus.frame['year'].to_numpy(dtype=float), nan=-np.inf)
+    elif sort_by == "Impact Score":
+        sort_key = corpus.frame['impact_score'].to_numpy()
+    else:
+        sort_key = np.zeros(len(corpus))
+    # Row labels are corpus positions, which is how the sort key is ordered
+    in_results = np.zeros(len(corpus), dtype=bool)
+    in_results[filtered_df.index] = True
 
-        def extract_metadata(text, title=""):
-            """Extract meaningful metadata from text"""
-            # Organism detection patterns
-            organisms = {
-                'mice': ['mice', 'mouse', 'murine', 'rodent'],
-                'human': ['human', 'patient', 'astronaut', 'crew'],
-                'plant': ['plant', 'arabidopsis', 'seed', 'vegetation'],
-                'cell': ['cell', 'culture', 'in vitro', 'tissue']
-            }
-            
-            # Experiment type patterns
-            experiments = {
-                'microgravity': ['microgravity', 'weightless', 'zero gravity', 'space flight', 'spaceflight'],
-                'radiation': ['radiation', 'cosmic ray', 'ionizing', 'solar particle'],
-                'bone': ['bone', 'skeletal', 'osteoclast', 'osteoblast', 'osteo'],
-                'immune': ['immune', 'lymphocyte', 'cytokine', 'immunology'],
-                'genomic': ['gene', 'expression', 'transcriptome', 'dna', 'rna']
-            }
-            
-            # Mission patterns
-            missions = {
-                'ISS': ['iss', 'international space station', 'space station'],
-                'Shuttle': ['space shuttle', 'sts', 'shuttle mission'],
-                'Bion-M1': ['bion-m1', 'bion m1', 'bion-m 1', 'bion'],
-                'Artemis': ['artemis', 'lunar gateway', 'moon mission'],
-                'Mars': ['mars', 'red planet', 'martian']
-            }
-            
-            text_lower = text.lower()
-            
-            # Find organism
-            organism = next((key.title() for key, terms in organisms.items() 
-                           if any(term in text_lower for term in terms)), 'Various')
-            
-            # Find experiment type
-            exp_type = next((key.title() for key, terms in experiments.items() 
-                           if any(term in text_lower for term in terms)), 'General')
-            
-            # Find mission
-            mission = next((key for key, terms in missions.items() 
-                          if any(term in text_lower for term in terms)), 'Various')
-            
-            return organism, exp_type, mission
+    # Only the current page of cards is rendered
+    page_cols = st.columns([1, 1, 3])
+    with page_cols[0]:
+        page_size = st.selectbox("Per page", [10, 25, 50], key="explorer_page_size")
+    page_count = max(1, -(-len(filtered_df) // page_size))
+    # Filters may have shrunk the result set below the remembered page
+    if st.session_state.get("explorer_page", 1) > page_count:
+        st.session_state["explorer_page"] = page_count
+    with page_cols[1]:
+        page = st.number_input("Page", min_value=1, max_value=page_count,
+                               step=1, key="explorer_page")
+    with page_cols[2]:
+        st.caption(f"Page {page} of {page_count}")
+    # Rank only as far as the end of this page instead of sorting every result
+    order = SearchIndex.top_k(sort_key, in_results, page * page_size)
+    page_df = corpus.rows(order[(page - 1) * page_size:])
 
+    # Display publications
+    for idx, row in page_df.iterrows():
+        # Card fields are computed once at ingest (src/cards.py)
         title = row['title'].strip()
-        abstract = clean_abstract(row.get('abstract', ''))
+        abstract = row['card_abstract']
         link = row.get('link', '')
-        
-        # Calculate relevance score
-        relevance_score = calculate_relevance_score(abstract, title)
-        
-        # Extract metadata from title and abstract combined
-        organism, exp_type, mission = extract_metadata(title + " " + abstract)
-        
-        # Ensure experiment type is properly formatted
-        exp_type = exp_type.title() if exp_type else "General"
-        organism = organism.title() if organism else "Various"
-        mission = mission if mission else "Various"
+        relevance_score = row['card_relevance']
+        organism, exp_type, mission = row['card_organism'], row['card_experiment_type'], row['card_mission']
         
         # Create publication card using native Streamlit components
         with st.container():
@@ -435,46 +327,30 @@ with tab2:
             with col2:
                 if st.button("Analyze Research", key=f"analyze_research_{idx}"):
                     with st.spinner("Performing comprehensive research analysis..."):
-                        # Prepare sections for analysis
-                        sections_to_analyze = []
-                        if "Abstract" in include_sections:
-                            sections_to_analyze.append(("Abstract", abstract))
-                        if "Results" in include_sections and 'results' in row:
-                            sections_to_analyze.append(("Results", row['results']))
-                        if "Discussion" in include_sections and 'conclusion' in row:
-                            sections_to_analyze.append(("Discussion", row['conclusion']))
-                        
-                        # Combine text with section markers
-                        combined_text = "\n\n".join([f"{section}: {text}" for section, text in sections_to_analyze])
-                        
-                        # Generate summary
-                        analysis_prompt = "\n".join([
-                            "Analyze this space biology research with focus on:",
-                            "1. Key Findings: Main discoveries and their significance",
-                            "2. Mission Relevance: Implications for Moon/Mars missions",
-                            "3. Technical Impact: Methodology and innovation",
-                            "4. Future Directions: Research gaps and next steps",
-                            "5. Practical Applications: How findings can be applied",
-                            "",
-                            f"Title: {title}",
-                            f"Content: {combined_text}"
-                        ])
-                        
-                        # Convert selected model to summarizer method
-                        method = "ollama" if ai_choice == "ollama" else "openai"
-                        
-                        # Handle async summarization
-                        import asyncio
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            summary = loop.run_until_complete(summarize(title, analysis_prompt, method))
-                        finally:
-                            loop.close()
-                        
+                        from src.summarizer import (iterate_stream, select_backend,
+                                                    summarize_stream, summary_key)
+
+                        method = select_backend(ai_choice)
+
+                        # Same request the batch job precomputes; prepare_prompt packs the
+                        # sections to the model's budget and sends the task in full
+                        request = analysis_request(row, include_sections)
+
                         # Display analysis results using native Streamlit components
                         st.subheader("Research Analysis")
-                        
+
+                        # Use the batch job's precomputed summary when it was made from this exact prompt
+                        summary = load_precomputed_summaries().get(summary_key(method=method, **request))
+                        if summary is None:
+                            # Stream tokens as they arrive; the last chunk carries the parsed result
+                            live_output = st.empty()
+                            for chunk in iterate_stream(summarize_stream(method=method, **request)):
+                                if chunk.result is not None:
+                                    summary = chunk.result
+                                else:
+                                    live_output.markdown(chunk.text + " ▌")
+                            live_output.empty()
+
                         # Check if summary has error
                         if hasattr(summary, 'error') and summary.error:
                             st.error(f"Error generating summary: {summary.error}")
@@ -519,32 +395,14 @@ with tab3:
     
     # Research Timeline
     st.markdown("#### Research Timeline")
-    if 'year' in df.columns:
-        yearly_pubs = df['year'].value_counts().sort_index()
-        fig = px.line(
-            x=yearly_pubs.index,
-            y=yearly_pubs.values,
-            labels={'x': 'Year', 'y': 'Publications'},
-            title='Publication Trends Over Time'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    if aggregates.yearly_counts:
+        st.plotly_chart(timeline_chart(aggregates.yearly_frame()), use_container_width=True)
     
     # Research Focus Distribution
     st.markdown("#### Research Focus Areas")
     col1, col2 = st.columns([2,1])
     with col1:
-        focus_dist = pd.DataFrame({
-            'Focus Area': list(focus_areas.keys()),
-            'Publications': [len(df[df['abstract'].str.contains('|'.join(keywords), case=False, na=False)])
-                           for keywords in focus_areas.values()]
-        })
-        fig = px.pie(
-            focus_dist,
-            values='Publications',
-            names='Focus Area',
-            title='Distribution of Research Focus Areas'
-        )
-        st.plotly_chart(fig)
+        st.plotly_chart(focus_share_chart(aggregates.focus_frame()))
     
     with col2:
         st.markdown(
@@ -567,14 +425,7 @@ with tab3:
             'Priority': ['High', 'High', 'Medium', 'High']
         })
         
-        fig = px.bar(
-            gaps_data,
-            x='Research Area',
-            y='Coverage',
-            color='Priority',
-            title='Research Coverage by Area'
-        )
-        st.plotly_chart(fig)
+        st.plotly_chart(coverage_chart(gaps_data))
     
     with col2:
         st.markdown("""
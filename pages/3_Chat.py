@@ -1,8 +1,6 @@
 import streamlit as st
-from src.summarizer import summarize
-import pandas as pd
+from src.corpus import get_corpus
 from datetime import datetime
-import asyncio # Import asyncio at the top
 
 # Page Configuration
 st.set_page_config(
@@ -65,56 +63,66 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load publications data
-@st.cache_data
-def load_publications():
-    df = pd.read_csv('data/publications_with_abstracts.csv')
-    df = df.rename(columns={
-        "Title": "title",
-        "Abstract": "abstract",
-        "Link": "link",
-        "Results/Conclusion": "results_conclusion"
-    })
-    # Ensure all columns exist, adding defaults if necessary
-    for col in ["authors", "year"]:
-        if col not in df.columns:
-            df[col] = "N/A"
-    return df.to_dict(orient='records')
+# Processed corpus shared with the Research Explorer, one copy per process
+corpus = get_corpus()
 
-publications = load_publications()
+@st.cache_resource
+def load_retriever():
+    # Built once per process over every abstract and any crawled sections;
+    # imported here so the page renders before scikit-learn loads
+    from src.crawler import load_sections
+    from src.retrieval import ChunkIndex
+    return ChunkIndex.build(corpus.records(), load_sections())
 
 def format_citation(pub):
     """Format publication details as a citation"""
-    authors = pub.get("authors", "Unknown Authors")
+    authors = pub.get("authors")
+    if isinstance(authors, list):
+        authors = ", ".join(authors)
+    authors = authors or "Unknown Authors"
     year = pub.get("year", "N/A")
     title = pub["title"]
     return f"{authors} ({year}). {title}."
 
-# --- Helper function for AI call (using synchronous wrapper) ---
-def get_ai_response(title, prompt, method):
-    """Synchronously calls the async summarize function."""
+# --- Helper function for AI call (streams tokens into the page) ---
+def get_ai_response(title, task, method, abstract="", results=None, placeholder=None):
+    """
+    Stream the async summarizer into `placeholder` and return the final reply.
+
+    Only `abstract` and `results` are packed to the model's budget; `task`
+    (instructions and the question) is sent in full.
+    """
+    from src.summarizer import iterate_stream, summarize_stream
     try:
-        # Use asyncio.run() to execute the async function and block until it's done.
-        # This is the cleanest way to call a simple async function from a sync Streamlit context.
-        response = asyncio.run(summarize(
+        response = None
+        for chunk in iterate_stream(summarize_stream(
             title=title,
-            abstract=prompt,
-            method=method
-        ))
+            abstract=abstract,
+            method=method,
+            results=results,
+            task=task
+        )):
+            if chunk.result is not None:
+                response = chunk.result
+            elif placeholder is not None:
+                placeholder.markdown(chunk.text + " ▌")
 
-        # Extract AI reply
+        # Extract AI reply; the task asks for a free-form answer, so show
+        # the completion itself rather than the parsed summary sections
         if hasattr(response, "error") and response.error:
             return f"⚠️ Error: {response.error}"
+        elif getattr(response, "text", "").strip():
+            return response.text.strip()
         elif hasattr(response, "key_findings") and response.key_findings:
             # Join findings into a single string for display
-            return "\n".join(response.key_findings) 
+            return "\n".join(response.key_findings)
         elif hasattr(response, "results") and response.results:
             return response.results
         elif hasattr(response, "introduction") and response.introduction:
             return response.introduction
         else:
-            return "The AI did not return a structured response. Try rephrasing your question."
-            
+            return "The AI did not return a response. Try rephrasing your question."
+
     except Exception as e:
         return f"An unexpected error occurred during AI processing: {str(e)}"
 
@@ -138,15 +146,21 @@ def main():
         st.markdown("### AI Configuration")
         ai_model = st.selectbox(
             "Select AI Model",
-            ["ollama", "openai"],
-            help="Choose the AI model for research analysis"
+            ["ollama", "openai", "auto"],
+            help="Choose the AI model for research analysis; auto picks the fastest healthy backend"
+        )
+
+        st.markdown("### Knowledge Source")
+        answer_source = st.radio(
+            "Answer from",
+            ["Entire corpus", "Selected publication"],
+            help="Search all publications for relevant passages, or use only the selected abstract"
         )
         
         st.markdown("### Publication Selection")
-        titles = [pub["title"] for pub in publications]
-        
         # Use a key to ensure consistent state management for the selection
-        selected_title = st.selectbox("Select a publication", titles, key='selected_pub_title')
+        selected_id = st.selectbox("Select a publication", corpus.ids,
+                                   format_func=corpus.title, key='selected_pub_id')
         
         st.markdown("### Analysis Options")
         include_results = st.checkbox(
@@ -156,7 +170,9 @@ def main():
         )
 
     # Find selected publication
-    publication = next(pub for pub in publications if pub["title"] == selected_title)
+    publication = corpus.get(selected_id)
+    selected_title = publication['title']
+    use_corpus = answer_source == "Entire corpus"
 
     # Display publication context
     st.markdown("### 📚 Current Study Context")
@@ -173,7 +189,7 @@ def main():
     st.markdown("---")
 
     # Initialize chat history in session state, specific to the publication
-    chat_key = f"chat_history_{selected_title}"
+    chat_key = "chat_history_corpus" if use_corpus else f"chat_history_{selected_id}"
     if chat_key not in st.session_state:
         st.session_state[chat_key] = []
     
@@ -202,6 +218,12 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
+        # Sources used for corpus-wide answers
+        if chat.get('citations'):
+            with st.expander("Sources"):
+                for citation in chat['citations']:
+                    st.markdown(f"[{citation.number}] [{citation.title}]({citation.link}) · {citation.section}")
+
     # Function to clear the input text after submission
     def clear_input():
         st.session_state['user_input'] = ""
@@ -219,32 +241,42 @@ def main():
             submitted = st.form_submit_button("Send 🚀")
 
     if submitted and user_input_value:
-        # Prepare prompt with abstract and additional context
-        prompt = f"""Based on this research abstract, please answer the following question.
-        
-Abstract: {publication['abstract']}
+        # The question goes in the task so packing the source text never drops it
+        citations = []
+        abstract, results = "", None
+        if use_corpus:
+            # Retrieve the most relevant passages across all publications;
+            # the retriever fits them to its own token budget
+            task, citations = load_retriever().build_prompt(user_input_value)
+        else:
+            abstract = publication['abstract']
+            if include_results and isinstance(publication.get("results_conclusion"), str) \
+                    and publication["results_conclusion"]:
+                results = publication["results_conclusion"]
+            task = f"""Based on this research content, please answer the following question.
 
 Question: {user_input_value}"""
         
-        if include_results and publication.get("results_conclusion"):
-            prompt += f"\n\nAdditional Context - Results/Conclusion: {publication['results_conclusion']}"
-        
-        with st.spinner("Analyzing research literature..."):
-            # CALL THE NEW SYNCHRONOUS HELPER FUNCTION
-            response_text = get_ai_response(
-                title=selected_title,
-                prompt=prompt,
-                method=ai_model
-            )
-            
-            # Append to chat history
-            st.session_state[chat_key].append({
-                "user": user_input_value,
-                "ai": response_text
-            })
-            
-            # Rerun the app to display the new chat messages
-            st.rerun()
+        # Render tokens as they arrive instead of waiting behind a spinner
+        live_output = st.empty()
+        response_text = get_ai_response(
+            title="NASA Space Biology publications" if use_corpus else selected_title,
+            task=task,
+            method=ai_model,
+            abstract=abstract,
+            results=results,
+            placeholder=live_output
+        )
+
+        # Append to chat history
+        st.session_state[chat_key].append({
+            "user": user_input_value,
+            "ai": response_text,
+            "citations": citations
+        })
+
+        # Rerun the app to display the new chat messages
+        st.rerun()
 
     # Footer
     st.markdown("---")
@@ -0,0 +1,132 @@
+# src/aggregates.py
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.preprocess import CACHE_DIR, PROCESSING_VERSION
+from src.search import KeywordIndex
+
+# Sidebar research focus areas and the keywords that place a publication in one
+FOCUS_AREAS = {
+    "Human Health": ["physiology", "medical", "health"],
+    "Life Support": ["plants", "agriculture", "oxygen"],
+    "Radiation Protection": ["radiation", "shielding", "cosmic"],
+    "Microgravity Effects": ["microgravity", "weightlessness"],
+    "Mars Mission Prep": ["mars", "long-duration", "habitat"]
+}
+
+WORD_CLOUD_TERMS = 200
+
+@dataclass
+class CorpusAggregates:
+    """Corpus-wide tables behind the Overview and Trends charts"""
+    corpus_key: str
+    term_frequencies: Dict[str, int]
+    focus_counts: Dict[str, int]
+    yearly_counts: Dict[int, int]
+
+    def focus_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({'Focus Area': list(self.focus_counts),
+                             'Publications': list(self.focus_counts.values())})
+
+    def yearly_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({'Year': list(self.yearly_counts),
+                             'Publications': list(self.yearly_counts.values())})
+
+def corpus_key(df: pd.DataFrame) -> str:
+    """Hash identifying the corpus contents, processing version and aggregate settings"""
+    digest = hashlib.sha256(PROCESSING_VERSION.encode('utf-8'))
+    # Edits to the focus keywords or word cloud size must not reuse cached counts
+    settings = json.dumps({'focus_areas': FOCUS_AREAS, 'word_cloud_terms': WORD_CLOUD_TERMS},
+                          sort_keys=True)
+    digest.update(settings.encode('utf-8'))
+    if 'row_hash' in df.columns:
+        rows = df['row_hash'].astype(str)
+    else:
+        rows = pd.util.hash_pandas_object(df[['title', 'abstract']], index=False).astype(str)
+    digest.update('\n'.join(rows).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def term_frequencies(index: KeywordIndex, field: str = 'abstract',
+                     top: int = WORD_CLOUD_TERMS) -> Dict[str, int]:
+    """Most common content words of a field, by number of documents using them"""
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+    counts = index.fields[field].document_frequencies() if field in index.fields else {}
+    terms = {term: count for term, count in counts.items()
+             if len(term) > 2 and not term.isdigit() and term not in ENGLISH_STOP_WORDS}
+    return dict(sorted(terms.items(), key=lambda item: -item[1])[:top])
+
+def focus_counts(index: KeywordIndex,
+                 focus_areas: Dict[str, List[str]] = FOCUS_AREAS) -> Dict[str, int]:
+    """Publications per focus area, matched the same way as the explorer filter"""
+    return {area: int(len(index.match_any(keywords, fields=('abstract',))))
+            for area, keywords in focus_areas.items()}
+
+def yearly_counts(df: pd.DataFrame) -> Dict[int, int]:
+    """Publications per year, oldest first; empty without a year column"""
+    if 'year' not in df.columns:
+        return {}
+    counts = df['year'].dropna().astype(int).value_counts().sort_index()
+    return {int(year): int(n) for year, n in counts.items()}
+
+def aggregates_path(key: str, cache_dir: str = CACHE_DIR) -> Path:
+    return Path(cache_dir) / f"aggregates-{key}.json"
+
+def _publish(tmp_path: Path, path: Path, prefix: str) -> None:
+    """Atomically move a finished file into place and drop older corpus versions"""
+    os.replace(tmp_path, path)
+    for stale in path.parent.glob(f"{prefix}-*{path.suffix}"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+def compute_aggregates(df: pd.DataFrame, index: KeywordIndex,
+                       cache_dir: Optional[str] = CACHE_DIR) -> CorpusAggregates:
+    """
+    Aggregates for a corpus, computed once per corpus version.
+
+    Results are stored as JSON in `cache_dir` under the corpus key, so a
+    restart or a new session reads them back instead of recounting.
+    """
+    key = corpus_key(df)
+    path = aggregates_path(key, cache_dir) if cache_dir else None
+    if path is not None and path.exists():
+        data = json.loads(path.read_text(encoding='utf-8'))
+        data['yearly_counts'] = {int(year): n for year, n in data['yearly_counts'].items()}
+        return CorpusAggregates(**data)
+
+    aggregates = CorpusAggregates(
+        corpus_key=key,
+        term_frequencies=term_frequencies(index, top=WORD_CLOUD_TERMS),
+        focus_counts=focus_counts(index, FOCUS_AREAS),
+        yearly_counts=yearly_counts(df)
+    )
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(asdict(aggregates)), encoding='utf-8')
+        _publish(tmp_path, path, 'aggregates')
+    return aggregates
+
+def word_cloud_image(aggregates: CorpusAggregates, cache_dir: str = CACHE_DIR) -> Path:
+    """PNG word cloud of the corpus terms, rendered once per corpus version"""
+    path = Path(cache_dir) / f"wordcloud-{aggregates.corpus_key}.png"
+    if not path.exists():
+        from wordcloud import WordCloud
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.png.tmp")
+        WordCloud(
+            width=800, height=400,
+            background_color='rgba(255, 255, 255, 0)',
+            mode='RGBA'
+        ).generate_from_frequencies(aggregates.term_frequencies or {'LunarLife': 1}).to_image().save(
+            tmp_path, format='PNG'
+        )
+        _publish(tmp_path, path, 'wordcloud')
+    return path
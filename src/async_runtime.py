@@ -0,0 +1,203 @@
+# src/async_runtime.py
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class BackgroundLoop:
+    """
+    Event loop running forever on a daemon thread.
+
+    Synchronous callers (Streamlit scripts) submit coroutines to it instead
+    of creating a loop per request, so async clients and their connection
+    pools live for the whole process and concurrent sessions share them.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="lunarlife-async", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and block until it finishes"""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, stream: AsyncIterator[T]) -> Iterator[T]:
+        """Consume an async generator from synchronous code"""
+        try:
+            while True:
+                try:
+                    yield self.run(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            self.run(stream.aclose())
+
+_background_loop: Optional[BackgroundLoop] = None
+_lock = threading.Lock()
+
+def get_background_loop() -> BackgroundLoop:
+    """Process-wide background loop, started on first use"""
+    global _background_loop
+    with _lock:
+        if _background_loop is None:
+            _background_loop = BackgroundLoop()
+    return _background_loop
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the shared background loop"""
+    return get_background_loop().run(coro, timeout)
+
+def iterate_sync(stream: AsyncIterator[Any]) -> Iterator[Any]:
+    """Iterate an async generator on the shared background loop"""
+    return get_background_loop().iterate(stream)
+
+class LoopLocal:
+    """
+    Per-event-loop state, created on first use from `factory`.
+
+    Futures and semaphores belong to the loop they were made on, so state
+    holding them is kept per loop. Entries for loops that have since been
+    closed are dropped on the next access, so short-lived loops (a job's
+    `asyncio.run`) do not accumulate.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self.factory = factory
+        self._states: Dict[asyncio.AbstractEventLoop, Any] = {}
+
+    def get(self) -> Any:
+        """State for the running loop"""
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            for closed in [other for other in self._states if other.is_closed()]:
+                del self._states[closed]
+            state = self._states[loop] = self.factory()
+        return state
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key onto one in-flight future.
+
+    The first caller for a key becomes the leader and runs the work; callers
+    arriving before it finishes await the same result. If the leader is
+    cancelled, a waiting follower takes over and runs the work itself.
+    """
+
+    def __init__(self):
+        # Futures belong to one loop, so flights are tracked per loop
+        self._calls: LoopLocal = LoopLocal(dict)
+
+    def get(self, key: str) -> Optional[asyncio.Future]:
+        """In-flight future for `key`, if any"""
+        return self._calls.get().get(key)
+
+    def start(self, key: str) -> asyncio.Future:
+        """Register the caller as leader for `key`"""
+        future = asyncio.get_running_loop().create_future()
+        self._calls.get()[key] = future
+        return future
+
+    def finish(self, key: str, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Publish the leader's outcome to every follower and clear the flight"""
+        future = self._calls.get().pop(key, None)
+        if future is None or future.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        elif error is not None:
+            future.set_exception(error)
+            # Mark the exception retrieved in case nobody is waiting on it
+            future.exception()
+        else:
+            future.set_result(result)
+
+    async def follow(self, key: str) -> Tuple[bool, Any]:
+        """
+        Wait for the current leader of `key`.
+
+        Returns (True, result) when a leader finishes, or (False, None) when
+        no call is in flight or its leader was cancelled; the caller should
+        then `start` the key and lead.
+        """
+        while True:
+            existing = self.get(key)
+            if existing is None:
+                return False, None
+            try:
+                return True, await asyncio.shield(existing)
+            except asyncio.CancelledError:
+                if not existing.cancelled():
+                    raise  # this follower was cancelled, not the leader
+                # The leader gave up; another follower may already have taken over
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run `factory()` once for all concurrent callers with the same key"""
+        joined, result = await self.follow(key)
+        if joined:
+            return result
+        self.start(key)
+        try:
+            result = await factory()
+        except BaseException as e:
+            self.finish(key, error=e)
+            raise
+        self.finish(key, result)
+        return result
+
+class AdmissionRejected(Exception):
+    """Raised when a backend's admission queue is full"""
+
+class AdmissionController:
+    """
+    Per-backend concurrency caps with a bounded wait queue.
+
+    At most `limits[backend]` calls run at once; up to `max_waiting` more
+    queue for a slot and anything beyond that is rejected immediately.
+    """
+
+    def __init__(self, limits: Dict[str, int], max_waiting: int = 32):
+        self.limits = limits
+        self.max_waiting = max_waiting
+        # Per loop: backend -> [semaphore, number of callers queued on it]
+        self._backends: LoopLocal = LoopLocal(dict)
+
+    def _semaphore(self, backend: str) -> asyncio.Semaphore:
+        backends = self._backends.get()
+        if backend not in backends:
+            backends[backend] = [asyncio.Semaphore(self.limits.get(backend, 1)), 0]
+        return backends[backend][0]
+
+    @asynccontextmanager
+    async def slot(self, backend: str):
+        semaphore = self._semaphore(backend)
+        if semaphore.locked():
+            queue = self._backends.get()[backend]
+            if queue[1] >= self.max_waiting:
+                raise AdmissionRejected(f"{backend} is busy, {self.max_waiting} requests already queued")
+            queue[1] += 1
+            try:
+                await semaphore.acquire()
+            finally:
+                queue[1] -= 1
+        else:
+            await semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
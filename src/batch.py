@@ -0,0 +1,199 @@
+# src/batch.py
+import argparse
+import asyncio
+import json
+import logging
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.cards import ANALYSIS_SECTIONS, analysis_request
+from src.preprocess import load_and_clean, load_corpus_artifact, save_corpus_artifact
+from src.summarizer import (SummaryResult, set_backend_concurrency, summarize_stream,
+                            summary_from_dict, summary_key, summary_to_dict)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_PATH = "data/summaries_checkpoint.jsonl"
+SUMMARIES_PATH = "data/summaries.arrow"
+
+# (max concurrent requests, max requests per second or None) per backend
+BACKEND_LIMITS = {
+    "openai": (8, 5.0),
+    "ollama": (2, None)
+}
+
+class AsyncRateLimiter:
+    """Spaces request starts so at most `rate` begin per second"""
+
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        await asyncio.sleep(max(0.0, slot - now))
+
+class JobStats:
+    """Throughput, latency and error counters for a batch run"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.start = time.monotonic()
+
+    @property
+    def done(self) -> int:
+        return len(self.latencies) + self.errors
+
+    def report(self) -> Dict[str, float]:
+        elapsed = time.monotonic() - self.start
+        latencies = np.array(self.latencies) if self.latencies else np.zeros(1)
+        return {
+            'completed': len(self.latencies),
+            'errors': self.errors,
+            'error_rate': self.errors / self.done if self.done else 0.0,
+            'docs_per_s': len(self.latencies) / elapsed if elapsed else 0.0,
+            'p50_s': float(np.percentile(latencies, 50)),
+            'p95_s': float(np.percentile(latencies, 95)),
+            'p99_s': float(np.percentile(latencies, 99)),
+            'elapsed_s': elapsed
+        }
+
+def load_checkpoint(path: str = CHECKPOINT_PATH) -> Dict[str, dict]:
+    """Finished summaries from earlier runs, keyed by their request's `summary_key`"""
+    done = {}
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from an interrupted run
+                if record.get('prompt_key'):  # records from older runs are redone
+                    done[record['prompt_key']] = record
+    return done
+
+SUMMARY_FIELDS = [field.name for field in fields(SummaryResult)]
+
+def write_summaries_table(records: List[dict], path: str = SUMMARIES_PATH) -> pd.DataFrame:
+    """Flatten checkpoint records into the summaries table read by the UI"""
+    rows = [{'title': r['title'], 'method': r['method'], 'prompt_key': r.get('prompt_key'),
+             **r['summary']} for r in records]
+    # Explicit columns so a run without any finished summary still writes a valid table
+    table = pd.DataFrame(rows, columns=['title', 'method', 'prompt_key', *SUMMARY_FIELDS])
+    save_corpus_artifact(table, Path(path))
+    return table
+
+def load_summaries_table(path: str = SUMMARIES_PATH) -> Dict[str, SummaryResult]:
+    """
+    Precomputed summaries keyed by their request's `summary_key`; empty if not built.
+
+    The key covers the prompt, so a summary is only served for the exact
+    sections and instructions it was generated from. Rows from older runs
+    without a key are skipped.
+    """
+    if not Path(path).exists():
+        return {}
+    table = load_corpus_artifact(Path(path))
+    if table.empty or not {'prompt_key', 'generated_at'} <= set(table.columns):
+        return {}
+    table = table[table['prompt_key'].notna()]
+    # Tables written by older runs may lack newer summary fields
+    table = table.reindex(columns=['prompt_key', *SUMMARY_FIELDS])
+    text_fields = ['introduction', 'methods', 'results', 'conclusion', 'model_used', 'text']
+    table[text_fields] = table[text_fields].fillna('')
+    table['relevance_score'] = table['relevance_score'].fillna(0.0).astype(float)
+    table['key_findings'] = table['key_findings'].map(
+        lambda findings: list(findings) if isinstance(findings, (list, tuple, np.ndarray)) else [])
+    table['error'] = table['error'].astype(object).where(table['error'].notna(), None)
+    return {row.pop('prompt_key'): summary_from_dict(row) for row in table.to_dict(orient='records')}
+
+async def run_job(df: pd.DataFrame, method: str, concurrency: int,
+                  rate: Optional[float], checkpoint_path: str = CHECKPOINT_PATH) -> JobStats:
+    """
+    Summarize every publication not already in the checkpoint.
+
+    Each publication gets the analysis the Research Explorer streams for its
+    default sections (`analysis_request`), so the page finds the stored
+    summary under its own `summary_key`.
+
+    The job owns the backend in this process: its admission limit is set to
+    `concurrency`, so every worker gets a slot without queueing and the
+    recorded latencies are model time only.
+    """
+    done = load_checkpoint(checkpoint_path)
+    # Columns a request can read; missing sections are left out of the prompt
+    columns = ['title', *ANALYSIS_SECTIONS.values()]
+    requests = [analysis_request(row) for row in df.reindex(columns=columns).to_dict(orient='records')]
+    pending = [(summary_key(method=method, **request), request) for request in requests]
+    pending = [(key, request) for key, request in pending if key not in done]
+    logger.info(f"{len(done)} summaries checkpointed, {len(pending)} to generate with {method}")
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in pending:
+        queue.put_nowait(item)
+    limiter = AsyncRateLimiter(rate)
+    stats = JobStats(len(pending))
+    set_backend_concurrency(method, concurrency)
+
+    with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+        async def worker():
+            while True:
+                try:
+                    key, request = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await limiter.wait()
+                started = time.monotonic()
+                summary = None
+                async for chunk in summarize_stream(method=method, **request):
+                    summary = chunk.result  # set on the last chunk
+                if summary.error:
+                    stats.errors += 1
+                    logger.warning(f"Failed to summarize '{request['title'][:60]}': {summary.error}")
+                    continue
+                stats.latencies.append(time.monotonic() - started)
+                record = {'title': request['title'], 'method': method, 'prompt_key': key,
+                          'summary': summary_to_dict(summary)}
+                checkpoint.write(json.dumps(record) + '\n')
+                checkpoint.flush()
+                if stats.done % 25 == 0:
+                    logger.info(f"{stats.done}/{stats.total}: {stats.report()}")
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-summarize every publication")
+    parser.add_argument("--csv", default="data/publications_with_abstracts.csv")
+    parser.add_argument("--method", choices=list(BACKEND_LIMITS), default="ollama")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Concurrent requests (defaults to the backend's limit)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Max requests per second (defaults to the backend's limit)")
+    parser.add_argument("--limit", type=int, default=None, help="Only summarize the first N rows")
+    args = parser.parse_args()
+
+    default_concurrency, default_rate = BACKEND_LIMITS[args.method]
+    corpus = load_and_clean(args.csv)
+    if args.limit:
+        corpus = corpus.head(args.limit)
+
+    stats = asyncio.run(run_job(corpus, args.method,
+                                args.concurrency or default_concurrency,
+                                args.rate or default_rate))
+    write_summaries_table(list(load_checkpoint().values()))
+    print(json.dumps(stats.report(), indent=2))
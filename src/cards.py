@@ -0,0 +1,132 @@
+# src/cards.py
+import re
+from typing import Any, Dict, Iterable, Mapping
+
+import pandas as pd
+
+from src.taxonomy import card_labels
+
+# Metadata fragments left in scraped abstracts, removed before display
+CARD_NOISE_PATTERN = re.compile('|'.join([
+    r'PMC\d+',                      # PMC IDs
+    r'\d{4}-\d{4}',                 # ISSN numbers
+    r'PONE-D-\d+-\d+',              # PLOS submission IDs
+    r'10\.\d{4}/[^\s]+',            # DOIs
+    r'PLoS\s+ONE?',                 # Journal names
+    r'\d+\s*\.\s*\d+',              # Decimal numbers
+    r'Research Article',            # Article type labels
+    r'journal\.\s*[^\s]+',          # Journal references
+    r'Biology and Life Sciences',   # Subject categories
+    r'Physical Sciences',
+    r'Astronomical Sciences',
+    r'Space Exploration',
+    r'Research and Analysis Methods',
+    r'Medicine and Health Sciences',
+    r'Animal Studies',
+    r'Model Organisms',
+    r'Animal Models',
+    r'Mouse Models',
+    r'Bioethics',
+    r'Veterinary Science',
+    r'Animal Management',
+    r'Animal Welfare',
+    r'Zoology',
+    r'Animal Behavior',
+    r'Agriculture',
+]))
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+ABSTRACT_UNAVAILABLE = "Abstract not available."
+ABSTRACT_PENDING = ("Abstract content is being processed. "
+                    "Please check the source publication for complete details.")
+
+RELEVANCE_FACTORS = {
+    'microgravity': 5,
+    'space': 4,
+    'astronaut': 4,
+    'mission': 3,
+    'bion': 4,
+    'iss': 4,
+    'shuttle': 3,
+    'lunar': 4,
+    'mars': 5,
+    'radiation': 4,
+    'bone': 3,
+    'muscle': 3,
+    'immune': 3,
+    'health': 3,
+    'medicine': 2,
+    'biology': 2,
+    'experiment': 2,
+    'research': 1
+}
+
+CARD_COLUMNS = ['card_abstract', 'card_relevance', 'card_organism',
+                'card_experiment_type', 'card_mission']
+
+def clean_card_abstract(text: str) -> str:
+    """Abstract with metadata fragments removed, as shown on a card"""
+    if pd.isna(text) or not text:
+        return ABSTRACT_UNAVAILABLE
+    text = WHITESPACE_PATTERN.sub(' ', CARD_NOISE_PATTERN.sub('', text)).strip()
+
+    # If the cleaned text is too short or seems like metadata
+    if len(text) < 100 or not any(char.islower() for char in text):
+        return ABSTRACT_PENDING
+    return text
+
+def card_relevance(abstract: str, title: str) -> float:
+    """Research relevance score based on key space biology terms"""
+    combined_text = f"{title} {abstract}".lower()
+    score = sum(weight for term, weight in RELEVANCE_FACTORS.items() if term in combined_text)
+
+    # Normalize to 0-1 range, using 40% of max possible as denominator
+    # to make scores more meaningful (since no paper will have all terms)
+    max_possible_score = sum(RELEVANCE_FACTORS.values())
+    return min(score / (max_possible_score * 0.4), 1.0)
+
+def build_cards(df: pd.DataFrame) -> pd.DataFrame:
+    """Card columns for every publication, aligned with `df`'s index"""
+    rows = []
+    for title, abstract in zip(df['title'].str.strip(), df['abstract']):
+        abstract = clean_card_abstract(abstract)
+        organism, exp_type, mission = card_labels(f"{title} {abstract}")
+        rows.append((abstract, card_relevance(abstract, title), organism, exp_type, mission))
+    return pd.DataFrame(rows, columns=CARD_COLUMNS, index=df.index)
+
+# Instructions sent when a card's publication is analyzed; kept outside the content budget
+ANALYSIS_TASK = "\n".join([
+    "Analyze this space biology research with focus on:",
+    "1. Key Findings: Main discoveries and their significance",
+    "2. Mission Relevance: Implications for Moon/Mars missions",
+    "3. Technical Impact: Methodology and innovation",
+    "4. Future Directions: Research gaps and next steps",
+    "5. Practical Applications: How findings can be applied"
+])
+
+# "Include Sections" options that map to corpus columns, and the default selection
+ANALYSIS_SECTIONS = {'Abstract': 'card_abstract', 'Results': 'results', 'Discussion': 'conclusion'}
+DEFAULT_ANALYSIS_SECTIONS = ['Abstract', 'Results']
+
+def analysis_request(row: Mapping[str, Any],
+                     sections: Iterable[str] = DEFAULT_ANALYSIS_SECTIONS) -> Dict[str, Any]:
+    """
+    Summarizer arguments for analyzing a corpus row's publication.
+
+    The Research Explorer and the batch job both build their requests here,
+    so a precomputed summary is stored under the `summary_key` the page
+    looks up.
+    """
+    sections = set(sections)
+
+    def section_text(name: str):
+        text = row.get(ANALYSIS_SECTIONS[name]) if name in sections else None
+        return text if isinstance(text, str) else None
+
+    return {
+        'title': row['title'].strip(),
+        'abstract': section_text('Abstract') or '',
+        'results': section_text('Results'),
+        'conclusion': section_text('Discussion'),
+        'task': ANALYSIS_TASK
+    }
@@ -0,0 +1,157 @@
+# src/context.py
+import argparse
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+try:
+    import tiktoken
+except ImportError:  # optional; fall back to a character estimate
+    tiktoken = None
+
+# Tokens of publication content allowed in a single prompt, per model.
+# Leaves room for the instructions and the 1000-token completion.
+CONTENT_BUDGETS = {
+    "gpt-4": 3000,
+    "gpt-4o-mini": 3000,
+    "gpt-oss:20b-cloud": 6000
+}
+DEFAULT_CONTENT_BUDGET = 3000
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9(])')
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Token count with the model's tokenizer when tiktoken is installed"""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is None:
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+def content_budget(model: str) -> int:
+    """Content token budget for a model"""
+    return CONTENT_BUDGETS.get(model, DEFAULT_CONTENT_BUDGET)
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences on terminal punctuation"""
+    return [s for s in SENTENCE_BOUNDARY.split(text.strip()) if s]
+
+def pack_text(text: str, budget: int, model: str = "gpt-4",
+              vectorizer: Optional['TfidfVectorizer'] = None) -> str:
+    """
+    Shrink text to `budget` tokens keeping its most salient sentences.
+
+    Sentences are scored by the sum of their TF-IDF weights (from
+    `vectorizer` if given, e.g. the search index's, otherwise fitted on the
+    text itself), picked best-first while they fit, and emitted in their
+    original order.
+    """
+    if count_tokens(text, model) <= budget:
+        return text
+    sentences = split_sentences(text)
+    if len(sentences) < 2:
+        return _truncate(text, budget, model)
+
+    try:
+        if vectorizer is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+
+            weights = TfidfVectorizer(stop_words='english').fit_transform(sentences)
+        else:
+            weights = vectorizer.transform(sentences)
+        salience = np.asarray(weights.sum(axis=1)).ravel()
+    except ValueError:  # only stop words
+        salience = np.zeros(len(sentences))
+
+    costs = [count_tokens(s, model) for s in sentences]
+    keep = []
+    used = 0
+    for i in np.argsort(-salience, kind='stable'):
+        if used + costs[i] <= budget:
+            keep.append(i)
+            used += costs[i]
+    # Tokens can merge across the joins, so check the joined text and drop
+    # the least salient sentences until it fits
+    packed = ' '.join(sentences[i] for i in sorted(keep))
+    while len(keep) > 1 and count_tokens(packed, model) > budget:
+        keep.pop()
+        packed = ' '.join(sentences[i] for i in sorted(keep))
+    if not keep or count_tokens(packed, model) > budget:
+        return _truncate(sentences[int(np.argmax(salience))], budget, model)
+    return packed
+
+def _truncate(text: str, budget: int, model: str) -> str:
+    """Hard cut for text without usable sentence boundaries"""
+    encoding = _encoding(model)
+    if encoding is None:
+        return text[:budget * 4]
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:budget])
+
+def pack_sections(sections: Dict[str, str], budget: int, model: str = "gpt-4",
+                  vectorizer: Optional['TfidfVectorizer'] = None) -> Dict[str, str]:
+    """
+    Fit several sections into one budget.
+
+    Sections already within their fair share keep their full text; the
+    remaining budget is split across the longer ones in proportion to
+    their size.
+    """
+    costs = {name: count_tokens(text or '', model) for name, text in sections.items()}
+    if sum(costs.values()) <= budget:
+        return dict(sections)
+
+    packed = {}
+    remaining = budget
+    pending = sorted(costs, key=costs.get)
+    while pending:
+        share = remaining // len(pending)
+        name = pending[0]
+        if costs[name] > share:
+            break
+        packed[name] = sections[name]
+        remaining -= costs[name]
+        pending.pop(0)
+
+    total = sum(costs[name] for name in pending)
+    for name in pending:
+        packed[name] = pack_text(sections[name], remaining * costs[name] // total, model, vectorizer)
+    return {name: packed[name] for name in sections}
+
+def token_savings(records: List[Dict[str, str]], model: str = "gpt-4",
+                  budget: Optional[int] = None) -> Dict[str, int]:
+    """Prompt content tokens before and after packing, summed over a corpus"""
+    budget = budget or content_budget(model)
+    before = after = 0
+    for record in records:
+        sections = {k: record.get(k) or '' for k in ('abstract', 'results', 'conclusion')}
+        before += sum(count_tokens(text, model) for text in sections.values())
+        packed = pack_sections(sections, budget, model)
+        after += sum(count_tokens(text, model) for text in packed.values())
+    return {'tokens_before': before, 'tokens_after': after, 'tokens_saved': before - after}
+
+if __name__ == "__main__":
+    from src.preprocess import load_and_clean
+
+    parser = argparse.ArgumentParser(description="Report prompt tokens saved by context packing")
+    parser.add_argument("--csv", default="data/publications_with_abstracts.csv")
+    parser.add_argument("--model", default="gpt-4")
+    parser.add_argument("--budget", type=int, default=None)
+    args = parser.parse_args()
+
+    corpus = load_and_clean(args.csv).to_dict(orient='records')
+    print(token_savings(corpus, args.model, args.budget))
@@ -0,0 +1,122 @@
+# src/corpus.py
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.aggregates import CorpusAggregates, compute_aggregates
+from src.preprocess import CACHE_DIR, load_and_clean, save_search_index, search_index_path
+from src.search import KeywordIndex, SearchIndex
+
+CORPUS_CSV = "data/publications_with_abstracts.csv"
+
+# Columns handed to the chat retriever; the rest of the frame is not copied
+RETRIEVAL_COLUMNS = ['pub_id', 'title', 'link', 'abstract', 'results', 'conclusion']
+
+class Corpus:
+    """
+    Processed publications shared by every page of the app.
+
+    Built once per process from the corpus artifact. Pages hold a reference
+    to it instead of their own copy and address publications by `pub_id`
+    (the PMC id from the link). The frame is shared across sessions, so
+    callers select from it but never modify it.
+
+    `search_path` is where the ingest step stored the corpus's SearchIndex;
+    without it the index is fitted in memory on first use.
+    """
+
+    def __init__(self, frame: pd.DataFrame, search_path: Optional[Path] = None):
+        frame = frame.reset_index(drop=True)
+        # Research impact score (example metric)
+        impact = frame['abstract'].str.len() + frame['title'].str.len()
+        span = impact.max() - impact.min()
+        frame['impact_score'] = (impact - impact.min()) / span if span else 0.0
+        # Rows sharing a link get distinct ids
+        repeated = frame['pub_id'].duplicated()
+        frame.loc[repeated, 'pub_id'] += '-' + frame.loc[repeated, 'row_hash'].str[:8]
+        self.frame = frame
+        self.search_path = search_path
+
+        self._positions = pd.Series(np.arange(len(frame)), index=frame['pub_id'])
+        self._title_ids = dict(zip(frame['title'], frame['pub_id']))
+        self._lock = threading.Lock()
+        self._keyword_index: Optional[KeywordIndex] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._aggregates: Optional[CorpusAggregates] = None
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def ids(self) -> List[str]:
+        return self.frame['pub_id'].tolist()
+
+    def titles(self) -> List[str]:
+        return self.frame['title'].tolist()
+
+    def position(self, pub_id: str) -> int:
+        """Row position of a publication; raises KeyError for an unknown id"""
+        return int(self._positions[pub_id])
+
+    def get(self, pub_id: str) -> Dict[str, Any]:
+        """One publication as a dict"""
+        return self.frame.iloc[self.position(pub_id)].to_dict()
+
+    def title(self, pub_id: str) -> str:
+        return self.frame['title'].iat[self.position(pub_id)]
+
+    def id_for_title(self, title: str) -> Optional[str]:
+        return self._title_ids.get(title)
+
+    def rows(self, positions) -> pd.DataFrame:
+        """Publications at the given row positions, e.g. keyword index matches"""
+        return self.frame.iloc[positions]
+
+    def keyword_index(self) -> KeywordIndex:
+        """Inverted index over the corpus, built on first use"""
+        with self._lock:
+            if self._keyword_index is None:
+                self._keyword_index = KeywordIndex.build(self.frame)
+            return self._keyword_index
+
+    def search_index(self) -> SearchIndex:
+        """TF-IDF relevance index, loaded from the ingest artifact when present"""
+        with self._lock:
+            if self._search_index is None:
+                if self.search_path is not None and self.search_path.exists():
+                    self._search_index = SearchIndex.load(str(self.search_path))
+                else:
+                    self._search_index = SearchIndex.build(self.frame)
+                    if self.search_path is not None:
+                        save_search_index(self._search_index, self.search_path)
+            return self._search_index
+
+    def aggregates(self) -> CorpusAggregates:
+        """Term, focus and yearly counts, read from the cache when unchanged"""
+        index = self.keyword_index()
+        with self._lock:
+            if self._aggregates is None:
+                self._aggregates = compute_aggregates(self.frame, index)
+            return self._aggregates
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Publications as dicts with the columns the chat retriever reads"""
+        with self._lock:
+            if self._records is None:
+                columns = [c for c in RETRIEVAL_COLUMNS if c in self.frame.columns]
+                self._records = self.frame[columns].to_dict(orient='records')
+            return self._records
+
+_corpora: Dict[str, Corpus] = {}
+_corpora_lock = threading.Lock()
+
+def get_corpus(csv_path: str = CORPUS_CSV) -> Corpus:
+    """Process-wide corpus for a CSV, loaded on first use"""
+    with _corpora_lock:
+        if csv_path not in _corpora:
+            _corpora[csv_path] = Corpus(load_and_clean(csv_path), search_index_path(csv_path, CACHE_DIR))
+        return _corpora[csv_path]
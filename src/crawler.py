@@ -0,0 +1,179 @@
+# src/crawler.py
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from src.preprocess import parse_publication_html
+
+logger = logging.getLogger(__name__)
+
+SECTIONS_PATH = "data/publication_sections.jsonl"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+def load_sections(path: str = SECTIONS_PATH) -> Dict[str, dict]:
+    """Latest crawled record per URL from the append-only sections file"""
+    records = {}
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from an interrupted run
+                records[record['url']] = record
+    return records
+
+class HostPool:
+    """One keep-alive session and one concurrency semaphore per host"""
+
+    def __init__(self, concurrency: int, timeout: float = 30.0):
+        self.concurrency = concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def get(self, url: str):
+        host = urlsplit(url).netloc
+        if host not in self.sessions:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.concurrency,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            self.sessions[host] = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self.semaphores[host] = asyncio.Semaphore(self.concurrency)
+        return self.sessions[host], self.semaphores[host]
+
+    async def close(self):
+        await asyncio.gather(*(session.close() for session in self.sessions.values()))
+
+async def _fetch_one(pool: HostPool, url: str, validators: Optional[dict],
+                     max_retries: int, backoff: float) -> Optional[dict]:
+    """
+    Fetch and parse one URL.
+
+    Returns the record to persist, {'status': 304} when the page is unchanged,
+    or raises after `max_retries` failed attempts.
+    """
+    session, semaphore = pool.get(url)
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    for attempt in range(max_retries + 1):
+        retry_after = None
+        try:
+            async with semaphore:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return {'status': 304}
+                    if response.status in RETRY_STATUSES:
+                        retry_after = response.headers.get('Retry-After')
+                        raise aiohttp.ClientResponseError(
+                            response.request_info, response.history,
+                            status=response.status, message=response.reason or ''
+                        )
+                    response.raise_for_status()
+                    html = await response.text()
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = getattr(e, 'status', None)
+            if attempt == max_retries or (status is not None and status not in RETRY_STATUSES):
+                raise
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else \
+                backoff * (2 ** attempt) * (1 + random.random())
+            logger.warning(f"Fetching {url} failed ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        # Parsing is CPU-bound; keep it off the event loop
+        abstract, results, conclusion = await asyncio.to_thread(parse_publication_html, html)
+        return {
+            'url': url,
+            'abstract': abstract,
+            'results': results,
+            'conclusion': conclusion,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': datetime.now().isoformat(),
+            'status': 200
+        }
+
+async def fetch_many(urls: Iterable[str], concurrency: int = 8,
+                     output_path: str = SECTIONS_PATH,
+                     max_retries: int = 3, backoff: float = 1.0) -> Dict[str, int]:
+    """
+    Crawl publication pages concurrently and stream parsed sections to disk.
+
+    Each result is appended to `output_path` as a JSON line as soon as it
+    arrives. ETag/Last-Modified values from earlier runs are sent back as
+    conditional headers, so unchanged pages cost a 304 and no parsing.
+
+    Args:
+        urls: Publication URLs to fetch
+        concurrency: Maximum requests in flight per host
+        output_path: Append-only JSONL file for crawled sections
+        max_retries: Retries per URL for timeouts, 429 and 5xx responses
+        backoff: Base delay in seconds for exponential backoff
+
+    Returns:
+        Counts of fetched, not_modified and failed URLs
+    """
+    previous = load_sections(output_path)
+    urls = list(dict.fromkeys(urls))
+    stats = {'fetched': 0, 'not_modified': 0, 'failed': 0}
+    pool = HostPool(concurrency)
+    start = time.monotonic()
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'a', encoding='utf-8') as out:
+        async def worker(url):
+            try:
+                record = await _fetch_one(pool, url, previous.get(url), max_retries, backoff)
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+                stats['failed'] += 1
+                return
+            if record['status'] == 304:
+                stats['not_modified'] += 1
+                return
+            del record['status']
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+            stats['fetched'] += 1
+
+        try:
+            await asyncio.gather(*(worker(url) for url in urls))
+        finally:
+            await pool.close()
+
+    elapsed = time.monotonic() - start
+    logger.info(f"Crawled {len(urls)} URLs in {elapsed:.1f}s "
+                f"({len(urls) / max(elapsed, 1e-9):.1f} pages/s): {stats}")
+    return stats
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Crawl full-text sections for publications")
+    parser.add_argument("--csv", default="data/publications.csv")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--output", default=SECTIONS_PATH)
+    args = parser.parse_args()
+
+    links = pd.read_csv(args.csv)['Link'].dropna().tolist()
+    print(asyncio.run(fetch_many(links, args.concurrency, args.output)))
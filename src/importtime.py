@@ -0,0 +1,84 @@
+# src/importtime.py
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# What the pages import before drawing anything, then what they now defer
+STARTUP_MODULES = [
+    'streamlit',
+    'pandas',
+    'src.preprocess',
+    'src.search',
+    'src.summary_cache',
+    'src.aggregates'
+]
+DEFERRED_MODULES = [
+    'plotly.express',
+    'sklearn.feature_extraction.text',
+    'src.context',
+    'src.retrieval',
+    'src.summarizer',
+    'src.batch',
+    'nltk'
+]
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+def profile_import(module: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Import `module` in a fresh interpreter under `-X importtime`.
+
+    Returns:
+        Cumulative seconds for the module and (module, self seconds) for
+        everything it pulled in, slowest first
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    cumulative: Dict[str, float] = {}
+    self_times: List[Tuple[str, float]] = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            cumulative[name] = int(cumulative_us) / 1e6
+            self_times.append((name, int(self_us) / 1e6))
+    self_times.sort(key=lambda item: -item[1])
+    return cumulative.get(module, 0.0), self_times
+
+def report(modules: List[str], top: int = 5) -> str:
+    """Markdown table of cold import times with each module's heaviest dependencies"""
+    lines = ["| module | cold import (s) | heaviest dependencies (self s) |",
+             "|---|---|---|"]
+    for module in modules:
+        try:
+            total, self_times = profile_import(module)
+        except RuntimeError as e:
+            lines.append(f"| {module} | failed | {str(e).splitlines()[-1]} |")
+            continue
+        heaviest = ', '.join(f"{name} {seconds:.3f}" for name, seconds in self_times[:top])
+        lines.append(f"| {module} | {total:.3f} | {heaviest} |")
+    return '\n'.join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile cold import times of the app's modules")
+    parser.add_argument("modules", nargs="*", help="Modules to profile (defaults to the app's)")
+    parser.add_argument("--top", type=int, default=5, help="Dependencies listed per module")
+    parser.add_argument("--output", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    if args.modules:
+        text = report(args.modules, args.top)
+    else:
+        text = '\n\n'.join([
+            "## Imported before first render", report(STARTUP_MODULES, args.top),
+            "## Deferred to first use", report(DEFERRED_MODULES, args.top)
+        ])
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
@@ -0,0 +1,172 @@
+# src/ollama_benchmark.py
+import argparse
+import asyncio
+import json
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import src.summarizer as summarizer
+from src.summarizer import OLLAMA_MODEL, build_summary, prepare_prompt, summarize_with_ollama
+
+SAMPLE_TITLE = "Spaceflight-induced bone loss in mice"
+SAMPLE_ABSTRACT = ("Mice flown for 30 days aboard the Bion-M1 biosatellite lost trabecular bone. "
+                   "Osteoclast activity increased while osteoblast markers were reduced. "
+                   "Ground controls housed in identical habitats showed no change.")
+
+STUB_TEXT = """Introduction: Spaceflight causes bone loss.
+Methods: Mice were flown on Bion-M1.
+Results: Trabecular bone decreased.
+Conclusion: Countermeasures are needed for long missions.
+Key Findings:
+• Bone volume fell
+• Osteoclasts increased"""
+STUB_JSON = json.dumps({
+    "introduction": "Spaceflight causes bone loss.",
+    "methods": "Mice were flown on Bion-M1.",
+    "results": "Trabecular bone decreased.",
+    "conclusion": "Countermeasures are needed for long missions.",
+    "key_findings": ["Bone volume fell", "Osteoclasts increased"],
+    "space_mission_relevance": "Relevant to Mars missions."
+})
+
+class StubOllamaServer:
+    """
+    Local stand-in for the Ollama HTTP API that answers /api/generate after
+    `delay` seconds, with JSON when a `format` schema is requested.
+    """
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real server
+            disable_nagle_algorithm = True
+
+            def do_POST(handler):
+                payload = json.loads(handler.rfile.read(int(handler.headers['Content-Length'])))
+                time.sleep(self.delay)
+                body = json.dumps({
+                    "model": payload.get("model"),
+                    "response": STUB_JSON if payload.get("format") else STUB_TEXT,
+                    "done": True
+                }).encode()
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'application/json')
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+def stub_cli(delay: float) -> List[str]:
+    """Command standing in for the `ollama` CLI: a new interpreter that waits and prints"""
+    script = f"import time; time.sleep({delay}); print({STUB_TEXT!r})"
+    return [sys.executable, '-c', script]
+
+def subprocess_latencies(cli: List[str], n: int, model: str = OLLAMA_MODEL) -> List[float]:
+    """Per-call latency of the old path: `ollama run model prompt` per request"""
+    prompt = prepare_prompt(SAMPLE_TITLE, SAMPLE_ABSTRACT, model=model)
+    latencies = []
+    for _ in range(n):
+        started = time.perf_counter()
+        result = subprocess.run([*cli, "run", model, prompt], capture_output=True,
+                                text=True, timeout=45)
+        build_summary(result.stdout.strip(), model)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+async def http_latencies(n: int, concurrency: int = 1) -> List[float]:
+    """Per-call latency of `summarize_with_ollama` over the pooled HTTP client"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            summary = await summarize_with_ollama(SAMPLE_TITLE, SAMPLE_ABSTRACT)
+            latencies.append(time.perf_counter() - started)
+            if summary.error:
+                raise RuntimeError(summary.error)
+
+    await asyncio.gather(*(one() for _ in range(n)))
+    await summarizer.get_ollama_client().aclose()
+    return latencies
+
+def summarize_latencies(name: str, latencies: List[float], elapsed: float) -> Dict[str, object]:
+    """Benchmark row for one path"""
+    return {
+        'path': name,
+        'requests': len(latencies),
+        'p50_ms': float(np.percentile(latencies, 50)) * 1e3,
+        'p95_ms': float(np.percentile(latencies, 95)) * 1e3,
+        'requests_per_s': len(latencies) / elapsed if elapsed else 0.0
+    }
+
+def benchmark(n: int = 20, concurrency: int = 4, cli: Optional[List[str]] = None) -> List[Dict[str, object]]:
+    """
+    Compare the subprocess path with the HTTP client, sequentially and with
+    `concurrency` requests in flight. The subprocess row is skipped without `cli`.
+    """
+    rows = []
+    if cli is not None:
+        started = time.perf_counter()
+        latencies = subprocess_latencies(cli, n)
+        rows.append(summarize_latencies('subprocess', latencies, time.perf_counter() - started))
+    for width in sorted({1, concurrency}):
+        started = time.perf_counter()
+        latencies = asyncio.run(http_latencies(n, width))
+        rows.append(summarize_latencies(f'http x{width}', latencies, time.perf_counter() - started))
+    return rows
+
+def report(rows: List[Dict[str, object]]) -> str:
+    """Markdown table of benchmark rows"""
+    columns = list(rows[0])
+    cell = lambda v: f"{v:.1f}" if isinstance(v, float) else str(v)
+    lines = ['| ' + ' | '.join(columns) + ' |', '|' + '---|' * len(columns)]
+    lines += ['| ' + ' | '.join(cell(row[c]) for c in columns) + ' |' for row in rows]
+    return '\n'.join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare Ollama latency over the HTTP API with spawning `ollama run` per request")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--stub", action="store_true",
+                        help="Use a local stub server and stub CLI instead of a real Ollama install")
+    parser.add_argument("--delay", type=float, default=0.05,
+                        help="Seconds the stubs take to generate a reply")
+    parser.add_argument("--output", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    stub = None
+    if args.stub:
+        stub = StubOllamaServer(args.delay)
+        summarizer.OLLAMA_HOST = stub.url
+        cli = stub_cli(args.delay)
+    else:
+        cli = [shutil.which("ollama")] if shutil.which("ollama") else None
+    try:
+        text = report(benchmark(args.requests, args.concurrency, cli))
+    finally:
+        if stub is not None:
+            stub.close()
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
@@ -2,6 +2,8 @@
 import pandas as pd
 import numpy as np
 from bs4 import BeautifulSoup
+from html.parser import HTMLParser
+import codecs
 import requests
 import re
 from typing import Tuple, List, Dict, Optional
@@ -12,10 +14,16 @@ import logging
 from pathlib import Path
 import aiohttp
 import asyncio
-from nltk.tokenize import sent_tokenize
-import nltk
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import os
+import hashlib
+import multiprocessing
+import shutil
 from functools import partial
+import pyarrow as pa
+from src.taxonomy import TaxonomyTagger
+from src.cards import CARD_COLUMNS, build_cards
+from src.search import SearchIndex
 
 # Setup logging
 logging.basicConfig(
@@ -24,14 +32,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('averaged_perceptron_tagger', quiet=True)
-    nltk.download('maxent_ne_chunker', quiet=True)
-    nltk.download('words', quiet=True)
-except Exception as e:
-    logger.warning(f"Failed to download NLTK data: {e}")
+# NLTK data used for sentence splitting and NER. Newer NLTK releases renamed
+# some packages, so each entry lists (package, resource path) alternatives.
+NLTK_RESOURCES = {
+    'punkt': [('punkt', 'tokenizers/punkt'), ('punkt_tab', 'tokenizers/punkt_tab')],
+    'averaged_perceptron_tagger': [
+        ('averaged_perceptron_tagger', 'taggers/averaged_perceptron_tagger'),
+        ('averaged_perceptron_tagger_eng', 'taggers/averaged_perceptron_tagger_eng')
+    ],
+    'maxent_ne_chunker': [
+        ('maxent_ne_chunker', 'chunkers/maxent_ne_chunker'),
+        ('maxent_ne_chunker_tab', 'chunkers/maxent_ne_chunker_tab')
+    ],
+    'words': [('words', 'corpora/words')]
+}
+# Vendored NLTK data directory, searched before NLTK's defaults
+NLTK_DATA_DIR = os.environ.get("NLTK_DATA", "data/nltk_data")
+
+def ensure_nltk_data(download: bool = False, data_dir: str = NLTK_DATA_DIR) -> List[str]:
+    """
+    Make the vendored NLTK data visible and report what is missing.
+
+    Nothing touches the network unless `download` is set, in which case
+    missing packages are fetched into `data_dir` once, e.g. at image build
+    time with `python -m src.preprocess --nltk-data`.
+
+    Returns:
+        Packages that are still unavailable
+    """
+    import nltk
+
+    if data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+
+    def found(resource: str) -> bool:
+        try:
+            nltk.data.find(resource)
+            return True
+        except LookupError:
+            return False
+
+    missing = []
+    for name, alternatives in NLTK_RESOURCES.items():
+        if download:
+            # Fetch every variant; each NLTK release only knows some of the names
+            for package, resource in alternatives:
+                if not found(resource):
+                    nltk.download(package, download_dir=data_dir, quiet=True)
+        if not any(found(resource) for _, resource in alternatives):
+            missing.append(name)
+    return missing
+
+_nltk_checked = False
+
+def load_nltk():
+    """Import NLTK on first use with the vendored data path in place"""
+    global _nltk_checked
+    import nltk
+
+    if not _nltk_checked:
+        _nltk_checked = True
+        missing = ensure_nltk_data()
+        if missing:
+            logger.info(f"NLTK data not found offline: {', '.join(missing)}")
+    return nltk
+
+def ner_available() -> bool:
+    """
+    Whether NLTK and the data its NER pass needs are installed.
+
+    Checked once per ingest: when something is missing a single warning is
+    logged and metadata extraction skips NER, leaving authors and
+    institutions empty, instead of failing on every document.
+    """
+    try:
+        missing = ensure_nltk_data()
+    except ImportError:
+        missing = ['nltk']
+    if missing:
+        logger.warning(f"NLTK NER unavailable (missing {', '.join(missing)}); authors and institutions "
+                       f"are left empty. Fetch the data with `python -m src.preprocess --nltk-data`.")
+    return not missing
+
+PROCESSING_VERSION = "2.3.1"
+CACHE_DIR = "data/cache"
+
+# Metadata columns holding lists of strings
+LIST_COLUMNS = ['organisms', 'experiment_types', 'missions', 'keywords', 'authors', 'institutions']
 
 @dataclass
 class PublicationMetadata:
@@ -73,7 +160,7 @@ class TextCleaner:
     def extract_sentences(text: str) -> List[str]:
         """Split text into sentences using NLTK"""
         try:
-            return sent_tokenize(text)
+            return load_nltk().sent_tokenize(text)
         except Exception as e:
             logger.warning(f"Failed to split sentences: {e}")
             return [text]
@@ -113,6 +200,20 @@ class MetadataExtractor:
         "future": ["Mars", "Lunar Gateway", "Moon Base"]
     }
     
+    _tagger: Optional[TaxonomyTagger] = None
+
+    @classmethod
+    def tagger(cls) -> TaxonomyTagger:
+        """Taxonomy automaton over every term above, built on first use"""
+        if cls._tagger is None:
+            cls._tagger = TaxonomyTagger({
+                name: {term: [term] for terms in taxonomy.values() for term in terms}
+                for name, taxonomy in (('organisms', cls.ORGANISMS),
+                                       ('experiment_types', cls.EXPERIMENT_TYPES),
+                                       ('missions', cls.MISSIONS))
+            })
+        return cls._tagger
+
     @classmethod
     def extract_dates(cls, text: str) -> List[str]:
         """Extract potential publication dates"""
@@ -123,167 +224,468 @@ class MetadataExtractor:
         dates = []
         for pattern in date_patterns:
             dates.extend(re.findall(pattern, text))
-        return list(set(dates))
-    
+        return list(dict.fromkeys(dates))
+
+    # NLTK NER labels mapped to the entity groups we keep
+    ENTITY_LABELS = {
+        'PERSON': 'authors',
+        'ORGANIZATION': 'institutions'
+    }
+
     @classmethod
-    def extract_authors(cls, text: str) -> List[str]:
-        """Extract author names using NLTK NER"""
+    def extract_entities(cls, text: str) -> Dict[str, List[str]]:
+        """Extract all named entity groups with a single NLTK NER pass"""
+        entities = {group: set() for group in cls.ENTITY_LABELS.values()}
         try:
+            nltk = load_nltk()
             tokens = nltk.word_tokenize(text)
             tagged = nltk.pos_tag(tokens)
-            entities = nltk.chunk.ne_chunk(tagged)
-            authors = []
-            for entity in entities:
-                if isinstance(entity, nltk.Tree) and entity.label() == 'PERSON':
-                    authors.append(' '.join([leaf[0] for leaf in entity.leaves()]))
-            return list(set(authors))
+            for entity in nltk.chunk.ne_chunk(tagged):
+                if isinstance(entity, nltk.Tree) and entity.label() in cls.ENTITY_LABELS:
+                    name = ' '.join([leaf[0] for leaf in entity.leaves()])
+                    entities[cls.ENTITY_LABELS[entity.label()]].add(name)
         except Exception as e:
-            logger.warning(f"Failed to extract authors: {e}")
-            return []
+            logger.warning(f"Failed to extract entities: {e}")
+        return {group: sorted(names) for group, names in entities.items()}
+
+    @classmethod
+    def extract_authors(cls, text: str) -> List[str]:
+        """Extract author names using NLTK NER"""
+        return cls.extract_entities(text)['authors']
     
     @classmethod
     def extract_institutions(cls, text: str) -> List[str]:
         """Extract institution names using NLTK NER"""
-        try:
-            tokens = nltk.word_tokenize(text)
-            tagged = nltk.pos_tag(tokens)
-            entities = nltk.chunk.ne_chunk(tagged)
-            institutions = []
-            for entity in entities:
-                if isinstance(entity, nltk.Tree) and entity.label() == 'ORGANIZATION':
-                    institutions.append(' '.join([leaf[0] for leaf in entity.leaves()]))
-            return list(set(institutions))
-        except Exception as e:
-            logger.warning(f"Failed to extract institutions: {e}")
-            return []
+        return cls.extract_entities(text)['institutions']
 
     @classmethod
-    def extract_metadata(cls, text: str) -> PublicationMetadata:
-        """Extract all metadata from text"""
-        # Convert text to lowercase for matching
-        text_lower = text.lower()
-        
-        # Extract organisms
-        organisms = []
-        for category, terms in cls.ORGANISMS.items():
-            organisms.extend([term for term in terms if term.lower() in text_lower])
-        
-        # Extract experiment types
-        experiment_types = []
-        for category, terms in cls.EXPERIMENT_TYPES.items():
-            experiment_types.extend([term for term in terms if term.lower() in text_lower])
-        
-        # Extract missions
-        missions = []
-        for category, terms in cls.MISSIONS.items():
-            missions.extend([term for term in terms if term.lower() in text_lower])
+    def extract_metadata(cls, text: str, ner: bool = True) -> PublicationMetadata:
+        """Extract all metadata from text; `ner=False` skips authors and institutions"""
+        # Organisms, experiment types and missions in one pass over the text
+        tags = cls.tagger().tag(text)
+        organisms = tags['organisms']
+        experiment_types = tags['experiment_types']
+        missions = tags['missions']
         
         # Extract other metadata
         dates = cls.extract_dates(text)
-        authors = cls.extract_authors(text)
-        institutions = cls.extract_institutions(text)
+        if ner:
+            entities = cls.extract_entities(text)
+        else:
+            entities = {group: [] for group in cls.ENTITY_LABELS.values()}
         
         # Extract keywords (simple approach - can be improved with RAKE or similar)
-        keywords = re.findall(r'\b\w+\b', text_lower)
-        keywords = [w for w in set(keywords) if len(w) > 3]  # Simple filtering
+        keywords = re.findall(r'\b\w+\b', text.lower())
+        # dict.fromkeys dedupes in text order; set order would vary with each
+        # worker process's hash seed
+        keywords = [w for w in dict.fromkeys(keywords) if len(w) > 3]  # Simple filtering
         
         return PublicationMetadata(
-            organisms=list(set(organisms)),
-            experiment_types=list(set(experiment_types)),
-            missions=list(set(missions)),
+            organisms=list(dict.fromkeys(organisms)),
+            experiment_types=list(dict.fromkeys(experiment_types)),
+            missions=list(dict.fromkeys(missions)),
             keywords=keywords[:10],  # Top 10 keywords
             publication_date=dates[0] if dates else None,
-            authors=authors,
-            institutions=institutions
+            authors=entities['authors'],
+            institutions=entities['institutions']
         )
 
-async def fetch_publication_content(url: str) -> Tuple[str, str, str]:
-    """Fetch publication content asynchronously"""
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, timeout=30) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract sections
-                    results = ""
-                    conclusion = ""
-                    abstract = ""
-                    
-                    # Find abstract
-                    abstract_elem = soup.find('section', {'id': 'abstract'}) or \
-                                 soup.find('div', {'class': 'abstract'})
-                    if abstract_elem:
-                        abstract = abstract_elem.get_text(strip=True)
-                    
-                    # Find results and conclusion
-                    for section in soup.find_all(['section', 'div']):
-                        text = section.get_text(strip=True).lower()
-                        if 'results' in text[:20]:
-                            results = section.get_text(strip=True)
-                        elif 'conclusion' in text[:20] or 'discussion' in text[:20]:
-                            conclusion = section.get_text(strip=True)
-                    
-                    return abstract, results, conclusion
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
-        
-        return "", "", ""
+class SectionExtractor(HTMLParser):
+    """
+    Single-pass extractor for abstract, results and conclusion sections.
 
-def load_and_clean(csv_path: str = "data/publications_with_abstracts.csv") -> pd.DataFrame:
+    The page is consumed as a stream of tag and text events, so text is
+    visited once regardless of nesting depth. Only open <section>/<div>
+    frames are kept, and a frame's text is joined and released as soon as
+    its closing tag is seen.
     """
-    Load and preprocess the publications dataset
+
+    CONTAINERS = {'section', 'div'}
+    SKIPPED = {'script', 'style', 'noscript'}
+    HEADER_CHARS = 20  # leading characters inspected to classify a section
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sections = {'abstract': '', 'results': '', 'conclusion': ''}
+        self._stack = []
+        self._undecided = []
+        self._capturing = []
+        self._active = set()
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED:
+            self._skip_depth += 1
+            return
+        if tag not in self.CONTAINERS:
+            return
+        attrs = dict(attrs)
+        is_abstract = (tag == 'section' and attrs.get('id') == 'abstract') or \
+                      (tag == 'div' and 'abstract' in (attrs.get('class') or '').split())
+        frame = {'tag': tag, 'kind': None, 'parts': [], 'length': 0, 'undecided': False}
+        self._stack.append(frame)
+        if is_abstract and not self.sections['abstract'] and 'abstract' not in self._active:
+            self._start_capture(frame, 'abstract')
+        else:
+            frame['undecided'] = True
+            self._undecided.append(frame)
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if tag not in self.CONTAINERS or not any(f['tag'] == tag for f in self._stack):
+            return
+        # Pop until the matching container, tolerating unclosed inner tags
+        while self._stack:
+            frame = self._stack.pop()
+            self._close(frame)
+            if frame['tag'] == tag:
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        text = data.strip()
+        if not text:
+            return
+        for frame in self._capturing:
+            frame['parts'].append(text)
+        if self._undecided:
+            still_undecided = []
+            for frame in self._undecided:
+                frame['parts'].append(text)
+                frame['length'] += len(text)
+                if frame['length'] >= self.HEADER_CHARS:
+                    self._decide(frame)
+                else:
+                    still_undecided.append(frame)
+            self._undecided = still_undecided
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self._close(self._stack.pop())
+
+    def _decide(self, frame):
+        frame['undecided'] = False
+        header = ''.join(frame['parts'])[:self.HEADER_CHARS].lower()
+        if 'results' in header:
+            kind = 'results'
+        elif 'conclusion' in header or 'discussion' in header:
+            kind = 'conclusion'
+        else:
+            kind = None
+        if kind and kind not in self._active:
+            self._start_capture(frame, kind)
+        else:
+            frame['parts'] = []
+
+    def _start_capture(self, frame, kind):
+        frame['kind'] = kind
+        self._active.add(kind)
+        self._capturing.append(frame)
+
+    def _close(self, frame):
+        if frame['undecided']:
+            self._undecided = [f for f in self._undecided if f is not frame]
+            self._decide(frame)
+        if frame['kind']:
+            self.sections[frame['kind']] = ' '.join(frame['parts'])
+            self._active.discard(frame['kind'])
+            self._capturing = [f for f in self._capturing if f is not frame]
+        frame['parts'] = []
+
+def parse_publication_html(html: str) -> Tuple[str, str, str]:
+    """Extract abstract, results and conclusion sections from a publication page"""
+    extractor = SectionExtractor()
+    extractor.feed(html)
+    extractor.close()
+    sections = extractor.sections
+    return sections['abstract'], sections['results'], sections['conclusion']
+
+async def fetch_publication_content(url: str,
+                                    session: Optional[aiohttp.ClientSession] = None) -> Tuple[str, str, str]:
+    """Fetch publication content asynchronously, reusing `session` when given"""
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await fetch_publication_content(url, own_session)
+
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status == 200:
+                # Feed the parser as the body streams in rather than buffering the page
+                extractor = SectionExtractor()
+                decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    extractor.feed(decoder.decode(chunk))
+                extractor.feed(decoder.decode(b'', final=True))
+                extractor.close()
+                sections = extractor.sections
+                return sections['abstract'], sections['results'], sections['conclusion']
+    except Exception as e:
+        logger.error(f"Error fetching {url}: {e}")
+
+    return "", "", ""
+
+def extract_metadata_batch(texts: List[str], workers: Optional[int] = None) -> List[PublicationMetadata]:
+    """
+    Extract metadata for many documents, in input order.
+
+    Work is spread over a process pool when `workers` allows more than one
+    process and there is enough input to amortise the pool start-up. Workers
+    are spawned rather than forked, since a cache miss can run this inside
+    the multi-threaded Streamlit server.
+    """
+    if not texts:
+        return []
+    # Checked here rather than per document, see ner_available()
+    extract = partial(MetadataExtractor.extract_metadata, ner=ner_available())
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(texts) < 2 * workers:
+        return [extract(text) for text in texts]
+
+    # Executor.map yields results in submission order, so output is deterministic
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(extract, texts, chunksize=chunksize))
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def corpus_artifact_path(csv_path: str, cache_dir: str = CACHE_DIR) -> Path:
+    """Artifact location keyed by the input file hash and processing version"""
+    key = f"{file_hash(csv_path)[:16]}-v{PROCESSING_VERSION}"
+    return Path(cache_dir) / f"{Path(csv_path).stem}-{key}.arrow"
+
+# Versioned cache file names: "<stem>-<16 hex hash>-v<version><suffix>" for
+# corpus artifacts and search indexes, "rows-v<version>.arrow" for the row store
+VERSIONED_NAME = re.compile(r'(?P<stem>.+?)(?P<hash>-[0-9a-f]{16})?-v\d+(?:\.\d+)*(?P<suffix>\.[a-z]+)')
+
+def stale_versions(path: Path) -> List[Path]:
+    """
+    Other versions of a versioned cache file in its directory.
+
+    Only names of exactly the same form (stem, optional hash, version,
+    suffix) match, so files of other inputs sharing a name prefix are kept.
+    """
+    match = VERSIONED_NAME.fullmatch(path.name)
+    if match is None:
+        return []
+    hashed = '-[0-9a-f]{16}' if match['hash'] else ''
+    pattern = re.compile(rf"{re.escape(match['stem'])}{hashed}-v\d+(?:\.\d+)*{re.escape(match['suffix'])}")
+    return [sibling for sibling in path.parent.iterdir()
+            if sibling != path and pattern.fullmatch(sibling.name)]
+
+def save_corpus_artifact(df: pd.DataFrame, path: Path) -> None:
+    """Write a processed frame as an uncompressed Arrow IPC file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp_path = path.with_suffix('.tmp')
+    with pa.OSFile(str(tmp_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    # Atomic swap so readers never see a partial artifact
+    os.replace(tmp_path, path)
+
+    # Drop artifacts for older versions of the same input
+    for stale in stale_versions(path):
+        stale.unlink(missing_ok=True)
+
+def load_corpus_artifact(path: Path) -> pd.DataFrame:
+    """Memory-map an Arrow IPC artifact and convert it to a frame"""
+    with pa.memory_map(str(path), 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+    df = table.to_pandas()
+    # Arrow list columns come back as arrays; restore plain lists
+    for column in LIST_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].map(list)
+    return df
+
+def search_index_path(csv_path: str, cache_dir: str = CACHE_DIR) -> Path:
+    """Directory of the SearchIndex built with the corpus artifact of a CSV"""
+    return corpus_artifact_path(csv_path, cache_dir).with_suffix('.search')
+
+def save_search_index(index: SearchIndex, path: Path) -> None:
+    """Write a SearchIndex directory next to its corpus artifact"""
+    tmp_path = path.with_suffix('.search-tmp')
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    index.save(str(tmp_path))
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+
+    # Drop indexes for older versions of the same input
+    for stale in stale_versions(path):
+        shutil.rmtree(stale, ignore_errors=True)
+
+def row_hashes(raw: pd.DataFrame) -> pd.Series:
+    """Content hash of each raw CSV row, used to key processed rows"""
+    hashes = pd.util.hash_pandas_object(raw, index=False)
+    return hashes.map('{:016x}'.format)
+
+def row_store_path(cache_dir: str = CACHE_DIR) -> Path:
+    """Store of processed rows for the current processing version"""
+    return Path(cache_dir) / f"rows-v{PROCESSING_VERSION}.arrow"
+
+def publication_ids(df: pd.DataFrame) -> pd.Series:
+    """Stable id per row: the PMC id from the link, else a prefix of the row hash"""
+    pmc_ids = df['link'].astype(str).str.extract(r'(PMC\d+)', expand=False)
+    return pmc_ids.fillna('row-' + df['row_hash'].str[:12])
+
+def process_rows(df: pd.DataFrame, workers: Optional[int] = None) -> pd.DataFrame:
+    """Clean text fields and extract metadata for a frame of raw rows"""
+    # Clean text fields
+    cleaner = TextCleaner()
+    df['title'] = df['title'].apply(cleaner.clean_text)
+    df['abstract'] = df['abstract'].apply(lambda x: cleaner.clean_text(x) or "Abstract not available.")
+
+    # Handle missing values; duplicate titles are dropped by the caller, after
+    # the rows have been stored, so they are not reprocessed on every rebuild
+    df.fillna({
+        "abstract": "Abstract not available.",
+        "results": "",
+        "conclusion": ""
+    }, inplace=True)
+
+    # Extract metadata
+    logger.info(f"Extracting metadata from {len(df)} publications")
+    texts = (df['title'] + ' ' + df['abstract']).tolist()
+    metadata = extract_metadata_batch(texts, workers)
+
+    # Add metadata columns
+    df['organisms'] = [m.organisms for m in metadata]
+    df['experiment_types'] = [m.experiment_types for m in metadata]
+    df['missions'] = [m.missions for m in metadata]
+    df['keywords'] = [m.keywords for m in metadata]
+    df['publication_date'] = [m.publication_date for m in metadata]
+    df['authors'] = [m.authors for m in metadata]
+    df['institutions'] = [m.institutions for m in metadata]
+
+    df['pub_id'] = publication_ids(df)
+
+    # Precomputed card fields shown by the Research Explorer
+    df[CARD_COLUMNS] = build_cards(df)
+
+    # Add processing metadata
+    df['processed_at'] = datetime.now().isoformat()
+    df['processing_version'] = PROCESSING_VERSION
+    return df
+
+def process_publications(csv_path: str, workers: Optional[int] = None,
+                         store_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Clean the raw publications CSV and extract metadata
+
+    With a `store_path`, rows are keyed by content hash and only new or
+    changed rows are processed; the rest are reused from the store, which
+    is then rewritten with the current rows.
+
+    Args:
+        csv_path: Path to the publications CSV
+        workers: Processes used for metadata extraction (defaults to all cores, 1 disables the pool)
+        store_path: Arrow store of previously processed rows, or None to process everything
     """
     logger.info(f"Loading data from {csv_path}")
     
     try:
         # Read CSV
         df = pd.read_csv(csv_path)
+        df['row_hash'] = row_hashes(df)
         
         # Standardize column names
         df.rename(columns={
             'Title': 'title',
             'Abstract': 'abstract',
-            'Link': 'link'
+            'Link': 'link',
+            'Results/Conclusion': 'results_conclusion'
         }, inplace=True)
         
-        # Clean text fields
-        cleaner = TextCleaner()
-        df['title'] = df['title'].apply(cleaner.clean_text)
-        df['abstract'] = df['abstract'].apply(lambda x: cleaner.clean_text(x) or "Abstract not available.")
-        
-        # Remove duplicates and handle missing values
-        df.drop_duplicates(subset=['title'], inplace=True)
-        df.fillna({
-            "abstract": "Abstract not available.",
-            "results": "",
-            "conclusion": ""
-        }, inplace=True)
+        cached = pd.DataFrame()
+        stored_rows = 0
+        if store_path is not None and store_path.exists():
+            cached = load_corpus_artifact(store_path)
+            stored_rows = len(cached)
+            cached = cached[cached['row_hash'].isin(df['row_hash'])]
         
-        # Extract metadata
-        logger.info("Extracting metadata from publications")
-        metadata = []
-        for _, row in df.iterrows():
-            text = f"{row['title']} {row['abstract']}"
-            metadata.append(MetadataExtractor.extract_metadata(text))
+        is_new = ~df['row_hash'].isin(cached['row_hash']) if len(cached) else \
+            pd.Series(True, index=df.index)
+        logger.info(f"{is_new.sum()} new or changed rows, {len(df) - is_new.sum()} reused")
+        fresh = process_rows(df[is_new].copy(), workers) if is_new.any() else pd.DataFrame()
         
-        # Add metadata columns
-        df['organisms'] = [m.organisms for m in metadata]
-        df['experiment_types'] = [m.experiment_types for m in metadata]
-        df['missions'] = [m.missions for m in metadata]
-        df['keywords'] = [m.keywords for m in metadata]
-        df['publication_date'] = [m.publication_date for m in metadata]
-        df['authors'] = [m.authors for m in metadata]
-        df['institutions'] = [m.institutions for m in metadata]
+        # Reassemble in CSV order; the store keeps every processed row
+        order = pd.Series(range(len(df)), index=df['row_hash']).groupby(level=0).first()
+        df = pd.concat([cached, fresh], ignore_index=True)
+        df = df.iloc[np.argsort(df['row_hash'].map(order).to_numpy(), kind='stable')]
+        df = df.drop_duplicates(subset=['row_hash']).reset_index(drop=True)
         
-        # Add processing metadata
-        df['processed_at'] = datetime.now().isoformat()
-        df['processing_version'] = "2.0.0"
+        if store_path is not None and (is_new.any() or len(cached) != stored_rows):
+            save_corpus_artifact(df, store_path)
         
+        df = df.drop_duplicates(subset=['title']).reset_index(drop=True)
+
         logger.info(f"Successfully processed {len(df)} publications")
         return df
         
     except Exception as e:
         logger.error(f"Error processing publications: {e}")
-        raise
\ No newline at end of file
+        raise
+
+def load_and_clean(csv_path: str = "data/publications_with_abstracts.csv",
+                   workers: Optional[int] = None,
+                   cache_dir: Optional[str] = CACHE_DIR) -> pd.DataFrame:
+    """
+    Load and preprocess the publications dataset
+
+    The processed frame is cached as an Arrow artifact keyed by the CSV hash
+    and PROCESSING_VERSION, so it is only rebuilt when either changes. A
+    rebuild reprocesses only rows whose content hash is not in the row store
+    and refits the search index stored beside the artifact.
+
+    Args:
+        csv_path: Path to the publications CSV
+        workers: Processes used for metadata extraction (defaults to all cores, 1 disables the pool)
+        cache_dir: Directory for corpus artifacts, or None to always reprocess
+    """
+    if cache_dir is None:
+        return process_publications(csv_path, workers)
+
+    artifact = corpus_artifact_path(csv_path, cache_dir)
+    if artifact.exists():
+        logger.info(f"Loading processed corpus from {artifact}")
+        return load_corpus_artifact(artifact)
+
+    df = process_publications(csv_path, workers, row_store_path(cache_dir))
+    save_corpus_artifact(df, artifact)
+    logger.info(f"Saved processed corpus to {artifact}")
+
+    # The TF-IDF search index is fitted once per corpus version, not per page load
+    index_path = search_index_path(csv_path, cache_dir)
+    save_search_index(SearchIndex.build(df), index_path)
+    logger.info(f"Saved search index to {index_path}")
+    return df
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the processed corpus artifact")
+    parser.add_argument("--csv", default="data/publications_with_abstracts.csv")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--nltk-data", action="store_true",
+                        help=f"Download missing NLTK data into {NLTK_DATA_DIR} and exit")
+    args = parser.parse_args()
+
+    if args.nltk_data:
+        missing = ensure_nltk_data(download=True)
+        if missing:
+            raise SystemExit(f"Could not fetch NLTK data: {', '.join(missing)}")
+    else:
+        load_and_clean(args.csv, args.workers, args.cache_dir)
@@ -0,0 +1,133 @@
+# src/retrieval.py
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src.context import count_tokens
+
+@dataclass
+class Citation:
+    """Source of a retrieved chunk, numbered as referenced in the prompt"""
+    number: int
+    title: str
+    link: str
+    section: str
+
+def chunk_text(text: str, chunk_words: int = 120, overlap: int = 30) -> List[str]:
+    """Split text into overlapping word windows"""
+    words = text.split()
+    if len(words) <= chunk_words:
+        return [' '.join(words)] if words else []
+    step = chunk_words - overlap
+    return [' '.join(words[i:i + chunk_words])
+            for i in range(0, max(1, len(words) - overlap), step)]
+
+class ChunkIndex:
+    """
+    Retrieval index over chunks of every abstract and fetched section.
+
+    Chunks are TF-IDF vectors held column-major, so scoring a question only
+    touches the posting columns of its terms rather than every chunk. A
+    corpus with no indexable text gives an empty index (no vectorizer) that
+    retrieves nothing.
+    """
+
+    SECTIONS = ('abstract', 'results', 'conclusion')
+
+    def __init__(self, vectorizer: Optional[TfidfVectorizer], matrix, titles: List[str],
+                 links: List[str], sections: List[str], texts: List[str]):
+        self.vectorizer = vectorizer
+        self.matrix = matrix
+        self.titles = titles
+        self.links = links
+        self.sections = sections
+        self.texts = texts
+
+    @classmethod
+    def build(cls, publications: Iterable[Dict], crawled: Optional[Dict[str, dict]] = None,
+              chunk_words: int = 120, overlap: int = 30) -> 'ChunkIndex':
+        """
+        Chunk and index publications.
+
+        Args:
+            publications: Records with title, link, abstract and optionally results/conclusion
+            crawled: Crawled sections keyed by link (see src.crawler.load_sections)
+            chunk_words: Words per chunk
+            overlap: Words shared between consecutive chunks
+        """
+        crawled = crawled or {}
+        titles, links, sections, texts = [], [], [], []
+        for pub in publications:
+            record = {**pub, **{k: v for k, v in crawled.get(pub.get('link'), {}).items() if v}}
+            for section in cls.SECTIONS:
+                value = record.get(section)
+                if not isinstance(value, str) or not value.strip():
+                    continue
+                for chunk in chunk_text(value, chunk_words, overlap):
+                    titles.append(pub['title'])
+                    links.append(pub.get('link', ''))
+                    sections.append(section)
+                    texts.append(chunk)
+
+        vectorizer = TfidfVectorizer(stop_words='english', sublinear_tf=True,
+                                     dtype=np.float32, max_features=200000)
+        try:
+            matrix = vectorizer.fit_transform(
+                [f"{title} {text}" for title, text in zip(titles, texts)]
+            ).tocsc()
+        except ValueError:  # no chunks, or only stop words
+            return cls(None, None, [], [], [], [])
+        return cls(vectorizer, matrix, titles, links, sections, texts)
+
+    def retrieve(self, question: str, k: int = 8) -> List[Tuple[int, float]]:
+        """Top-k (chunk id, score) pairs for a question"""
+        if self.vectorizer is None:
+            return []
+        query = self.vectorizer.transform([question])
+        if not query.nnz:
+            return []
+        # Only the columns of the question's terms contribute to the score
+        scores = self.matrix[:, query.indices] @ query.data
+        scores = np.asarray(scores).ravel()
+        candidates = np.flatnonzero(scores)
+        if k < len(candidates):
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        best = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(i), float(scores[i])) for i in best]
+
+    def build_prompt(self, question: str, k: int = 8,
+                     token_budget: int = 2000) -> Tuple[str, List[Citation]]:
+        """
+        Retrieve chunks for a question and pack them into a prompt.
+
+        Chunks are added best-first until `token_budget` is spent; each is
+        numbered so the answer can cite it.
+        """
+        context = []
+        citations: List[Citation] = []
+        numbers: Dict[str, int] = {}
+        used = 0
+        for chunk_id, _ in self.retrieve(question, k):
+            text = self.texts[chunk_id]
+            cost = count_tokens(text)
+            if used + cost > token_budget:
+                continue
+            used += cost
+            title = self.titles[chunk_id]
+            if title not in numbers:
+                numbers[title] = len(numbers) + 1
+                citations.append(Citation(numbers[title], title, self.links[chunk_id],
+                                          self.sections[chunk_id]))
+            context.append(f"[{numbers[title]}] {title} ({self.sections[chunk_id]}): {text}")
+
+        prompt = "\n".join([
+            "Answer the question using only the numbered research excerpts below.",
+            "Cite the excerpts you use with their numbers, e.g. [1].",
+            "",
+            *context,
+            "",
+            f"Question: {question}"
+        ])
+        return prompt, citations
@@ -0,0 +1,63 @@
+# src/retrieval_benchmark.py
+import argparse
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from src.retrieval import ChunkIndex
+from src.search_benchmark import DEFAULT_QUERIES, report, synthetic_publications
+
+DEFAULT_SIZES = [1000, 10000, 100000]  # chunks
+CHUNK_WORDS = 120
+
+def benchmark(sizes: List[int], queries: List[str], k: int = 8,
+              repeats: int = 20, seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Build time and per-question retrieval latency of a ChunkIndex at each size.
+
+    Each synthetic abstract is exactly one chunk long, so `sizes` counts
+    chunks. Latencies cover `retrieve` only; the target is under 50 ms at
+    100k chunks.
+    """
+    # Import scikit-learn up front so the first build is not charged for it
+    from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: F401
+
+    rows = []
+    for n in sizes:
+        publications = synthetic_publications(n, seed, abstract_words=CHUNK_WORDS)
+        started = time.perf_counter()
+        index = ChunkIndex.build(publications.to_dict(orient='records'), chunk_words=CHUNK_WORDS)
+        build_s = time.perf_counter() - started
+
+        latencies = []
+        for _ in range(repeats):
+            for question in queries:
+                started = time.perf_counter()
+                index.retrieve(question, k)
+                latencies.append(time.perf_counter() - started)
+
+        rows.append({
+            'chunks': len(index.texts),
+            'build_s': build_s,
+            'retrieve_p50_ms': float(np.percentile(latencies, 50)) * 1e3,
+            'retrieve_p99_ms': float(np.percentile(latencies, 99)) * 1e3,
+            'retrieve_max_ms': max(latencies) * 1e3
+        })
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark chat retrieval latency on synthetic chunks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    text = report(benchmark(args.sizes, args.queries, args.k, args.repeats, args.seed))
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
@@ -0,0 +1,268 @@
+# src/router.py
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence
+
+from src.async_runtime import AdmissionRejected
+
+@dataclass
+class Backend:
+    """A summarization backend the router can dispatch to"""
+    name: str
+    model: str
+    summarize: Callable[..., Awaitable[Any]]
+    stream: Optional[Callable[[str, str], Any]] = None
+
+class BackendStats:
+    """Rolling latency and outcome window for one backend"""
+
+    def __init__(self, window: int = 100):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.last_used = 0.0
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.last_used = time.monotonic()
+        if ok:
+            self.latencies.append(latency)
+        self.outcomes.append(ok)
+
+    def record_censored(self, latency: float) -> None:
+        """Latency of a call abandoned before it answered; a lower bound, not an outcome"""
+        self.last_used = time.monotonic()
+        self.latencies.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        values = sorted(self.latencies)
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.percentile(0.95)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    @property
+    def expected_latency(self) -> float:
+        """p50 scaled by the retries its error rate implies; 0 until measured"""
+        if not self.latencies:
+            return float('inf') if self.outcomes else 0.0
+        return self.p50 / max(1 - self.error_rate, 0.05)
+
+class CircuitBreaker:
+    """
+    Stops routing to a backend after repeated failures.
+
+    Opens after `failure_threshold` consecutive failures, then after
+    `reset_timeout` seconds lets a single probe through (half-open); the
+    probe's outcome closes or re-opens the breaker.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now; claims the probe when half-open"""
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+        return self.state == self.CLOSED
+
+    def available(self) -> bool:
+        """Like `allow` but without claiming the half-open probe"""
+        if self.state == self.OPEN:
+            return time.monotonic() - self.opened_at >= self.reset_timeout
+        return not (self.state == self.HALF_OPEN and self._probing)
+
+    def release(self) -> None:
+        """Give back a claimed probe that ended without an outcome (cancelled or rejected)"""
+        self._probing = False
+
+    def record(self, ok: bool) -> None:
+        self._probing = False
+        if ok:
+            self.state = self.CLOSED
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+class Router:
+    """
+    Latency-aware dispatch over a backend registry.
+
+    Healthy backends are tried fastest-first by rolling p50 latency scaled
+    by error rate. Backends without samples go first so they get measured,
+    and a backend whose window holds only failures gets one exploratory
+    request per `reset_timeout` so it can recover. If the chosen backend has
+    not answered within `hedge_delay` seconds the next one is started as
+    well and the first successful answer wins. Failed answers fall through
+    to the next backend, and each backend has a circuit breaker.
+    """
+
+    def __init__(self, backends: Dict[str, Backend], hedge_delay: Optional[float] = None,
+                 window: int = 100, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.backends = backends
+        self.hedge_delay = hedge_delay
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stats: Dict[str, BackendStats] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.hedges = 0
+
+    def _stats(self, name: str) -> BackendStats:
+        if name not in self.stats:
+            self.stats[name] = BackendStats(self.window)
+        return self.stats[name]
+
+    def _breaker(self, name: str) -> CircuitBreaker:
+        if name not in self.breakers:
+            self.breakers[name] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self.breakers[name]
+
+    def record(self, name: str, latency: float, ok: bool) -> None:
+        """Feed one call's outcome into the backend's stats and breaker"""
+        self._stats(name).record(latency, ok)
+        self._breaker(name).record(ok)
+
+    def ranked(self, names: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Backends in the order they would be tried.
+
+        Backends with an open breaker are left out unless every backend is
+        open, in which case all are returned so requests still get a chance.
+        """
+        names = list(names or self.backends)
+        order = {name: i for i, name in enumerate(names)}
+        healthy = [name for name in names if self._breaker(name).available()] or names
+        now = time.monotonic()
+
+        def cost(name: str) -> float:
+            stats = self._stats(name)
+            expected = stats.expected_latency
+            # Only failures on record and quiet since: explore it once
+            if expected == float('inf') and now - stats.last_used >= self.reset_timeout:
+                return 0.0
+            return expected
+
+        return sorted(healthy, key=lambda name: (cost(name), order[name]))
+
+    def _claim(self, name: str) -> None:
+        # Marks the backend used, so an exploratory slot goes to one request only
+        self._stats(name).last_used = time.monotonic()
+
+    def choose(self, names: Optional[Sequence[str]] = None) -> str:
+        """Backend a single (unhedged) request should go to"""
+        name = self.ranked(names)[0]
+        self._claim(name)
+        return name
+
+    async def run(self, call: Callable[[str], Awaitable[Any]],
+                  names: Optional[Sequence[str]] = None) -> Any:
+        """
+        Run `call(backend_name)` on the best backend, hedging and failing over.
+
+        A result whose `error` attribute is set counts as a failure. Returns
+        the first successful result, otherwise the last failed one; raises
+        the last exception if no backend returned anything.
+        """
+        queue = self.ranked(names)
+        pending: Dict[asyncio.Future, tuple] = {}
+        last_result = None
+        last_error: Optional[BaseException] = None
+
+        def launch() -> None:
+            while queue:
+                name = queue.pop(0)
+                breaker = self._breaker(name)
+                # A half-open breaker admits one probe at a time
+                allowed = breaker.allow()
+                if allowed or not pending and not queue:
+                    self._claim(name)
+                    probe = allowed and breaker.state == CircuitBreaker.HALF_OPEN
+                    pending[asyncio.ensure_future(call(name))] = (name, time.monotonic(), probe)
+                    return
+
+        launch()
+        try:
+            while pending:
+                timeout = self.hedge_delay if queue and self.hedge_delay else None
+                done, _ = await asyncio.wait(pending, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self.hedges += 1
+                    launch()
+                    continue
+                for task in done:
+                    name, started, probe = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except AdmissionRejected as e:
+                        # Backend busy, not broken: try elsewhere without penalty
+                        if probe:
+                            self._breaker(name).release()
+                        last_error = e
+                        continue
+                    except Exception as e:
+                        last_error = e
+                        self.record(name, time.monotonic() - started, ok=False)
+                        continue
+                    ok = not getattr(result, 'error', None)
+                    self.record(name, time.monotonic() - started, ok)
+                    if ok:
+                        return result
+                    last_result = result
+                if not pending:
+                    launch()
+        finally:
+            now = time.monotonic()
+            for task, (name, started, probe) in pending.items():
+                # Lost the hedge race: it was at least this slow
+                task.cancel()
+                self._stats(name).record_censored(now - started)
+                if probe:
+                    self._breaker(name).release()
+
+        if last_result is not None:
+            return last_result
+        raise last_error or RuntimeError("No backend available")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current latency, error rate and breaker state per backend"""
+        return {
+            name: {
+                'p50_s': self._stats(name).p50,
+                'p95_s': self._stats(name).p95,
+                'error_rate': self._stats(name).error_rate,
+                'samples': len(self._stats(name).outcomes),
+                'breaker': self._breaker(name).state
+            }
+            for name in self.backends
+        }
@@ -1,11 +1,15 @@
 # src/search.py
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
+from pathlib import Path
+import pickle
 import re
 
+if TYPE_CHECKING:
+    from scipy import sparse
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
 def preprocess_text(text: str) -> str:
     """Preprocess text for improved search."""
     if pd.isna(text):
@@ -31,39 +35,208 @@ def get_relevant_keywords(text: str) -> List[str]:
     words = set(text.lower().split())
     return list(words.intersection(domain_keywords))
 
-def calculate_relevance_score(row: pd.Series, query: str, vectorizer: TfidfVectorizer) -> float:
-    """Calculate relevance score based on text similarity and other factors."""
-    # Combine text fields with different weights
-    text = (
-        (row['title'] + " ") * 2 +  # Title has double weight
-        (row['abstract'] + " ")     # Abstract has normal weight
-    )
-    
-    # Calculate TF-IDF similarity
-    query_vec = vectorizer.transform([query])
-    text_vec = vectorizer.transform([text])
-    similarity = cosine_similarity(query_vec, text_vec)[0][0]
-    
-    # Boost score based on metadata matches
-    boost = 1.0
-    if query.lower() in str(row['organism']).lower():
-        boost += 0.3
-    if query.lower() in str(row['experiment_type']).lower():
-        boost += 0.3
-    if query.lower() in str(row['mission']).lower():
-        boost += 0.4
-        
-    return similarity * boost
+def highlight_matches(text: str, query_terms: List[str]) -> str:
+    """Wrap query term matches in markdown bold."""
+    highlighted = text
+    for term in query_terms:
+        pattern = re.compile(f'({re.escape(term)})', re.IGNORECASE)
+        highlighted = pattern.sub(r'**\1**', highlighted)
+    return highlighted
+
+class SearchIndex:
+    """
+    Prebuilt TF-IDF index over publication titles and abstracts.
+
+    The vectorizer is fitted once and the title-weighted document-term
+    matrix is kept L2-normalised, so a query is a single sparse
+    matrix-vector product instead of a corpus refit.
+    """
+
+    RESULT_COLUMNS = ['title', 'abstract', 'link', 'organisms',
+                      'experiment_types', 'missions']
+
+    # Score multipliers added when the query appears in a metadata field
+    METADATA_BOOSTS = {
+        'organisms': 0.3,
+        'experiment_types': 0.3,
+        'missions': 0.4
+    }
+
+    # Separator of the terms of a list-valued metadata column once flattened
+    TERM_SEPARATOR = '; '
+
+    def __init__(self, vectorizer: 'TfidfVectorizer', doc_matrix: 'sparse.csr_matrix',
+                 frame: pd.DataFrame):
+        self.vectorizer = vectorizer
+        self.doc_matrix = doc_matrix
+        self.frame = frame
+        # Metadata columns are low-cardinality, so boosts and filters are
+        # resolved once per distinct value and broadcast back as masks
+        self._codes = {}
+        self._uniques = {}
+        for column in self.RESULT_COLUMNS[3:]:
+            codes, uniques = pd.factorize(frame[column].str.lower())
+            self._codes[column] = codes
+            self._uniques[column] = np.asarray(uniques, dtype=object)
+
+    def _value_mask(self, column: str, matches) -> np.ndarray:
+        """Boolean row mask for rows whose lowercased value satisfies `matches`."""
+        hits = np.fromiter((matches(u) for u in self._uniques[column]),
+                           dtype=bool, count=len(self._uniques[column]))
+        return hits[self._codes[column]]
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> 'SearchIndex':
+        """Fit the vectorizer and document matrix for a publications frame."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        frame = df.reset_index(drop=True).reindex(columns=cls.RESULT_COLUMNS)
+        # Metadata columns hold lists of extracted terms; keep them as one string per row
+        for column in cls.METADATA_BOOSTS:
+            frame[column] = frame[column].map(
+                lambda v: cls.TERM_SEPARATOR.join(v) if isinstance(v, (list, tuple, np.ndarray)) else v)
+        frame = frame.fillna('').astype(str)
+
+        vectorizer = TfidfVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),
+            max_features=10000
+        )
+        vectorizer.fit(frame['title'] + ' ' + frame['abstract'])
+
+        # Title has double weight, abstract has normal weight
+        weighted = (frame['title'] + ' ') * 2 + frame['abstract'] + ' '
+        doc_matrix = vectorizer.transform(weighted).tocsr()
+        return cls(vectorizer, doc_matrix, frame)
+
+    def save(self, path: str) -> None:
+        """Write the index to a directory so it can be memory-mapped back in."""
+        out = Path(path)
+        out.mkdir(parents=True, exist_ok=True)
+        np.save(out / 'data.npy', self.doc_matrix.data)
+        np.save(out / 'indices.npy', self.doc_matrix.indices)
+        np.save(out / 'indptr.npy', self.doc_matrix.indptr)
+        with open(out / 'vectorizer.pkl', 'wb') as f:
+            pickle.dump(self.vectorizer, f)
+        self.frame.to_pickle(out / 'frame.pkl')
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'SearchIndex':
+        """Load an index written by `save`, memory-mapping the matrix arrays."""
+        from scipy import sparse
+
+        src = Path(path)
+        mode = 'r' if mmap else None
+        data = np.load(src / 'data.npy', mmap_mode=mode)
+        indices = np.load(src / 'indices.npy', mmap_mode=mode)
+        indptr = np.load(src / 'indptr.npy', mmap_mode=mode)
+        with open(src / 'vectorizer.pkl', 'rb') as f:
+            vectorizer = pickle.load(f)
+        frame = pd.read_pickle(src / 'frame.pkl')
+        doc_matrix = sparse.csr_matrix(
+            (data, indices, indptr),
+            shape=(len(frame), len(vectorizer.vocabulary_)),
+            copy=False
+        )
+        return cls(vectorizer, doc_matrix, frame)
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity of the query against every document."""
+        query_vec = self.vectorizer.transform([preprocess_text(text)])
+        return np.asarray(self.doc_matrix @ query_vec.T.toarray()).ravel()
+
+    @staticmethod
+    def top_k(scores: np.ndarray, mask: np.ndarray, k: Optional[int]) -> np.ndarray:
+        """
+        Positions of the k best masked scores, best first.
+
+        Ties keep position order, so the result is a prefix of a stable full
+        sort and consecutive pages neither repeat nor skip rows.
+        """
+        candidates = np.flatnonzero(mask)
+        if k is not None and k < len(candidates):
+            # Select the top k in linear time, then sort only those
+            candidate_scores = scores[candidates]
+            part = np.argpartition(-candidate_scores, k - 1)[:k]
+            threshold = candidate_scores[part].min()
+            above = candidates[candidate_scores > threshold]
+            tied = candidates[candidate_scores == threshold][:k - len(above)]
+            candidates = np.concatenate([above, tied])
+        return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    def relevance(self, text: str) -> np.ndarray:
+        """Query similarity of every document, boosted where a metadata term contains the query."""
+        processed_query = preprocess_text(text)
+        scores = self.scores(processed_query)
+        if not processed_query:
+            return scores
+
+        boost = np.ones_like(scores)
+        for column, weight in self.METADATA_BOOSTS.items():
+            boost += weight * self._value_mask(column, lambda v: processed_query in v)
+        return scores * boost
+
+    def query(self, text: str, k: Optional[int] = 10,
+              filters: Dict[str, str] = None) -> pd.DataFrame:
+        """
+        Rank publications against a query.
+
+        Args:
+            text: Search query string
+            k: Maximum number of results, or None for every match
+            filters: Dictionary of filters (e.g., {'organisms': 'mice'}) on
+                RESULT_COLUMNS; a metadata filter keeps rows where the term
+                was extracted
+
+        Returns:
+            DataFrame of matched publications, sorted by relevance
+
+        Raises:
+            ValueError: If a filter names a column the index does not keep
+        """
+        unknown = sorted(set(filters or {}) - set(self.RESULT_COLUMNS))
+        if unknown:
+            raise ValueError(f"Cannot filter on {', '.join(unknown)}; "
+                             f"filterable columns are {', '.join(self.RESULT_COLUMNS)}")
+
+        processed_query = preprocess_text(text)
+        scores = self.relevance(processed_query)
+
+        mask = scores > 0
+        if filters:
+            for key, value in filters.items():
+                if value and value.lower() != 'all':
+                    if key in self._codes:
+                        mask &= self._value_mask(
+                            key, lambda v: value.lower() in v.split(self.TERM_SEPARATOR))
+                    else:
+                        mask &= (self.frame[key].str.lower() == value.lower()).to_numpy()
+
+        order = self.top_k(scores, mask, k)
+
+        results = self.frame.iloc[order].copy()
+        results['relevance_score'] = scores[order]
+
+        query_terms = processed_query.split()
+        results['highlighted_title'] = results['title'].apply(
+            lambda x: highlight_matches(x, query_terms)
+        )
+        results['highlighted_abstract'] = results['abstract'].apply(
+            lambda x: highlight_matches(x, query_terms)
+        )
+        return results
 
 def search_publications(df: pd.DataFrame, query: str, 
-                       filters: Dict[str, str] = None) -> pd.DataFrame:
+                       filters: Dict[str, str] = None,
+                       index: Optional[SearchIndex] = None) -> pd.DataFrame:
     """
     Enhanced search function with relevance scoring and filtering.
     
     Args:
         df: DataFrame containing publications
         query: Search query string
-        filters: Dictionary of filters (e.g., {'organism': 'mice', 'experiment_type': 'radiation'})
+        filters: Dictionary of filters (e.g., {'organisms': 'mice', 'experiment_types': 'radiation'})
+        index: Prebuilt SearchIndex for `df`; built on the fly if omitted
     
     Returns:
         DataFrame of matched publications, sorted by relevance
@@ -71,53 +244,101 @@ def search_publications(df: pd.DataFrame, query: str,
     if not query.strip():
         return df
     
-    # Preprocess the query
-    processed_query = preprocess_text(query)
-    
-    # Initialize TF-IDF vectorizer
-    vectorizer = TfidfVectorizer(
-        stop_words='english',
-        ngram_range=(1, 2),
-        max_features=10000
-    )
-    
-    # Fit vectorizer on corpus
-    corpus = df['title'].fillna('') + ' ' + df['abstract'].fillna('')
-    vectorizer.fit(corpus)
+    if index is None:
+        index = SearchIndex.build(df)
     
-    # Calculate relevance scores
-    df['relevance_score'] = df.apply(
-        lambda row: calculate_relevance_score(row, processed_query, vectorizer),
-        axis=1
-    )
-    
-    # Apply filters if provided
-    if filters:
-        for key, value in filters.items():
-            if value and value.lower() != 'all':
-                df = df[df[key].str.lower() == value.lower()]
-    
-    # Filter results with non-zero relevance and sort
-    results = df[df['relevance_score'] > 0].sort_values(
-        'relevance_score', ascending=False
-    ).copy()
-    
-    # Add match highlights
-    def highlight_matches(text, query_terms):
-        highlighted = text
-        for term in query_terms:
-            pattern = re.compile(f'({term})', re.IGNORECASE)
-            highlighted = pattern.sub(r'**\1**', highlighted)
-        return highlighted
-    
-    query_terms = processed_query.split()
-    results['highlighted_title'] = results['title'].apply(
-        lambda x: highlight_matches(x, query_terms)
-    )
-    results['highlighted_abstract'] = results['abstract'].apply(
-        lambda x: highlight_matches(x, query_terms)
-    )
-    
-    return results[['title', 'abstract', 'link', 'organism', 
-                   'experiment_type', 'mission', 'relevance_score',
-                   'highlighted_title', 'highlighted_abstract']]
\ No newline at end of file
+    results = index.query(query, k=None, filters=filters)
+    return results[['title', 'abstract', 'link', 'organisms',
+                   'experiment_types', 'missions', 'relevance_score',
+                   'highlighted_title', 'highlighted_abstract']]
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return re.findall(r'[a-z0-9]+', preprocess_text(text))
+
+class _FieldPostings:
+    """Posting lists for one field stored as flat, CSR-style arrays"""
+
+    def __init__(self, documents: List[str]):
+        postings: Dict[str, List[int]] = {}
+        for doc_id, text in enumerate(documents):
+            for token in set(tokenize(text)):
+                postings.setdefault(token, []).append(doc_id)
+
+        self.vocab = np.array(sorted(postings), dtype=str)
+        lengths = np.fromiter((len(postings[t]) for t in self.vocab),
+                              dtype=np.int64, count=len(self.vocab))
+        self.offsets = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.postings = np.fromiter(
+            (doc_id for t in self.vocab for doc_id in postings[t]),
+            dtype=np.int32, count=int(self.offsets[-1])
+        )
+
+    def document_frequencies(self) -> Dict[str, int]:
+        """Number of documents containing each token."""
+        return dict(zip(self.vocab.tolist(), np.diff(self.offsets).tolist()))
+
+    def lookup(self, token: str, prefix: bool = True) -> np.ndarray:
+        """Sorted document ids containing `token` (or a word starting with it)."""
+        start = np.searchsorted(self.vocab, token, side='left')
+        if prefix:
+            end = np.searchsorted(self.vocab, token + '\uffff', side='left')
+        else:
+            end = start + int(start < len(self.vocab) and self.vocab[start] == token)
+        if end - start == 1:
+            return self.postings[self.offsets[start]:self.offsets[start + 1]]
+        return np.unique(self.postings[self.offsets[start]:self.offsets[end]])
+
+class KeywordIndex:
+    """
+    Token-level inverted index over publication fields.
+
+    Free-text queries, focus areas and category filters are resolved as
+    posting-list intersections and unions instead of regex scans over
+    every abstract. Matching is by word prefix, so "radiation" also
+    matches "radiations", mirroring the old `str.contains` behaviour.
+    """
+
+    FIELDS = ('title', 'abstract', 'organisms', 'experiment_types', 'missions')
+
+    def __init__(self, fields: Dict[str, _FieldPostings], n_docs: int):
+        self.fields = fields
+        self.n_docs = n_docs
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, fields: Tuple[str, ...] = FIELDS) -> 'KeywordIndex':
+        """Index the given columns of a publications frame by row position."""
+        postings = {}
+        for field in fields:
+            if field not in df.columns:
+                continue
+            values = [' '.join(v) if isinstance(v, (list, tuple, np.ndarray)) else
+                      ('' if pd.isna(v) else str(v)) for v in df[field]]
+            postings[field] = _FieldPostings(values)
+        return cls(postings, len(df))
+
+    def all(self) -> np.ndarray:
+        """Every document id."""
+        return np.arange(self.n_docs, dtype=np.int32)
+
+    def match(self, text: str, fields: Tuple[str, ...] = ('title', 'abstract'),
+              prefix: bool = True) -> np.ndarray:
+        """Documents containing every token of `text` (whole words unless `prefix`) in any of `fields`."""
+        result = None
+        for token in tokenize(text):
+            hits = [self.fields[f].lookup(token, prefix) for f in fields if f in self.fields]
+            ids = np.unique(np.concatenate(hits)) if hits else np.empty(0, dtype=np.int32)
+            result = ids if result is None else np.intersect1d(result, ids, assume_unique=True)
+            if not len(result):
+                break
+        return self.all() if result is None else result
+
+    def match_any(self, phrases: List[str],
+                  fields: Tuple[str, ...] = ('title', 'abstract'),
+                  prefix: bool = True) -> np.ndarray:
+        """Documents matching at least one of `phrases`; a trailing '*' makes a phrase a prefix."""
+        hits = [self.match(p, fields, prefix or p.endswith('*')) for p in phrases if tokenize(p)]
+        if not hits:
+            return self.all()
+        return np.unique(np.concatenate(hits))
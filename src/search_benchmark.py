@@ -0,0 +1,152 @@
+# src/search_benchmark.py
+import argparse
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.search import SearchIndex, preprocess_text
+
+DEFAULT_SIZES = [600, 5000, 20000, 100000]
+DEFAULT_QUERIES = [
+    "microgravity bone loss",
+    "radiation",
+    "plant growth",
+    "immune response in mice",
+    "iss"
+]
+
+# Domain words mixed into the synthetic text so the queries have hits
+DOMAIN_TERMS = ['microgravity', 'radiation', 'bone', 'loss', 'plant', 'growth', 'immune',
+                'response', 'mice', 'spaceflight', 'astronaut', 'muscle', 'cosmic', 'iss',
+                'arabidopsis', 'gene', 'expression', 'mars', 'lunar', 'habitat']
+ORGANISMS = ['mice', 'rats', 'humans', 'arabidopsis', 'yeast', 'bacteria']
+EXPERIMENT_TYPES = ['microgravity', 'radiation', 'bone loss', 'immune response', 'genomics']
+MISSIONS = ['ISS', 'Shuttle', 'Bion-M1', 'Artemis']
+
+def synthetic_publications(n: int, seed: int = 0, vocab_size: int = 5000,
+                           title_words: int = 10, abstract_words: int = 150) -> pd.DataFrame:
+    """
+    Publications frame of `n` rows with random text and metadata.
+
+    Words follow a Zipf-like distribution over a synthetic vocabulary plus
+    the domain terms, so the TF-IDF matrix has a realistic sparsity.
+    """
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    filler = {''.join(rng.choice(letters, rng.integers(4, 10))) for _ in range(vocab_size)}
+    vocab = np.array(DOMAIN_TERMS + sorted(filler - set(DOMAIN_TERMS)))
+    weights = 1.0 / np.arange(1, len(vocab) + 1)
+    weights /= weights.sum()
+
+    def text(words: int) -> List[str]:
+        tokens = rng.choice(vocab, size=(n, words), p=weights)
+        return [' '.join(row) for row in tokens]
+
+    def terms(choices: List[str]) -> List[List[str]]:
+        picks = rng.random((n, len(choices))) < 0.2
+        return [[c for c, keep in zip(choices, row) if keep] for row in picks]
+
+    return pd.DataFrame({
+        'title': text(title_words),
+        'abstract': text(abstract_words),
+        'link': [f"https://example.org/{i}" for i in range(n)],
+        'organisms': terms(ORGANISMS),
+        'experiment_types': terms(EXPERIMENT_TYPES),
+        'missions': terms(MISSIONS)
+    })
+
+def row_by_row_scores(frame: pd.DataFrame, query: str, index: SearchIndex) -> np.ndarray:
+    """
+    Scores computed the way `search_publications` used to: one transform and
+    cosine similarity per row through `df.apply`, with string boost checks.
+    """
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    processed_query = preprocess_text(query)
+    vectorizer = index.vectorizer
+
+    def score(row: pd.Series) -> float:
+        text = (row['title'] + " ") * 2 + (row['abstract'] + " ")
+        similarity = cosine_similarity(vectorizer.transform([processed_query]),
+                                       vectorizer.transform([text]))[0][0]
+        boost = 1.0
+        for column, weight in SearchIndex.METADATA_BOOSTS.items():
+            if processed_query in str(row[column]).lower():
+                boost += weight
+        return similarity * boost
+
+    return frame.apply(score, axis=1).to_numpy()
+
+def benchmark(sizes: List[int], queries: List[str], k: int = 10,
+              baseline_max: int = 2000, seed: int = 0) -> List[Dict[str, Optional[float]]]:
+    """
+    Build time and per-query latency of the SearchIndex at each corpus size.
+
+    Sizes up to `baseline_max` are also scored row by row, reporting that
+    latency and how many of the index's top-k the old ranking agrees on.
+    """
+    # Import scikit-learn up front so the first build is not charged for it
+    from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: F401
+
+    rows = []
+    for n in sizes:
+        df = synthetic_publications(n, seed)
+        started = time.perf_counter()
+        index = SearchIndex.build(df)
+        build_s = time.perf_counter() - started
+
+        latencies = []
+        for query in queries:
+            started = time.perf_counter()
+            index.query(query, k=k)
+            latencies.append(time.perf_counter() - started)
+
+        row = {
+            'publications': n,
+            'build_s': build_s,
+            'query_p50_ms': float(np.percentile(latencies, 50)) * 1e3,
+            'query_max_ms': max(latencies) * 1e3,
+            'row_by_row_ms': None,
+            'top_k_agreement': None
+        }
+        if n <= baseline_max:
+            query = queries[0]
+            started = time.perf_counter()
+            baseline = row_by_row_scores(index.frame, query, index)
+            row['row_by_row_ms'] = (time.perf_counter() - started) * 1e3
+            expected = SearchIndex.top_k(baseline, baseline > 0, k)
+            found = index.query(query, k=k).index.to_numpy()
+            row['top_k_agreement'] = len(np.intersect1d(expected, found)) / max(len(expected), 1)
+        rows.append(row)
+    return rows
+
+def report(rows: List[Dict[str, Optional[float]]]) -> str:
+    """Markdown table of benchmark rows"""
+    def cell(value) -> str:
+        if value is None:
+            return 'skipped'
+        return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+    columns = list(rows[0])
+    lines = ['| ' + ' | '.join(columns) + ' |', '|' + '---|' * len(columns)]
+    lines += ['| ' + ' | '.join(cell(row[c]) for c in columns) + ' |' for row in rows]
+    return '\n'.join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark search scaling on synthetic publications")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--baseline-max", type=int, default=2000,
+                        help="Largest corpus also scored row by row (slow)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    text = report(benchmark(args.sizes, args.queries, args.k, args.baseline_max, args.seed))
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
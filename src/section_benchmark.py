@@ -0,0 +1,142 @@
+# src/section_benchmark.py
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.preprocess import SectionExtractor
+
+DEFAULT_SIZES = [20, 100, 400]  # body sections per synthetic article
+CHUNK_SIZE = 64 * 1024  # bytes per network read, as in fetch_publication_content
+
+def synthetic_article(sections: int, depth: int = 6, paragraphs: int = 4, seed: int = 0) -> str:
+    """
+    PMC-like article page with `sections` body sections, each wrapped in
+    `depth` nested divs, plus abstract, results and discussion sections.
+    """
+    rng = np.random.default_rng(seed)
+    words = np.array(['microgravity', 'bone', 'cells', 'expression', 'flight', 'ground',
+                      'control', 'samples', 'analysis', 'increased', 'reduced', 'mice'])
+
+    def paragraph() -> str:
+        return f"<p>{' '.join(rng.choice(words, 60))}.</p>"
+
+    def section(heading: str) -> str:
+        body = ''.join(paragraph() for _ in range(paragraphs))
+        inner = f"<h2>{heading}</h2>{body}"
+        for level in range(depth):
+            inner = f'<div class="level-{level}">{inner}</div>'
+        return f"<section>{inner}</section>"
+
+    parts = [
+        "<html><head><title>Article</title><script>var tracking = {};</script></head><body>",
+        '<nav><div class="menu"><a href="/">Home</a></div></nav>',
+        f'<section id="abstract"><h2>Abstract</h2>{paragraph()}</section>'
+    ]
+    parts += [section(f"Methods part {i}") for i in range(sections // 2)]
+    parts.append(section("Results"))
+    parts += [section(f"Supplementary part {i}") for i in range(sections - sections // 2)]
+    parts.append(section("Discussion"))
+    parts.append("</body></html>")
+    return ''.join(parts)
+
+def chunked(html: str, size: int = CHUNK_SIZE) -> List[str]:
+    """The page split into network-sized chunks"""
+    return [html[i:i + size] for i in range(0, len(html), size)]
+
+def soup_sections(chunks: Iterable[str]) -> Tuple[str, str, str]:
+    """
+    The extraction used before SectionExtractor: buffer the whole page,
+    build a BeautifulSoup tree and call get_text() on every section and div.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(''.join(chunks), 'html.parser')
+    results = conclusion = abstract = ""
+    abstract_elem = soup.find('section', {'id': 'abstract'}) or soup.find('div', {'class': 'abstract'})
+    if abstract_elem:
+        abstract = abstract_elem.get_text(strip=True)
+    for section in soup.find_all(['section', 'div']):
+        text = section.get_text(strip=True).lower()
+        if 'results' in text[:20]:
+            results = section.get_text(strip=True)
+        elif 'conclusion' in text[:20] or 'discussion' in text[:20]:
+            conclusion = section.get_text(strip=True)
+    return abstract, results, conclusion
+
+def streaming_sections(chunks: Iterable[str]) -> Tuple[str, str, str]:
+    """SectionExtractor fed chunk by chunk, as fetch_publication_content does"""
+    extractor = SectionExtractor()
+    for chunk in chunks:
+        extractor.feed(chunk)
+    extractor.close()
+    sections = extractor.sections
+    return sections['abstract'], sections['results'], sections['conclusion']
+
+EXTRACTORS: Dict[str, Callable[[Iterable[str]], Tuple[str, str, str]]] = {
+    'beautifulsoup': soup_sections,
+    'streaming': streaming_sections
+}
+
+def measure(extract: Callable[[Iterable[str]], Tuple[str, str, str]], chunks: List[str],
+            repeats: int = 3) -> Tuple[float, int, Tuple[str, str, str]]:
+    """Best time in seconds, peak traced bytes and the extracted sections"""
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        extract(chunks)
+        times.append(time.perf_counter() - started)
+
+    # Peak memory is traced in a separate run so tracing does not skew the timings
+    tracemalloc.start()
+    try:
+        sections = extract(chunks)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), peak, sections
+
+def benchmark(sizes: List[int], depth: int = 6, repeats: int = 3) -> List[Dict[str, object]]:
+    """Time and peak memory per article for each extractor and article size"""
+    rows = []
+    for size in sizes:
+        chunks = chunked(synthetic_article(size, depth))
+        page_kb = sum(len(c) for c in chunks) / 1024
+        for name, extract in EXTRACTORS.items():
+            seconds, peak, sections = measure(extract, chunks, repeats)
+            rows.append({
+                'sections': size,
+                'page_kb': page_kb,
+                'extractor': name,
+                'ms_per_article': seconds * 1e3,
+                'peak_kb': peak / 1024,
+                'found': ', '.join(k for k, text in zip(('abstract', 'results', 'conclusion'), sections)
+                                   if text)
+            })
+    return rows
+
+def report(rows: List[Dict[str, object]]) -> str:
+    """Markdown table of benchmark rows"""
+    columns = list(rows[0])
+    cell = lambda v: f"{v:.1f}" if isinstance(v, float) else str(v)
+    lines = ['| ' + ' | '.join(columns) + ' |', '|' + '---|' * len(columns)]
+    lines += ['| ' + ' | '.join(cell(row[c]) for c in columns) + ' |' for row in rows]
+    return '\n'.join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare section extraction time and peak memory per article")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Body sections per synthetic article")
+    parser.add_argument("--depth", type=int, default=6, help="Nested divs around each section")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    text = report(benchmark(args.sizes, args.depth, args.repeats))
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
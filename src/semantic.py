@@ -0,0 +1,332 @@
+# src/semantic.py
+import argparse
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.search import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+EMBEDDINGS_PATH = "data/embeddings.npy"
+ANN_INDEX_PATH = "data/embeddings_ivf.npz"
+META_PATH = "data/embeddings_meta.json"
+
+class StaleIndexError(Exception):
+    """The saved embeddings were built from a different version of the corpus"""
+
+def embedding_key(df: pd.DataFrame, model_name: str = DEFAULT_MODEL) -> str:
+    """Hash of the encoded text and model, identifying which corpus the vectors belong to"""
+    digest = hashlib.sha256(model_name.encode('utf-8'))
+    text = (df['title'].fillna('') + '. ' + df['abstract'].fillna('')).tolist()
+    digest.update('\n'.join(pd.util.hash_array(np.array(text, dtype=object)).astype(str))
+                  .encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+@lru_cache(maxsize=2)
+def load_encoder(model_name: str = DEFAULT_MODEL):
+    """Load a sentence-transformers model once per process"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+def encode_texts(texts: List[str], model_name: str = DEFAULT_MODEL,
+                 batch_size: int = 64) -> np.ndarray:
+    """Encode texts into unit-length float32 vectors"""
+    model = load_encoder(model_name)
+    vectors = model.encode(
+        texts,
+        batch_size=batch_size,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        show_progress_bar=len(texts) > batch_size
+    )
+    return vectors.astype(np.float32, copy=False)
+
+def build_embeddings(df: pd.DataFrame, output_path: str = EMBEDDINGS_PATH,
+                     model_name: str = DEFAULT_MODEL, batch_size: int = 64) -> np.ndarray:
+    """Encode title + abstract for every row and save them as float16 .npy"""
+    texts = (df['title'].fillna('') + '. ' + df['abstract'].fillna('')).tolist()
+    logger.info(f"Encoding {len(texts)} publications with {model_name}")
+    vectors = encode_texts(texts, model_name, batch_size).astype(np.float16)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    np.save(output_path, vectors)
+    return vectors
+
+def load_embeddings(path: str = EMBEDDINGS_PATH) -> np.ndarray:
+    """Memory-map a saved embedding matrix"""
+    return np.load(path, mmap_mode='r')
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first"""
+    if k < len(scores):
+        part = np.argpartition(-scores, k - 1)[:k]
+    else:
+        part = np.arange(len(scores))
+    return part[np.argsort(-scores[part], kind='stable')]
+
+class IVFIndex:
+    """
+    Inverted-file ANN index over unit-length vectors.
+
+    Vectors are bucketed by their nearest k-means centroid; a query only
+    scores the vectors in its `nprobe` closest buckets.
+    """
+
+    def __init__(self, centroids: np.ndarray, order: np.ndarray, offsets: np.ndarray):
+        self.centroids = centroids
+        self.order = order
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, vectors: np.ndarray, nlist: Optional[int] = None,
+              n_iter: int = 10, seed: int = 0) -> 'IVFIndex':
+        """Train centroids with spherical k-means and assign every vector"""
+        n = len(vectors)
+        nlist = nlist or max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        sample = np.asarray(vectors[rng.choice(n, size=min(n, nlist * 64), replace=False)],
+                            dtype=np.float32)
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+
+        for _ in range(n_iter):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = sample[assign == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+            centroids /= np.linalg.norm(centroids, axis=1, keepdims=True) + 1e-12
+
+        assign = np.concatenate([
+            np.argmax(np.asarray(vectors[i:i + 8192], dtype=np.float32) @ centroids.T, axis=1)
+            for i in range(0, n, 8192)
+        ])
+        order = np.argsort(assign, kind='stable').astype(np.int64)
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=nlist), out=offsets[1:])
+        return cls(centroids, order, offsets)
+
+    def save(self, path: str = ANN_INDEX_PATH) -> None:
+        np.savez(path, centroids=self.centroids, order=self.order, offsets=self.offsets)
+
+    @classmethod
+    def load(cls, path: str = ANN_INDEX_PATH) -> 'IVFIndex':
+        data = np.load(path)
+        return cls(data['centroids'], data['order'], data['offsets'])
+
+    def candidates(self, query: np.ndarray, nprobe: int = 8) -> np.ndarray:
+        """Vector ids stored in the `nprobe` buckets closest to the query"""
+        nprobe = min(nprobe, len(self.centroids))
+        lists = _top_k(self.centroids @ query, nprobe)
+        return np.concatenate([self.order[self.offsets[c]:self.offsets[c + 1]] for c in lists])
+
+class SemanticIndex:
+    """
+    Embedding vectors plus an IVF index, aligned by row with the corpus frame.
+
+    `ids` are the publication ids of the rows the vectors were built from and
+    `key` the `embedding_key` of that frame; `check` compares both against a
+    corpus before row positions are used to address it.
+    """
+
+    def __init__(self, vectors: np.ndarray, ann: IVFIndex, model_name: str = DEFAULT_MODEL,
+                 ids: Optional[List[str]] = None, key: Optional[str] = None):
+        self.vectors = vectors
+        self.ann = ann
+        self.model_name = model_name
+        self.ids = ids
+        self.key = key
+
+    def save_meta(self, path: str = META_PATH) -> None:
+        """Write the model, corpus key and row ids the vectors belong to"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'model': self.model_name, 'key': self.key, 'ids': self.ids}, f)
+
+    @classmethod
+    def load(cls, embeddings_path: str = EMBEDDINGS_PATH, index_path: str = ANN_INDEX_PATH,
+             meta_path: str = META_PATH) -> 'SemanticIndex':
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        return cls(load_embeddings(embeddings_path), IVFIndex.load(index_path),
+                   meta['model'], meta['ids'], meta['key'])
+
+    def check(self, ids: List[str], key: str) -> None:
+        """Raise StaleIndexError unless the index was built from this corpus"""
+        if self.ids is None or len(self.ids) != len(self.vectors) or len(self.ann.order) != len(self.vectors):
+            raise StaleIndexError("Embeddings, ANN index and metadata are out of sync")
+        if self.key != key or self.ids != list(ids):
+            raise StaleIndexError("Embeddings were built from a different corpus version")
+
+    def encode_query(self, query: str) -> np.ndarray:
+        return encode_texts([query], self.model_name)[0]
+
+    def search_vector(self, query_vec: np.ndarray, k: int = 10,
+                      nprobe: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k rows by cosine similarity"""
+        # Sorted ids keep the reads from the memory-mapped matrix sequential
+        ids = np.sort(self.ann.candidates(query_vec, nprobe))
+        scores = np.asarray(self.vectors[ids], dtype=np.float32) @ query_vec
+        best = _top_k(scores, k)
+        return ids[best], scores[best]
+
+    def brute_force(self, query_vec: np.ndarray, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact top-k rows by cosine similarity"""
+        scores = np.asarray(self.vectors, dtype=np.float32) @ query_vec
+        best = _top_k(scores, k)
+        return best, scores[best]
+
+    def search(self, query: str, k: int = 10, nprobe: int = 8,
+               lexical: Optional[SearchIndex] = None,
+               hybrid_weight: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank rows for a free-text query.
+
+        Args:
+            query: Search query string
+            k: Number of results
+            nprobe: Number of IVF buckets to scan
+            lexical: SearchIndex over the same frame, used for hybrid scoring
+            hybrid_weight: Weight of the TF-IDF score in [0, 1]; 0 is purely semantic
+
+        Returns:
+            Tuple of (row positions, scores), best first
+        """
+        query_vec = self.encode_query(query)
+        if lexical is None or hybrid_weight <= 0:
+            return self.search_vector(query_vec, k, nprobe)
+
+        # Re-rank the union of both candidate pools on the blended score
+        pool = max(k * 4, 50)
+        semantic_ids, _ = self.search_vector(query_vec, pool, nprobe)
+        lexical_scores = lexical.scores(query)
+        ids = np.union1d(semantic_ids, _top_k(lexical_scores, pool))
+        semantic_scores = np.asarray(self.vectors[ids], dtype=np.float32) @ query_vec
+        blended = (1 - hybrid_weight) * semantic_scores + hybrid_weight * lexical_scores[ids]
+        best = _top_k(blended, k)
+        return ids[best], blended[best]
+
+# Free-text queries for measuring recall on real questions rather than stored vectors
+EVAL_QUERIES = [
+    "bone loss in microgravity",
+    "effects of spaceflight on the immune system",
+    "plant growth on the International Space Station",
+    "cosmic radiation DNA damage",
+    "muscle atrophy in mice after spaceflight",
+    "gene expression changes in Arabidopsis",
+    "astronaut cardiovascular health",
+    "microbial biofilms in spacecraft",
+    "sleep and circadian rhythm during missions",
+    "stem cell differentiation in simulated microgravity"
+]
+
+def recall_at_k(index: SemanticIndex, query_vecs: np.ndarray, k: int = 10,
+                nprobe: int = 8) -> float:
+    """
+    Fraction of exact top-k neighbours that the ANN search also returns.
+
+    The queries must not be vectors stored in the index: a stored vector
+    always finds itself in its own bucket, which inflates the figure. Use
+    encoded query texts or `holdout_recall`.
+    """
+    found = 0
+    for query_vec in query_vecs:
+        approx, _ = index.search_vector(query_vec, k, nprobe)
+        exact, _ = index.brute_force(query_vec, k)
+        found += len(np.intersect1d(approx, exact))
+    return found / (k * len(query_vecs))
+
+def holdout_recall(vectors: np.ndarray, n_queries: int = 100, k: int = 10, nprobe: int = 8,
+                   nlist: Optional[int] = None, seed: int = 0) -> float:
+    """
+    recall@k of an IVF index built without `n_queries` random rows, queried with those rows.
+
+    Held-out vectors have no exact copy in the index, so this measures how
+    much of the true neighbourhood survives bucketing and probing.
+    """
+    rng = np.random.default_rng(seed)
+    held_out = np.zeros(len(vectors), dtype=bool)
+    held_out[rng.choice(len(vectors), size=min(n_queries, len(vectors) - k), replace=False)] = True
+    kept = np.asarray(vectors[~held_out], dtype=np.float32)
+    index = SemanticIndex(kept, IVFIndex.build(kept, nlist=nlist, seed=seed))
+    return recall_at_k(index, np.asarray(vectors[held_out], dtype=np.float32), k, nprobe)
+
+def build_semantic_index(corpus, model_name: str = DEFAULT_MODEL, batch_size: int = 64,
+                         nlist: Optional[int] = None) -> SemanticIndex:
+    """Encode a corpus and save its embeddings, ANN index and metadata"""
+    vectors = build_embeddings(corpus.frame, EMBEDDINGS_PATH, model_name, batch_size)
+    ann = IVFIndex.build(vectors, nlist=nlist)
+    ann.save(ANN_INDEX_PATH)
+    index = SemanticIndex(load_embeddings(EMBEDDINGS_PATH), ann, model_name,
+                          corpus.ids, embedding_key(corpus.frame, model_name))
+    index.save_meta(META_PATH)
+    _load_index.cache_clear()
+    return index
+
+@lru_cache(maxsize=1)
+def _load_index(meta_mtime: float) -> SemanticIndex:
+    return SemanticIndex.load(EMBEDDINGS_PATH, ANN_INDEX_PATH, META_PATH)
+
+@lru_cache(maxsize=4)
+def _corpus_key(corpus, model_name: str) -> str:
+    return embedding_key(corpus.frame, model_name)
+
+def index_for(corpus) -> SemanticIndex:
+    """
+    The saved semantic index, checked against `corpus`.
+
+    Raises StaleIndexError when the corpus was re-ingested since the
+    embeddings were built; rebuild them with `python -m src.semantic`.
+    """
+    index = _load_index(os.path.getmtime(META_PATH))
+    index.check(corpus.ids, _corpus_key(corpus, index.model_name))
+    return index
+
+def semantic_search(query: str, k: int = 10, corpus=None,
+                    hybrid_weight: float = 0.0) -> pd.DataFrame:
+    """
+    Semantic search over publications using the prebuilt embedding index.
+
+    Args:
+        query: Search query string
+        k: Number of results
+        corpus: Corpus the embeddings were built from; the app's corpus by default
+        hybrid_weight: Weight of the corpus's TF-IDF score in [0, 1]
+
+    Returns:
+        DataFrame of the top-k publications with a `semantic_score` column
+    """
+    if corpus is None:
+        from src.corpus import get_corpus
+        corpus = get_corpus()
+    if not query.strip():
+        return corpus.frame.head(0)
+    lexical = corpus.search_index() if hybrid_weight > 0 else None
+    ids, scores = index_for(corpus).search(query, k, lexical=lexical,
+                                           hybrid_weight=hybrid_weight)
+    results = corpus.rows(ids).copy()
+    results['semantic_score'] = scores
+    return results
+
+if __name__ == "__main__":
+    from src.corpus import CORPUS_CSV, get_corpus
+
+    parser = argparse.ArgumentParser(description="Build publication embeddings and ANN index")
+    parser.add_argument("--csv", default=CORPUS_CSV)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--nlist", type=int, default=None)
+    args = parser.parse_args()
+
+    index = build_semantic_index(get_corpus(args.csv), args.model, args.batch_size, args.nlist)
+    queries = encode_texts(EVAL_QUERIES, args.model)
+    print(f"Indexed {len(index.vectors)} publications")
+    print(f"recall@10 on {len(EVAL_QUERIES)} text queries = {recall_at_k(index, queries):.3f}")
+    print(f"recall@10 on 100 held-out publications = "
+          f"{holdout_recall(index.vectors, nlist=args.nlist):.3f}")
@@ -1,13 +1,26 @@
 # summarizer.py
 import os
+import time
+import asyncio
+import weakref
 import openai
-import requests
-import subprocess
+import httpx
 import json
-from typing import Optional, Dict, Any, Tuple
+import logging
+from typing import Optional, Dict, Any, Tuple, List, AsyncIterator, Iterator, Awaitable, Callable
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from src.summary_cache import SummaryCache, get_summary_cache
+from src.router import Backend, Router
+from src.async_runtime import iterate_sync, run_sync, SingleFlight, AdmissionController, AdmissionRejected
+from src.context import pack_sections, content_budget
+
+logger = logging.getLogger(__name__)
+
+# Default model accepts JSON-schema response formats, see OPENAI_STRUCTURED_PREFIXES
+OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+OLLAMA_MODEL = "gpt-oss:20b-cloud"
 
 @dataclass
 class SummaryResult:
@@ -21,69 +34,104 @@ class SummaryResult:
     generated_at: datetime
     model_used: str
     error: Optional[str] = None
+    text: str = ""  # raw completion, the answer itself for `task` prompts
+
+def summary_to_dict(result: SummaryResult) -> Dict[str, Any]:
+    """Serialize a SummaryResult to JSON-compatible values"""
+    payload = asdict(result)
+    payload['generated_at'] = result.generated_at.isoformat()
+    return payload
+
+def summary_from_dict(payload: Dict[str, Any]) -> SummaryResult:
+    """Rebuild a SummaryResult serialized by summary_to_dict"""
+    payload = dict(payload)
+    payload['generated_at'] = datetime.fromisoformat(payload['generated_at'])
+    return SummaryResult(**payload)
+
+# Patterns for section headers
+SECTION_PATTERNS = {
+    'introduction': r'(?i)introduction:|background:|overview:',
+    'methods': r'(?i)methods:|methodology:|materials and methods:',
+    'results': r'(?i)results:|findings:|outcomes:',
+    'conclusion': r'(?i)conclusion:|discussion:|summary:'
+}
+
+# All section headers as one alternation, so a single scan finds them in order
+SECTION_HEADER = re.compile('|'.join(f'(?P<{name}>{pattern[4:]})'
+                                     for name, pattern in SECTION_PATTERNS.items()), re.IGNORECASE)
 
 def extract_sections(text: str) -> Dict[str, str]:
-    """Extract structured sections from text using regex"""
-    sections = {
-        'introduction': '',
-        'methods': '',
-        'results': '',
-        'conclusion': '',
-    }
+    """Extract structured sections from text in a single pass over the headers"""
+    sections = {name: '' for name in SECTION_PATTERNS}
     
-    # Patterns for section headers
-    patterns = {
-        'introduction': r'(?i)introduction:|background:|overview:',
-        'methods': r'(?i)methods:|methodology:|materials and methods:',
-        'results': r'(?i)results:|findings:|outcomes:',
-        'conclusion': r'(?i)conclusion:|discussion:|summary:'
-    }
-    
-    # Find all section starts
-    section_starts = []
-    for section, pattern in patterns.items():
-        matches = list(re.finditer(pattern, text))
-        for match in matches:
-            section_starts.append((match.start(), section))
-    
-    # Sort by position in text
-    section_starts.sort()
-    
-    # Extract content between sections
-    for i, (start, section) in enumerate(section_starts):
-        end = section_starts[i + 1][0] if i < len(section_starts) - 1 else len(text)
-        content = text[start:end].strip()
-        # Remove the header
-        content = re.sub(patterns[section], '', content, flags=re.IGNORECASE).strip()
-        sections[section] = content
+    current = None  # (section, content start) of the header being read
+    for match in SECTION_HEADER.finditer(text):
+        if current:
+            sections[current[0]] = text[current[1]:match.start()].strip()
+        current = (match.lastgroup, match.end())
+    if current:
+        sections[current[0]] = text[current[1]:].strip()
     
     return sections
 
-def prepare_prompt(title: str, abstract: str, 
-                  results: Optional[str] = None, 
-                  conclusion: Optional[str] = None) -> str:
-    """Prepare a structured prompt for the AI model"""
-    prompt = f"""Analyze the following space biology research publication:
+def extract_key_findings(text: str) -> List[str]:
+    """Bullet points ("•") in the text, one finding per bullet"""
+    findings = []
+    for line in text.splitlines():
+        findings.extend(part.strip() for part in line.split('•')[1:] if part.strip())
+    return findings
 
-Title: {title}
-
-Please provide a comprehensive yet concise summary in the following format:
+SUMMARY_TASK = """Please provide a comprehensive yet concise summary in the following format:
 
 1. Introduction: Key background and objectives
 2. Methods: Main experimental approach
 3. Results: Key findings and data
 4. Conclusion: Main implications and impact
 5. Key Findings: List 3-5 bullet points
-6. Space Mission Relevance: How this research applies to future space missions
+6. Space Mission Relevance: How this research applies to future space missions"""
+
+def prepare_prompt(title: str, abstract: str,
+                  results: Optional[str] = None,
+                  conclusion: Optional[str] = None,
+                  model: str = OPENAI_MODEL, structured: bool = False,
+                  task: Optional[str] = None) -> str:
+    """
+    Prepare a structured prompt for the AI model.
+
+    Only the publication text (abstract, results, conclusion) is packed to
+    the model's content budget. `task` replaces the default summary format
+    with other instructions, such as a reader's question; it is added
+    verbatim after the content.
+    """
+    packed = pack_sections(
+        {'abstract': abstract or '', 'results': results or '', 'conclusion': conclusion or ''},
+        content_budget(model), model
+    )
+    abstract, results, conclusion = packed['abstract'], packed['results'], packed['conclusion']
+
+    if task is None:
+        prompt = f"""Analyze the following space biology research publication:
+
+Title: {title}
+
+{SUMMARY_TASK}
 
 Content to analyze:
 {abstract}
 
 """
+    else:
+        prompt = f"Title: {title}\n"
+        if abstract:
+            prompt += f"\nContent to analyze:\n{abstract}\n"
     if results:
         prompt += f"\nDetailed Results:\n{results}\n"
     if conclusion:
         prompt += f"\nDetailed Conclusion:\n{conclusion}\n"
+    if task is not None:
+        prompt += f"\n{task}\n"
+    if structured:
+        prompt += "\nRespond with a JSON object holding one field per part of the format above.\n"
     
     return prompt
 
@@ -108,136 +156,555 @@ def calculate_space_relevance(summary: str) -> float:
     # Normalize to 0-1 range
     return min(score / 10.0, 1.0)
 
+def build_summary(summary_text: str, model: str) -> SummaryResult:
+    """Parse raw model output into a SummaryResult"""
+    sections = extract_sections(summary_text)
+
+    # Extract key findings
+    key_findings = extract_key_findings(summary_text)
+
+    relevance = calculate_space_relevance(summary_text)
+
+    return SummaryResult(
+        introduction=sections['introduction'],
+        methods=sections['methods'],
+        results=sections['results'],
+        conclusion=sections['conclusion'],
+        key_findings=key_findings,
+        relevance_score=relevance,
+        generated_at=datetime.now(),
+        model_used=model,
+        text=summary_text
+    )
+
+def error_summary(model: str, error: str) -> SummaryResult:
+    """Empty SummaryResult carrying an error message"""
+    return SummaryResult(
+        introduction="",
+        methods="",
+        results="",
+        conclusion="",
+        key_findings=[],
+        relevance_score=0.0,
+        generated_at=datetime.now(),
+        model_used=model,
+        error=error
+    )
+
+# JSON schema for structured-output mode; fills SummaryResult without text parsing
+SUMMARY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "introduction": {"type": "string"},
+        "methods": {"type": "string"},
+        "results": {"type": "string"},
+        "conclusion": {"type": "string"},
+        "key_findings": {"type": "array", "items": {"type": "string"}},
+        "space_mission_relevance": {"type": "string"}
+    },
+    "required": ["introduction", "methods", "results", "conclusion",
+                 "key_findings", "space_mission_relevance"],
+    "additionalProperties": False
+}
+
+# OpenAI models that accept response_format={"type": "json_schema"}
+OPENAI_STRUCTURED_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+STRUCTURED_OUTPUT = os.environ.get("STRUCTURED_OUTPUT", "1") != "0"
+STRUCTURED_ATTEMPTS = 2  # one retry before falling back to the text parser
+
+# Parse outcomes since start-up, see parse_stats()
+PARSE_STATS = {
+    'structured_ok': 0,
+    'structured_failures': 0,
+    'retries': 0,
+    'fallbacks': 0,
+    'text_ok': 0,
+    'text_empty': 0,
+    'schema_rejected': 0
+}
+
+def supports_structured_output(method: str, model: str) -> bool:
+    """Whether the backend can be asked for schema-constrained JSON"""
+    if not STRUCTURED_OUTPUT:
+        return False
+    if method == "openai":
+        return model.startswith(OPENAI_STRUCTURED_PREFIXES)
+    # Ollama accepts a JSON schema in `format` for every model
+    return method == "ollama"
+
+def parse_structured_summary(text: str, model: str) -> Optional[SummaryResult]:
+    """SummaryResult from a schema-constrained JSON reply, or None if it does not parse"""
+    try:
+        data = json.loads(text)
+        sections = {name: str(data[name]).strip() for name in SECTION_PATTERNS}
+        key_findings = [str(f).strip() for f in data['key_findings'] if str(f).strip()]
+        relevance_text = str(data['space_mission_relevance'])
+    except (ValueError, KeyError, TypeError):
+        return None
+    return SummaryResult(
+        **sections,
+        key_findings=key_findings,
+        relevance_score=calculate_space_relevance(
+            ' '.join([*sections.values(), *key_findings, relevance_text])
+        ),
+        generated_at=datetime.now(),
+        model_used=model,
+        text=text
+    )
+
+async def generate_summary(complete: Callable[[bool], Awaitable[str]], model: str,
+                           structured: bool) -> SummaryResult:
+    """
+    Run a backend completion and turn it into a SummaryResult.
+
+    In structured mode the JSON reply fills the result directly; a reply
+    that does not parse is retried once and then handed to the text parser.
+    """
+    if structured:
+        for attempt in range(STRUCTURED_ATTEMPTS):
+            text = await complete(True)
+            summary = parse_structured_summary(text, model)
+            if summary is not None:
+                PARSE_STATS['structured_ok'] += 1
+                return summary
+            PARSE_STATS['structured_failures'] += 1
+            if attempt + 1 < STRUCTURED_ATTEMPTS:
+                PARSE_STATS['retries'] += 1
+        PARSE_STATS['fallbacks'] += 1
+        return build_summary(text, model)
+
+    summary = build_summary(await complete(False), model)
+    if any([summary.introduction, summary.methods, summary.results, summary.conclusion]):
+        PARSE_STATS['text_ok'] += 1
+    else:
+        PARSE_STATS['text_empty'] += 1
+    return summary
+
+def parse_stats() -> Dict[str, float]:
+    """Parse failure and retry rates for structured and text output modes"""
+    structured = PARSE_STATS['structured_ok'] + PARSE_STATS['fallbacks']
+    text = PARSE_STATS['text_ok'] + PARSE_STATS['text_empty']
+    return {
+        **PARSE_STATS,
+        'structured_failure_rate': PARSE_STATS['fallbacks'] / structured if structured else 0.0,
+        'structured_retry_rate': PARSE_STATS['retries'] / structured if structured else 0.0,
+        'text_empty_rate': PARSE_STATS['text_empty'] / text if text else 0.0
+    }
+
 async def summarize_with_openai(title: str, abstract: str, 
                               results: Optional[str] = None, 
                               conclusion: Optional[str] = None) -> SummaryResult:
-    """Generate summary using OpenAI's GPT-4"""
+    """Generate summary using the configured OpenAI chat model"""
     try:
-        prompt = prepare_prompt(title, abstract, results, conclusion)
-        
-        response = await openai.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a space biology research expert."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.5,
-            max_tokens=1000
-        )
-        
-        summary_text = response.choices[0].message.content
-        sections = extract_sections(summary_text)
+        structured = supports_structured_output("openai", OPENAI_MODEL)
+        prompt = prepare_prompt(title, abstract, results, conclusion, OPENAI_MODEL, structured)
         
-        # Extract key findings
-        key_findings = re.findall(r'(?<=•)(.*?)(?=(?:•|\n|$))', summary_text)
-        key_findings = [finding.strip() for finding in key_findings if finding.strip()]
+        async def complete(structured: bool) -> str:
+            extra = {}
+            if structured:
+                extra["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": {"name": "publication_summary", "schema": SUMMARY_SCHEMA, "strict": True}
+                }
+            response = await get_openai_client().chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": "You are a space biology research expert."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.5,
+                max_tokens=1000,
+                **extra
+            )
+            return response.choices[0].message.content or ""
         
-        relevance = calculate_space_relevance(summary_text)
-        
-        return SummaryResult(
-            introduction=sections['introduction'],
-            methods=sections['methods'],
-            results=sections['results'],
-            conclusion=sections['conclusion'],
-            key_findings=key_findings,
-            relevance_score=relevance,
-            generated_at=datetime.now(),
-            model_used="gpt-4"
-        )
+        return await generate_summary(complete, OPENAI_MODEL, structured)
         
     except Exception as e:
-        return SummaryResult(
-            introduction="",
-            methods="",
-            results="",
-            conclusion="",
-            key_findings=[],
-            relevance_score=0.0,
-            generated_at=datetime.now(),
-            model_used="gpt-4",
-            error=str(e)
+        return error_summary(OPENAI_MODEL, str(e))
+
+# OpenAI client settings
+OPENAI_TIMEOUT = float(os.environ.get("OPENAI_TIMEOUT", "60"))
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", "3"))
+
+# Async clients are bound to the loop they first run on. The pages submit all
+# work to the shared background loop, so in the app this is a single
+# long-lived client; standalone jobs running their own loop get their own.
+_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = \
+    weakref.WeakKeyDictionary()
+
+def get_openai_client() -> openai.AsyncOpenAI:
+    """Pooled async OpenAI client for the running loop"""
+    loop = asyncio.get_running_loop()
+    if loop not in _openai_clients:
+        _openai_clients[loop] = openai.AsyncOpenAI(
+            timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=5.0),
+            max_retries=OPENAI_MAX_RETRIES,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            )
+        )
+    return _openai_clients[loop]
+
+# Ollama server settings; OLLAMA_HOST follows the Ollama CLI convention
+OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+if "://" not in OLLAMA_HOST:
+    OLLAMA_HOST = f"http://{OLLAMA_HOST}"
+OLLAMA_KEEP_ALIVE = os.environ.get("OLLAMA_KEEP_ALIVE", "30m")  # keep the model resident between calls
+OLLAMA_TIMEOUT = float(os.environ.get("OLLAMA_TIMEOUT", "120"))
+
+# Ollama hosts that answered a JSON schema `format` with HTTP 400 (servers
+# older than 0.5); they get the text prompt from then on
+_ollama_schema_rejected: set = set()
+
+class SchemaRejected(Exception):
+    """The backend does not accept a JSON schema for structured output"""
+
+# One pooled client per event loop, as for OpenAI above
+_ollama_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+    weakref.WeakKeyDictionary()
+
+def get_ollama_client() -> httpx.AsyncClient:
+    """Keep-alive HTTP client for the Ollama server on the running loop"""
+    loop = asyncio.get_running_loop()
+    client = _ollama_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=OLLAMA_HOST,
+            timeout=httpx.Timeout(OLLAMA_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
         )
+        _ollama_clients[loop] = client
+    return client
 
-def summarize_with_ollama(title: str, abstract: str,
+async def summarize_with_ollama(title: str, abstract: str,
                          results: Optional[str] = None,
                          conclusion: Optional[str] = None,
-                         model: str = "gpt-oss:20b-cloud") -> SummaryResult:
-    """Generate summary using local Ollama model"""
+                         model: str = OLLAMA_MODEL) -> SummaryResult:
+    """
+    Generate summary using the local Ollama server's HTTP API.
+
+    Servers that reject the JSON schema `format` are asked again with the
+    text prompt, and are not sent the schema again.
+    """
     try:
-        prompt = prepare_prompt(title, abstract, results, conclusion)
-        
-        result = subprocess.run(
-            ["ollama", "run", model, prompt],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=45
-        )
-        
-        summary_text = result.stdout.strip()
-        sections = extract_sections(summary_text)
+        structured = supports_structured_output("ollama", model) and \
+            OLLAMA_HOST not in _ollama_schema_rejected
         
-        # Extract key findings
-        key_findings = re.findall(r'(?<=•)(.*?)(?=(?:•|\n|$))', summary_text)
-        key_findings = [finding.strip() for finding in key_findings if finding.strip()]
-        
-        relevance = calculate_space_relevance(summary_text)
-        
-        return SummaryResult(
-            introduction=sections['introduction'],
-            methods=sections['methods'],
-            results=sections['results'],
-            conclusion=sections['conclusion'],
-            key_findings=key_findings,
-            relevance_score=relevance,
-            generated_at=datetime.now(),
-            model_used=model
-        )
-        
-    except subprocess.TimeoutExpired:
-        return SummaryResult(
-            introduction="",
-            methods="",
-            results="",
-            conclusion="",
-            key_findings=[],
-            relevance_score=0.0,
-            generated_at=datetime.now(),
-            model_used=model,
-            error="Model timeout error"
-        )
-    except subprocess.CalledProcessError as e:
-        return SummaryResult(
-            introduction="",
-            methods="",
-            results="",
-            conclusion="",
-            key_findings=[],
-            relevance_score=0.0,
+        async def complete(structured: bool) -> str:
+            payload = {
+                "model": model,
+                "prompt": prepare_prompt(title, abstract, results, conclusion, model, structured),
+                "stream": False,
+                "keep_alive": OLLAMA_KEEP_ALIVE
+            }
+            if structured:
+                payload["format"] = SUMMARY_SCHEMA
+            response = await get_ollama_client().post("/api/generate", json=payload)
+            if structured and response.status_code == 400:
+                raise SchemaRejected(response.text)
+            response.raise_for_status()
+            return response.json()["response"].strip()
+
+        try:
+            return await generate_summary(complete, model, structured)
+        except SchemaRejected as e:
+            logger.warning(f"Ollama at {OLLAMA_HOST} rejected the summary schema ({e}); "
+                           "using the text prompt")
+            _ollama_schema_rejected.add(OLLAMA_HOST)
+            PARSE_STATS['schema_rejected'] += 1
+            return await generate_summary(complete, model, False)
+
+    except httpx.TimeoutException:
+        return error_summary(model, "Model timeout error")
+    except (httpx.HTTPError, KeyError, ValueError) as e:
+        return error_summary(model, str(e))
+
+# Concurrent model calls allowed per backend; extra requests queue up to ADMISSION_QUEUE_LIMIT
+BACKEND_CONCURRENCY = {
+    "openai": int(os.environ.get("OPENAI_CONCURRENCY", "8")),
+    "ollama": int(os.environ.get("OLLAMA_CONCURRENCY", "1"))
+}
+ADMISSION_QUEUE_LIMIT = int(os.environ.get("ADMISSION_QUEUE_LIMIT", "32"))
+
+_flights = SingleFlight()
+_admission = AdmissionController(BACKEND_CONCURRENCY, ADMISSION_QUEUE_LIMIT)
+
+# Backends available to `summarize`; method="auto" lets the router pick among them
+BACKENDS: Dict[str, Backend] = {}
+
+# Seconds before a slow "auto" request is also sent to the next backend (0 disables)
+HEDGE_DELAY = float(os.environ.get("HEDGE_DELAY", "20"))
+
+_router = Router(BACKENDS, hedge_delay=HEDGE_DELAY or None)
+
+def register_backend(name: str, model: str,
+                     summarize: Callable[..., Awaitable[SummaryResult]],
+                     stream: Optional[Callable[[str, str], AsyncIterator[str]]] = None) -> Backend:
+    """
+    Add a backend to the registry.
+
+    `summarize(title, abstract, results, conclusion)` returns a SummaryResult;
+    `stream(prompt, model)`, if given, yields completion tokens.
+    """
+    backend = Backend(name, model, summarize, stream)
+    BACKENDS[name] = backend
+    _admission.limits.setdefault(name, 1)
+    return backend
+
+def set_backend_concurrency(name: str, limit: int) -> None:
+    """
+    Cap concurrent calls to a backend in this process.
+
+    Takes effect on event loops that have not called the backend yet, so
+    set it before starting a job.
+    """
+    _admission.limits[name] = limit
+
+def select_backend(method: str) -> str:
+    """Concrete backend name for `method`, resolving "auto" to the fastest healthy one"""
+    return _router.choose() if method == "auto" else method
+
+def router_stats() -> Dict[str, Dict[str, Any]]:
+    """Rolling latency, error rate and breaker state per backend"""
+    return _router.snapshot()
+
+def summary_key(title: str, abstract: str, method: str,
+                results: Optional[str] = None,
+                conclusion: Optional[str] = None,
+                task: Optional[str] = None) -> str:
+    """Cache key of a request to a registered backend, covering its full prompt"""
+    model = BACKENDS[method].model
+    prompt = prepare_prompt(title, abstract, results, conclusion, model, task=task)
+    return SummaryCache.make_key(title, prompt, f"{method}:{model}")
+
+def _unknown_method(method: str) -> SummaryResult:
+    choices = ', '.join(f"'{name}'" for name in [*BACKENDS, 'auto'])
+    return error_summary(method, f"Unknown method '{method}'. Choose {choices}.")
+
+@dataclass
+class SummaryChunk:
+    """Incremental update from a streaming summary"""
+    delta: str
+    text: str
+    sections: Dict[str, str]
+    key_findings: List[str]
+    result: Optional[SummaryResult] = None  # set on the final chunk only
+
+class IncrementalSummaryParser:
+    """
+    Section and key-finding parser that works on partial model output.
+
+    Each feed only rescans the tail of the text: finished sections and
+    bullet lines are parsed once and kept, and only the open section is
+    re-sliced as tokens arrive.
+    """
+
+    HEADER = SECTION_HEADER
+    MAX_HEADER_LEN = 25  # longest header ("materials and methods:") plus slack
+
+    def __init__(self):
+        self.text = ""
+        self.sections = {name: '' for name in SECTION_PATTERNS}
+        self.key_findings: List[str] = []
+        self._open = None  # (section, content start) of the last header seen
+        self._header_scan = 0
+        self._findings_scan = 0
+
+    def feed(self, delta: str) -> None:
+        self.text += delta
+
+        # Headers may straddle chunk boundaries, so back up by one header length
+        start = max(0, self._header_scan - self.MAX_HEADER_LEN)
+        for match in self.HEADER.finditer(self.text, start):
+            if self._open and match.start() < self._open[1]:
+                continue
+            if self._open:
+                name, content_start = self._open
+                self.sections[name] = self.text[content_start:match.start()].strip()
+            self._open = (match.lastgroup, match.end())
+        self._header_scan = len(self.text)
+        if self._open:
+            name, content_start = self._open
+            self.sections[name] = self.text[content_start:].strip()
+
+        # Bullets are only final once their line is complete
+        line_end = self.text.rfind('\n') + 1
+        if line_end > self._findings_scan:
+            self._add_findings(self.text[self._findings_scan:line_end])
+            self._findings_scan = line_end
+
+    def finish(self) -> None:
+        self._add_findings(self.text[self._findings_scan:])
+        self._findings_scan = len(self.text)
+
+    def _add_findings(self, segment: str) -> None:
+        self.key_findings.extend(extract_key_findings(segment))
+
+async def stream_openai(prompt: str) -> AsyncIterator[str]:
+    """Yield completion tokens from OpenAI as they are generated"""
+    stream = await get_openai_client().chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[
+            {"role": "system", "content": "You are a space biology research expert."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.5,
+        max_tokens=1000,
+        stream=True
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+async def stream_ollama(prompt: str, model: str = OLLAMA_MODEL) -> AsyncIterator[str]:
+    """Yield completion tokens from the Ollama server as they are generated"""
+    async with get_ollama_client().stream("POST", "/api/generate", json={
+        "model": model,
+        "prompt": prompt,
+        "stream": True,
+        "keep_alive": OLLAMA_KEEP_ALIVE
+    }) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            part = json.loads(line)
+            if part.get("response"):
+                yield part["response"]
+            if part.get("done"):
+                break
+
+async def summarize_stream(title: str, abstract: str,
+                           method: str = "openai",
+                           results: Optional[str] = None,
+                           conclusion: Optional[str] = None,
+                           use_cache: bool = True,
+                           task: Optional[str] = None) -> AsyncIterator[SummaryChunk]:
+    """
+    Streaming variant of `summarize`.
+
+    Yields a SummaryChunk per generated token batch with the partial text,
+    sections and key findings parsed so far. The last chunk carries the
+    complete SummaryResult in `result`. A request identical to one already
+    streaming waits for that stream's result instead of calling the model,
+    and streams it itself if that consumer stops early. `task` asks for
+    something other than the default summary, see `prepare_prompt`.
+    """
+    method = select_backend(method)
+    if method not in BACKENDS or BACKENDS[method].stream is None:
+        yield SummaryChunk("", "", {}, [], _unknown_method(method))
+        return
+    backend = BACKENDS[method]
+    model = backend.model
+    prompt = prepare_prompt(title, abstract, results, conclusion, model, task=task)
+    key = SummaryCache.make_key(title, prompt, f"{method}:{model}")
+
+    cache = get_summary_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            yield SummaryChunk("", "", {}, [], summary_from_dict(cached))
+            return
+
+    joined, result = await _flights.follow(key)
+    if joined:
+        yield SummaryChunk("", "", {}, [], result)
+        return
+
+    _flights.start(key)
+    result = None
+    parser = IncrementalSummaryParser()
+    started = None
+    try:
+        async with _admission.slot(method):
+            started = time.monotonic()
+            async for delta in backend.stream(prompt, model):
+                parser.feed(delta)
+                yield SummaryChunk(delta, parser.text, dict(parser.sections), list(parser.key_findings))
+
+        parser.finish()
+        result = SummaryResult(
+            introduction=parser.sections['introduction'],
+            methods=parser.sections['methods'],
+            results=parser.sections['results'],
+            conclusion=parser.sections['conclusion'],
+            key_findings=parser.key_findings,
+            relevance_score=calculate_space_relevance(parser.text),
             generated_at=datetime.now(),
             model_used=model,
-            error=str(e)
+            text=parser.text
         )
+        if cache is not None:
+            cache.set(key, summary_to_dict(result))
+    except httpx.TimeoutException:
+        result = error_summary(model, "Model timeout error")
+    except Exception as e:
+        result = error_summary(model, str(e))
+    finally:
+        # A consumer that stopped early hands the call to a waiting follower
+        _flights.finish(key, result, None if result is not None else asyncio.CancelledError())
+        if started is not None and result is not None:
+            _router.record(method, time.monotonic() - started, not result.error)
+    yield SummaryChunk("", parser.text, dict(parser.sections), list(parser.key_findings), result)
+
+def iterate_stream(stream: AsyncIterator[Any]) -> Iterator[Any]:
+    """Drive an async generator from synchronous code such as a Streamlit page"""
+    return iterate_sync(stream)
+
+def summarize_sync(title: str, abstract: str, method: str = "openai",
+                   results: Optional[str] = None,
+                   conclusion: Optional[str] = None) -> SummaryResult:
+    """Blocking `summarize` for synchronous callers, run on the shared background loop"""
+    return run_sync(summarize(title, abstract, method, results, conclusion))
 
 async def summarize(title: str, abstract: str, 
              method: str = "openai",
              results: Optional[str] = None,
-             conclusion: Optional[str] = None) -> SummaryResult:
-    """Main summary function that handles different AI methods"""
-    if method == "openai":
-        return await summarize_with_openai(title, abstract, results, conclusion)
-    elif method == "ollama":
-        # Ollama function is synchronous, so no need for await
-        return summarize_with_ollama(title, abstract, results, conclusion)
-    else:
-        return SummaryResult(
-            introduction="",
-            methods="",
-            results="",
-            conclusion="",
-            key_findings=[],
-            relevance_score=0.0,
-            generated_at=datetime.now(),
-            model_used=method,
-            error=f"Unknown method '{method}'. Choose 'openai' or 'ollama'."
-        )
\ No newline at end of file
+             conclusion: Optional[str] = None,
+             use_cache: bool = True) -> SummaryResult:
+    """
+    Main summary function that handles different AI methods.
+
+    `method` names a registered backend, or "auto" to let the router send
+    the request to the fastest healthy backend, hedging and failing over
+    to the others.
+    """
+    if method != "auto" and method not in BACKENDS:
+        return _unknown_method(method)
+    names = _router.ranked() if method == "auto" else [method]
+
+    keys = {name: summary_key(title, abstract, name, results, conclusion) for name in names}
+
+    # Identical publication, prompt and model: serve the stored answer
+    cache = get_summary_cache() if use_cache else None
+    if cache is not None:
+        for name in names:
+            cached = cache.get(keys[name])
+            if cached is not None:
+                return summary_from_dict(cached)
+
+    async def call(name: str) -> SummaryResult:
+        async with _admission.slot(name):
+            summary = await BACKENDS[name].summarize(title, abstract, results, conclusion)
+
+        # Errors are not cached so the next request retries the model
+        if cache is not None and not summary.error:
+            cache.set(keys[name], summary_to_dict(summary))
+        return summary
+
+    async def generate() -> SummaryResult:
+        try:
+            return await _router.run(call, names)
+        except AdmissionRejected as e:
+            return error_summary(BACKENDS[names[0]].model, str(e))
+        except Exception as e:
+            return error_summary(method, str(e))
+
+    # Concurrent identical requests share one model call
+    flight_key = keys[method] if method != "auto" else "auto:" + ":".join(sorted(keys.values()))
+    return await _flights.do(flight_key, generate)
+
+register_backend("openai", OPENAI_MODEL, summarize_with_openai,
+                 lambda prompt, model: stream_openai(prompt))
+register_backend("ollama", OLLAMA_MODEL, summarize_with_ollama, stream_ollama)
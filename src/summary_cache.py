@@ -0,0 +1,108 @@
+# src/summary_cache.py
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SUMMARY_CACHE_PATH = "data/cache/summaries.sqlite"
+
+class SummaryCache:
+    """
+    Content-addressed SQLite store for generated summaries.
+
+    Entries are keyed by (title, prompt hash, model), expire after `ttl`
+    seconds and are evicted least-recently-used once the store holds more
+    than `max_entries`.
+    """
+
+    def __init__(self, path: str = SUMMARY_CACHE_PATH,
+                 max_entries: int = 5000, ttl: float = 7 * 24 * 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS summaries (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS summaries_accessed ON summaries (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(title: str, prompt: str, model: str) -> str:
+        """Stable cache key for a publication, prompt and model"""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return hashlib.sha256(f"{title}\0{prompt_hash}\0{model}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached payload for `key`, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a payload and evict the least recently used overflow"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, payload, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(payload), now, now)
+            )
+            self._conn.execute("DELETE FROM summaries WHERE created_at < ?", (now - self.ttl,))
+            self._conn.execute("""
+                DELETE FROM summaries WHERE key IN (
+                    SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM summaries")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process and the current store size"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries
+        }
+
+_summary_cache: Optional[SummaryCache] = None
+
+def get_summary_cache() -> SummaryCache:
+    """Process-wide summary cache, opened on first use"""
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = SummaryCache()
+    return _summary_cache
@@ -0,0 +1,172 @@
+# src/taxonomy.py
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Labels shown on publication cards, each with the surface forms that
+# indicate it. Matching is whole-word, so inflected forms are listed
+# explicitly; a trailing '*' marks a prefix term ("genom*" matches "genome"
+# and "genomics"). Labels are checked in order; the first hit is the card's label.
+CARD_ORGANISMS = {
+    'mice': ['mice', 'mouse', 'murine', 'rodent', 'rodents'],
+    'human': ['human', 'humans', 'patient', 'patients', 'astronaut', 'astronauts', 'crew',
+              'crews', 'crewed', 'crewmember', 'crewmembers'],
+    'plant': ['plant', 'plants', 'arabidopsis', 'seed', 'seeds', 'seedling', 'seedlings',
+              'vegetation'],
+    'cell': ['cell', 'cells', 'cellular', 'culture', 'cultures', 'cultured', 'in vitro',
+             'tissue', 'tissues']
+}
+
+CARD_EXPERIMENT_TYPES = {
+    'microgravity': ['microgravity', 'weightless', 'weightlessness', 'zero gravity',
+                     'space flight', 'space flights', 'spaceflight', 'spaceflights'],
+    'radiation': ['radiation', 'radiations', 'irradiation', 'irradiated', 'cosmic ray',
+                  'cosmic rays', 'ionizing', 'solar particle', 'solar particles'],
+    'bone': ['bone', 'bones', 'skeletal', 'osteo*'],
+    'immune': ['immun*', 'lymphocyte', 'lymphocytes', 'cytokine', 'cytokines'],
+    'genomic': ['gene', 'genes', 'genom*', 'genet*', 'expression', 'transcriptom*', 'dna',
+                'rna', 'rnas', 'mrna', 'mrnas', 'mirna', 'mirnas', 'microrna', 'micrornas']
+}
+
+CARD_MISSIONS = {
+    'ISS': ['iss', 'international space station', 'space station'],
+    'Shuttle': ['space shuttle', 'sts', 'shuttle mission', 'shuttle missions'],
+    'Bion-M1': ['bion-m1', 'bion m1', 'bion-m 1', 'bion'],
+    'Artemis': ['artemis', 'lunar gateway', 'moon mission', 'moon missions'],
+    'Mars': ['mars', 'red planet', 'martian']
+}
+
+CARD_TAXONOMIES = {
+    'organism': CARD_ORGANISMS,
+    'experiment_type': CARD_EXPERIMENT_TYPES,
+    'mission': CARD_MISSIONS
+}
+
+# Research Explorer category filters: option shown in the sidebar -> whole
+# words and phrases (or '*' prefix terms) that place a publication under it
+CATEGORY_FILTERS = {
+    'Organism': {
+        'Human': CARD_ORGANISMS['human'],
+        'Mice': CARD_ORGANISMS['mice'] + ['rat', 'rats'],
+        'Plants': CARD_ORGANISMS['plant'] + ['wheat', 'rice', 'algae', 'root', 'roots'],
+        'Cells': CARD_ORGANISMS['cell'] + ['stem cells', 'fibroblast', 'fibroblasts',
+                                           'neuron', 'neurons'],
+        'Microorganisms': ['bacteria', 'bacterial', 'bacterium', 'microbe', 'microbes',
+                           'microbial', 'microbiome', 'microorganism', 'microorganisms',
+                           'yeast', 'fungi', 'fungal', 'biofilm', 'biofilms']
+    },
+    'Experiment': {
+        'Genomics': CARD_EXPERIMENT_TYPES['genomic'],
+        'Physiology': ['physiology', 'physiological', 'cardiovascular', 'muscle', 'muscles',
+                       'bone loss', 'metabolism', 'metabolic', 'vestibular'],
+        'Radiation': CARD_EXPERIMENT_TYPES['radiation'],
+        'Behavior': ['behavior', 'behaviors', 'behavioral', 'behaviour', 'behavioural',
+                     'cognitive', 'cognition', 'sleep', 'stress', 'anxiety'],
+        'Systems': ['systems biology', 'omics', 'multi-omics', 'multiomics', 'network',
+                    'networks', 'integrative', 'life support']
+    },
+    'Mission': {
+        'ISS': CARD_MISSIONS['ISS'],
+        'Shuttle': CARD_MISSIONS['Shuttle'] + ['shuttle'],
+        'Artemis': CARD_MISSIONS['Artemis'],
+        'Mars Analog': ['mars analog', 'space analog', 'analog mission', 'analog missions',
+                        'mars500', 'bed rest', 'hindlimb unloading', 'hindlimb suspension',
+                        'isolation and confinement'],
+        'Ground Control': ['ground control', 'ground controls', 'ground-based',
+                           'vivarium control', 'vivarium controls']
+    }
+}
+
+class TaxonomyTagger:
+    """
+    Aho-Corasick automaton over every surface form of a set of taxonomies.
+
+    A document is scanned once, so tagging cost depends on the text length
+    and not on the number of terms. Hits must start and end on word
+    boundaries, so "iss" does not fire inside "tissue".
+
+    Args:
+        taxonomies: {taxonomy: {label: [surface forms]}}
+    """
+
+    def __init__(self, taxonomies: Dict[str, Dict[str, Iterable[str]]]):
+        self.labels: Dict[str, List[str]] = {name: list(labels) for name, labels in taxonomies.items()}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Per state: (term length, taxonomy, label, prefix) for each term ending there
+        self._out: List[List[Tuple[int, str, str, bool]]] = [[]]
+
+        for name, labels in taxonomies.items():
+            for label, terms in labels.items():
+                for term in terms:
+                    self._add(self._normalize(term), name, label)
+        self._link()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return ' '.join(text.lower().split())
+
+    def _add(self, term: str, taxonomy: str, label: str) -> None:
+        prefix = term.endswith('*')
+        term = term.rstrip('*')
+        state = 0
+        for char in term:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._out[state].append((len(term), taxonomy, label, prefix))
+
+    def _link(self) -> None:
+        # Breadth-first, so every fail target is finished before it is used
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> Iterator[Tuple[str, str]]:
+        """Yield (taxonomy, label) for every whole-word (or word-prefix) hit in the text"""
+        text = self._normalize(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            word_end = end == len(text) or not text[end].isalnum()
+            for length, taxonomy, label, prefix in out[state]:
+                if not (word_end or prefix):
+                    continue
+                start = end - length
+                if start == 0 or not text[start - 1].isalnum():
+                    yield taxonomy, label
+
+    def tag(self, text: str) -> Dict[str, List[str]]:
+        """Labels found per taxonomy, in taxonomy order"""
+        found = set(self.find(text))
+        return {
+            name: [label for label in labels if (name, label) in found]
+            for name, labels in self.labels.items()
+        }
+
+@lru_cache(maxsize=1)
+def card_tagger() -> TaxonomyTagger:
+    """Shared tagger for the card taxonomies, built on first use"""
+    return TaxonomyTagger(CARD_TAXONOMIES)
+
+def card_labels(text: str) -> Tuple[str, str, str]:
+    """(organism, experiment type, mission) shown on a publication card"""
+    tags = card_tagger().tag(text)
+    organism = tags['organism'][0].title() if tags['organism'] else 'Various'
+    exp_type = tags['experiment_type'][0].title() if tags['experiment_type'] else 'General'
+    mission = tags['mission'][0] if tags['mission'] else 'Various'
+    return organism, exp_type, mission
@@ -0,0 +1,63 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+class StubServer:
+    """
+    Local HTTP server answering every request with `handler(method, path, body, headers)`.
+
+    The handler returns (status, content type, body bytes), optionally with
+    a dict of extra response headers; requests are recorded in `calls` as
+    (method, path, parsed form or raw body).
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                if self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+                    body = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+                stub.calls.append((self.command, self.path, body))
+                status, content_type, payload, *extra = stub.handler(
+                    self.command, self.path, body, self.headers)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                for name, value in (extra[0] if extra else {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(handler):
+        server = StubServer(handler)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
@@ -0,0 +1,27 @@
+import pandas as pd
+
+import src.aggregates as aggregates
+from src.aggregates import compute_aggregates, corpus_key
+from src.search import KeywordIndex
+
+def corpus():
+    return pd.DataFrame({'title': ["Mars habitat", "Plants in orbit"],
+                         'abstract': ["A long-duration mars habitat study.", "Plants grew under radiation."]})
+
+def test_key_changes_with_aggregate_settings(monkeypatch):
+    df = corpus()
+    key = corpus_key(df)
+    monkeypatch.setattr(aggregates, 'FOCUS_AREAS', {**aggregates.FOCUS_AREAS, "Plants": ["plants"]})
+    assert corpus_key(df) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(aggregates, 'WORD_CLOUD_TERMS', 50)
+    assert corpus_key(df) != key
+
+def test_cached_counts_are_not_reused_after_focus_edit(tmp_path, monkeypatch):
+    df = corpus()
+    index = KeywordIndex.build(df)
+    first = compute_aggregates(df, index, str(tmp_path))
+    assert 'Plants' not in first.focus_counts
+    monkeypatch.setattr(aggregates, 'FOCUS_AREAS', {"Plants": ["plants"]})
+    second = compute_aggregates(df, index, str(tmp_path))
+    assert second.focus_counts == {"Plants": 1}
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.async_runtime import AdmissionController, AdmissionRejected, SingleFlight, get_background_loop
+
+def test_state_of_closed_loops_is_released():
+    flights = SingleFlight()
+    admission = AdmissionController({'fake': 1})
+
+    async def work():
+        await flights.do('key', lambda: asyncio.sleep(0, 'done'))
+        async with admission.slot('fake'):
+            pass
+
+    for _ in range(5):
+        asyncio.run(work())
+    # Each run's loop is closed; only the latest one's state is still held
+    assert len(flights._calls) == 1
+    assert len(admission._backends) == 1
+
+def test_single_flight_coalesces_concurrent_calls():
+    flights = SingleFlight()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do('key', factory) for _ in range(5)))
+
+    assert asyncio.run(scenario()) == ['result'] * 5
+    assert len(calls) == 1
+
+def test_admission_rejects_beyond_the_queue():
+    admission = AdmissionController({'fake': 1}, max_waiting=1)
+    release = None
+
+    async def hold():
+        async with admission.slot('fake'):
+            await release.wait()
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        running = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected):
+            async with admission.slot('fake'):
+                pass
+        release.set()
+        await asyncio.gather(running, queued)
+
+    asyncio.run(scenario())
+
+def test_background_loop_is_shared_across_threads():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    loops = []
+    threads = [threading.Thread(target=lambda: loops.append(get_background_loop().run(current_loop())))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(map(id, loops))) == 1
+    assert loops[0] is get_background_loop().loop
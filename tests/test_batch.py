@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime
+
+import pandas as pd
+
+import src.summarizer as summarizer
+from src.batch import load_checkpoint, load_summaries_table, run_job, write_summaries_table
+from src.cards import ANALYSIS_TASK, DEFAULT_ANALYSIS_SECTIONS, analysis_request
+from src.summarizer import BACKENDS, SummaryResult, register_backend, summary_key, summary_to_dict
+from src.summary_cache import SummaryCache
+
+def record(title, method='openai'):
+    summary = SummaryResult(
+        introduction='intro', methods='methods', results='results', conclusion='conclusion',
+        key_findings=['one', 'two'], relevance_score=0.5,
+        generated_at=datetime(2024, 1, 1), model_used='gpt-4o-mini'
+    )
+    return {'title': title, 'method': method, 'prompt_key': summary_key(title, 'Abstract', method),
+            'summary': summary_to_dict(summary)}
+
+def test_empty_run_round_trips(tmp_path):
+    path = tmp_path / 'summaries.arrow'
+    table = write_summaries_table([], str(path))
+    assert 'key_findings' in table.columns
+    assert load_summaries_table(str(path)) == {}
+
+def test_summaries_round_trip(tmp_path):
+    path = tmp_path / 'summaries.arrow'
+    write_summaries_table([record('A'), record('B', 'ollama')], str(path))
+    summaries = load_summaries_table(str(path))
+    assert set(summaries) == {summary_key('A', 'Abstract', 'openai'),
+                              summary_key('B', 'Abstract', 'ollama')}
+    summary = summaries[summary_key('A', 'Abstract', 'openai')]
+    assert summary.key_findings == ['one', 'two']
+    assert summary.relevance_score == 0.5
+    assert summary.error is None
+
+def test_missing_columns_get_defaults(tmp_path):
+    from src.preprocess import save_corpus_artifact
+
+    path = tmp_path / 'summaries.arrow'
+    save_corpus_artifact(pd.DataFrame([{'title': 'A', 'method': 'openai', 'prompt_key': 'key',
+                                        'introduction': 'intro',
+                                        'generated_at': '2024-01-01T00:00:00'}]), path)
+    summary = load_summaries_table(str(path))['key']
+    assert summary.introduction == 'intro'
+    assert summary.key_findings == []
+    assert summary.relevance_score == 0.0
+
+def test_summary_only_served_for_its_own_prompt(tmp_path):
+    path = tmp_path / 'summaries.arrow'
+    write_summaries_table([record('A')], str(path))
+    summaries = load_summaries_table(str(path))
+    assert summary_key('A', 'Abstract', 'openai') in summaries
+    # Other sections or instructions make a different request
+    assert summary_key('A', 'Abstract', 'openai', results='More results') not in summaries
+    assert summary_key('A', 'Abstract', 'openai', task='Answer a question') not in summaries
+    assert summary_key('A', 'Abstract', 'ollama') not in summaries
+
+def register_streaming_backend(name, prompts, delay=0.0):
+    async def stream(prompt, model):
+        prompts.append(prompt)
+        await asyncio.sleep(delay)
+        yield "Introduction: bone loss in orbit\n"
+        yield "Conclusion: countermeasures are needed\n"
+
+    async def summarize(title, abstract, results=None, conclusion=None):
+        raise AssertionError("the job streams the explorer's request")
+
+    return register_backend(name, name, summarize, stream)
+
+def test_explorer_finds_the_summaries_the_job_wrote(tmp_path, monkeypatch):
+    prompts = []
+    register_streaming_backend('fake', prompts)
+    monkeypatch.setattr(summarizer, 'get_summary_cache', lambda: SummaryCache(':memory:'))
+    corpus = pd.DataFrame({
+        'title': ["  Bone loss in mice ", "Plant roots"],
+        'abstract': ["Raw abstract one.", "Raw abstract two."],
+        'card_abstract': ["Cleaned abstract one.", "Cleaned abstract two."],
+        'results': ["Trabecular bone thinned.", None],
+        'conclusion': ["Exercise helps.", "Roots curl."]
+    })
+    checkpoint, path = tmp_path / 'checkpoint.jsonl', tmp_path / 'summaries.arrow'
+    try:
+        asyncio.run(run_job(corpus, 'fake', concurrency=2, rate=None, checkpoint_path=str(checkpoint)))
+        write_summaries_table(list(load_checkpoint(str(checkpoint)).values()), str(path))
+        summaries = load_summaries_table(str(path))
+
+        # The page's lookup for a card with the default sections, as in pages/2_Summarizer.py
+        for _, row in corpus.iterrows():
+            request = analysis_request(row, DEFAULT_ANALYSIS_SECTIONS)
+            summary = summaries[summary_key(method='fake', **request)]
+            assert summary.conclusion == "countermeasures are needed"
+        # Other sections make a different request, which the page streams itself
+        request = analysis_request(corpus.iloc[0], ['Abstract', 'Discussion'])
+        assert summary_key(method='fake', **request) not in summaries
+
+        # A rerun finds every request checkpointed
+        prompts.clear()
+        stats = asyncio.run(run_job(corpus, 'fake', concurrency=2, rate=None,
+                                    checkpoint_path=str(checkpoint)))
+    finally:
+        BACKENDS.pop('fake')
+    assert stats.total == 0 and prompts == []
+
+def test_job_sends_the_explorer_prompt(tmp_path, monkeypatch):
+    prompts = []
+    register_streaming_backend('fake', prompts)
+    monkeypatch.setattr(summarizer, 'get_summary_cache', lambda: SummaryCache(':memory:'))
+    corpus = pd.DataFrame({'title': ["Bone loss"], 'abstract': ["Raw abstract."],
+                           'card_abstract': ["Cleaned abstract."], 'conclusion': ["Not sent."]})
+    try:
+        asyncio.run(run_job(corpus, 'fake', concurrency=1, rate=None,
+                            checkpoint_path=str(tmp_path / 'checkpoint.jsonl')))
+    finally:
+        BACKENDS.pop('fake')
+    [prompt] = prompts
+    assert "Cleaned abstract." in prompt and ANALYSIS_TASK in prompt
+    assert "Raw abstract." not in prompt and "Not sent." not in prompt
+
+def test_job_wider_than_admission_queue(tmp_path, monkeypatch):
+    """More workers than the admission queue holds must not turn into rejections"""
+    register_streaming_backend('fake', [], delay=0.01)
+    monkeypatch.setattr(summarizer, 'get_summary_cache', lambda: SummaryCache(':memory:'))
+    frame = pd.DataFrame({'title': [f"Title {i}" for i in range(80)], 'card_abstract': 'Abstract'})
+    try:
+        stats = asyncio.run(run_job(frame, 'fake', concurrency=40, rate=None,
+                                    checkpoint_path=str(tmp_path / 'checkpoint.jsonl')))
+    finally:
+        BACKENDS.pop('fake')
+    assert stats.errors == 0
+    assert len(stats.latencies) == 80
+    assert max(stats.latencies) < 0.5
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from src.cards import ABSTRACT_PENDING, ABSTRACT_UNAVAILABLE, CARD_COLUMNS, build_cards, clean_card_abstract
+
+LONG_ABSTRACT = ("Mice flown aboard the ISS for thirty days lost trabecular bone, and the "
+                 "microgravity exposure also changed immune gene expression in the spleen.")
+
+def test_card_abstract_drops_metadata_fragments():
+    text = f"PMC1234567 Research Article {LONG_ABSTRACT} doi 10.1371/journal.pone.0001"
+    cleaned = clean_card_abstract(text)
+    assert cleaned.startswith("Mice flown")
+    assert 'PMC' not in cleaned and '10.1371' not in cleaned
+    assert clean_card_abstract(None) == ABSTRACT_UNAVAILABLE
+    assert clean_card_abstract("PMC1234567 Research Article") == ABSTRACT_PENDING
+
+def test_cards_are_built_once_per_row_and_keep_the_index():
+    frame = pd.DataFrame({'title': ["  Bone loss in mice ", "Untitled"],
+                          'abstract': [LONG_ABSTRACT, ""]}, index=[7, 3])
+    cards = build_cards(frame)
+    assert list(cards.columns) == CARD_COLUMNS
+    assert cards.index.tolist() == [7, 3]
+    first = cards.loc[7]
+    assert (first['card_organism'], first['card_mission']) == ('Mice', 'ISS')
+    assert 0 < first['card_relevance'] <= 1
+    assert cards.loc[3, 'card_abstract'] == ABSTRACT_UNAVAILABLE
+    assert (cards.loc[3, 'card_organism'], cards.loc[3, 'card_experiment_type']) == ('Various', 'General')
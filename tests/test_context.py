@@ -0,0 +1,37 @@
+from src.context import count_tokens, pack_sections, pack_text, token_savings
+
+def article(topic, sentences):
+    return ' '.join(f"Finding {i} shows {topic} changes in mice aboard the ISS after {i + 2} weeks."
+                    for i in range(sentences))
+
+def test_pack_text_keeps_short_text_whole():
+    text = article("bone", 3)
+    assert pack_text(text, 1000) == text
+
+def test_pack_text_stays_within_budget_and_keeps_sentence_order():
+    text = article("bone", 40)
+    packed = pack_text(text, 100)
+    assert 0 < count_tokens(packed) <= 100
+    sentences = text.split('. ')
+    kept = [s.rstrip('.') for s in packed.split('. ')]
+    positions = [next(i for i, s in enumerate(sentences) if s.rstrip('.') == k) for k in kept]
+    assert positions == sorted(positions)
+
+def test_pack_text_truncates_text_without_sentence_boundaries():
+    text = ' '.join(["microgravity"] * 500)
+    assert 0 < count_tokens(pack_text(text, 50)) <= 50
+
+def test_pack_sections_stays_within_budget_and_spares_short_sections():
+    sections = {'abstract': article("bone", 2), 'results': article("muscle", 60),
+                'conclusion': article("radiation", 30)}
+    packed = pack_sections(sections, 300)
+    assert list(packed) == list(sections)
+    assert packed['abstract'] == sections['abstract']
+    assert sum(count_tokens(text) for text in packed.values()) <= 300
+    assert count_tokens(packed['results']) > count_tokens(packed['conclusion'])
+
+def test_token_savings_reports_packed_totals():
+    records = [{'abstract': article("bone", 60), 'results': '', 'conclusion': None}]
+    savings = token_savings(records, budget=200)
+    assert savings['tokens_after'] <= 200
+    assert savings['tokens_saved'] == savings['tokens_before'] - savings['tokens_after'] > 0
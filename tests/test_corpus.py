@@ -0,0 +1,53 @@
+import threading
+import time
+
+import pandas as pd
+
+import src.corpus as corpus_module
+from src.corpus import Corpus, get_corpus
+
+def frame():
+    return pd.DataFrame({
+        'title': ["Bone loss in mice", "Plant roots in orbit", "Plant roots, revised"],
+        'abstract': ["Mice aboard the ISS lost bone.", "Roots grew on the ISS.", "Roots grew again."],
+        'link': ["https://example.org/PMC1", "https://example.org/PMC2", "https://example.org/PMC2"],
+        'pub_id': ['PMC1', 'PMC2', 'PMC2'],
+        'row_hash': ['aaaaaaaaaaaaaaaa', 'bbbbbbbbbbbbbbbb', 'cccccccccccccccc']
+    })
+
+def test_one_corpus_per_csv_across_threads(tmp_path, monkeypatch):
+    loads = []
+
+    def load(csv_path):
+        loads.append(csv_path)
+        time.sleep(0.02)
+        return frame()
+
+    monkeypatch.setattr(corpus_module, 'load_and_clean', load)
+    monkeypatch.setattr(corpus_module, '_corpora', {})
+    csv = tmp_path / 'pubs.csv'
+    frame().to_csv(csv, index=False)
+    corpora = []
+    threads = [threading.Thread(target=lambda: corpora.append(get_corpus(str(csv)))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert loads == [str(csv)]
+    assert len(corpora) == 4
+    assert all(corpus is corpora[0] for corpus in corpora)
+
+def test_publications_are_addressed_by_unique_id():
+    corpus = Corpus(frame())
+    assert corpus.ids == ['PMC1', 'PMC2', 'PMC2-cccccccc']
+    assert corpus.title('PMC2-cccccccc') == "Plant roots, revised"
+    assert corpus.get('PMC1')['abstract'] == "Mice aboard the ISS lost bone."
+    assert corpus.id_for_title("Plant roots in orbit") == 'PMC2'
+    assert corpus.rows([2, 0])['pub_id'].tolist() == ['PMC2-cccccccc', 'PMC1']
+
+def test_derived_views_are_built_once():
+    corpus = Corpus(frame())
+    assert corpus.keyword_index() is corpus.keyword_index()
+    records = corpus.records()
+    assert records is corpus.records()
+    assert set(records[0]) == {'pub_id', 'title', 'link', 'abstract'}
@@ -0,0 +1,52 @@
+import asyncio
+
+from src.crawler import fetch_many, load_sections
+
+PAGE = ('<html><body><section id="abstract">Abstract of {path}</section>'
+        '<section>Results of {path}</section><section>Discussion of {path}</section></body></html>')
+
+def pages(etag='"v1"'):
+    """Handler serving a page per path, honouring If-None-Match"""
+    def handler(method, path, body, headers):
+        if headers.get('If-None-Match') == etag:
+            return 304, 'text/html', b''
+        return 200, 'text/html', PAGE.format(path=path).encode(), {'ETag': etag}
+    return handler
+
+def test_streams_sections_and_revalidates(tmp_path, stub_server):
+    server = stub_server(pages())
+    urls = [f"{server.url}/article/{i}" for i in range(5)]
+    output = str(tmp_path / 'sections.jsonl')
+
+    stats = asyncio.run(fetch_many(urls, concurrency=2, output_path=output))
+    assert stats == {'fetched': 5, 'not_modified': 0, 'failed': 0}
+    records = load_sections(output)
+    assert records[urls[0]]['results'] == 'Results of /article/0'
+    assert records[urls[0]]['etag'] == '"v1"'
+
+    # A rerun sends the stored ETag back and skips unchanged pages
+    stats = asyncio.run(fetch_many(urls, concurrency=2, output_path=output))
+    assert stats == {'fetched': 0, 'not_modified': 5, 'failed': 0}
+    assert len(server.calls) == 10
+
+def test_retries_busy_responses(tmp_path, stub_server):
+    attempts = []
+
+    def busy_once(method, path, body, headers):
+        attempts.append(path)
+        if len(attempts) == 1:
+            return 503, 'text/plain', b'busy', {'Retry-After': '0'}
+        return pages()(method, path, body, headers)
+
+    server = stub_server(busy_once)
+    stats = asyncio.run(fetch_many([f"{server.url}/article/1"],
+                                   output_path=str(tmp_path / 'sections.jsonl')))
+    assert stats['fetched'] == 1
+    assert len(attempts) == 2
+
+def test_does_not_retry_missing_pages(tmp_path, stub_server):
+    server = stub_server(lambda method, path, body, headers: (404, 'text/plain', b'missing'))
+    stats = asyncio.run(fetch_many([f"{server.url}/article/1"], backoff=0,
+                                   output_path=str(tmp_path / 'sections.jsonl')))
+    assert stats['failed'] == 1
+    assert len(server.calls) == 1
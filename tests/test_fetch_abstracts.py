@@ -0,0 +1,75 @@
+import json
+
+import pandas as pd
+
+import fetch_abstracts
+
+def efetch_xml(ids):
+    articles = ''.join(
+        f'<article><front><article-meta><article-id pub-id-type="pmc">PMC{pmc_id}</article-id>'
+        f'<abstract><p>Abstract of {pmc_id}.</p></abstract></article-meta></front></article>'
+        for pmc_id in ids
+    )
+    return f'<pmc-articleset>{articles}</pmc-articleset>'.encode()
+
+def eutils(failing=()):
+    """efetch handler; batches containing an ID in `failing` get HTTP 500"""
+    def handler(method, path, form, headers):
+        ids = form['id'].split(',')
+        if path.endswith('/efetch.fcgi') and not set(ids) & set(failing):
+            return 200, 'text/xml', efetch_xml(ids)
+        return 500, 'text/plain', b'unavailable'
+    return handler
+
+def configure(monkeypatch, tmp_path, server, n_ids):
+    links = [f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{1000 + i}/" for i in range(n_ids)]
+    pd.DataFrame({'Title': [f"Title {i}" for i in range(n_ids)], 'Link': links}).to_csv(
+        tmp_path / 'publications.csv', index=False)
+    monkeypatch.setattr(fetch_abstracts, 'EUTILS_BASE', server.url)
+    monkeypatch.setattr(fetch_abstracts, 'INPUT_CSV', str(tmp_path / 'publications.csv'))
+    monkeypatch.setattr(fetch_abstracts, 'OUTPUT_CSV', str(tmp_path / 'with_abstracts.csv'))
+    monkeypatch.setattr(fetch_abstracts, 'CHECKPOINT', str(tmp_path / 'checkpoint.jsonl'))
+    monkeypatch.setattr(fetch_abstracts, 'BATCH_SIZE', 2)
+    monkeypatch.setattr(fetch_abstracts, 'MAX_RETRIES', 1)
+    monkeypatch.setattr(fetch_abstracts, 'REQUESTS_PER_SECOND', 1000)
+
+def test_batches_ids_into_multi_id_requests(monkeypatch, tmp_path, stub_server):
+    server = stub_server(eutils())
+    configure(monkeypatch, tmp_path, server, 5)
+    fetch_abstracts.main()
+
+    assert sorted(len(form['id'].split(',')) for _, _, form in server.calls) == [1, 2, 2]
+    output = pd.read_csv(tmp_path / 'with_abstracts.csv')
+    assert output['Abstract'].tolist() == [f"Abstract of {1000 + i}." for i in range(5)]
+
+def test_interrupted_run_resumes_from_checkpoint(monkeypatch, tmp_path, stub_server):
+    failing = stub_server(eutils(failing={'1003'}))
+    configure(monkeypatch, tmp_path, failing, 5)
+    fetch_abstracts.main()
+    with open(tmp_path / 'checkpoint.jsonl', encoding='utf-8') as f:
+        checkpointed = {json.loads(line)['pmc_id'] for line in f}
+    assert checkpointed == {'1000', '1001', '1004'}
+
+    healthy = stub_server(eutils())
+    monkeypatch.setattr(fetch_abstracts, 'EUTILS_BASE', healthy.url)
+    fetch_abstracts.main()
+    # Only the failed batch is fetched again
+    assert [form['id'] for _, _, form in healthy.calls] == ['1002,1003']
+    output = pd.read_csv(tmp_path / 'with_abstracts.csv')
+    assert output['Abstract'].notna().all()
+
+def test_retries_server_errors(monkeypatch, stub_server):
+    attempts = []
+
+    def flaky(method, path, form, headers):
+        attempts.append(form['id'])
+        if len(attempts) == 1:
+            return 503, 'text/plain', b'busy'
+        return 200, 'text/xml', efetch_xml(form['id'].split(','))
+
+    server = stub_server(flaky)
+    monkeypatch.setattr(fetch_abstracts, 'EUTILS_BASE', server.url)
+    monkeypatch.setattr(fetch_abstracts.time, 'sleep', lambda seconds: None)
+    limiter = fetch_abstracts.RateLimiter(1000)
+    assert fetch_abstracts.fetch_batch(['1', '2'], limiter) == {'1': 'Abstract of 1.', '2': 'Abstract of 2.'}
+    assert len(attempts) == 2
@@ -0,0 +1,133 @@
+import pandas as pd
+
+import src.preprocess as preprocess
+from src.preprocess import parse_publication_html
+from src.section_benchmark import benchmark, chunked, soup_sections, streaming_sections, synthetic_article
+
+def test_streaming_extractor_matches_soup_sections():
+    chunks = chunked(synthetic_article(10), size=997)  # chunk edges fall inside tags
+    streamed = streaming_sections(chunks)
+    souped = soup_sections(chunks)
+    for streamed_text, souped_text in zip(streamed, souped):
+        assert streamed_text
+        assert streamed_text.replace(' ', '') == souped_text.replace(' ', '')
+
+def test_nested_results_are_captured_once():
+    html = ('<section id="abstract">Abstract text</section>'
+            '<section><div><div>Results of the flight experiment.</div></div>'
+            '<p>More results.</p></section><script>Results in a script</script>')
+    abstract, results, conclusion = parse_publication_html(html)
+    assert abstract == 'Abstract text'
+    assert results == 'Results of the flight experiment. More results.'
+    assert conclusion == ''
+
+def test_benchmark_reports_both_extractors():
+    rows = benchmark([4], depth=2, repeats=1)
+    assert [row['extractor'] for row in rows] == ['beautifulsoup', 'streaming']
+    assert all(row['found'] == 'abstract, results, conclusion' for row in rows)
+
+def write_csv(path, titles):
+    pd.DataFrame({
+        'Title': titles,
+        'Abstract': [f"Abstract about {t} on the ISS." for t in titles],
+        'Link': [f"https://example.org/PMC{i}" for i in range(len(titles))]
+    }).to_csv(path, index=False)
+
+def count_extractions(monkeypatch):
+    processed = []
+
+    def extract(texts, workers=None):
+        processed.extend(texts)
+        return [preprocess.PublicationMetadata([], [], [], [], None, [], []) for _ in texts]
+
+    monkeypatch.setattr(preprocess, 'extract_metadata_batch', extract)
+    return processed
+
+def test_rebuild_skips_rows_dropped_as_duplicate_titles(tmp_path, monkeypatch):
+    processed = count_extractions(monkeypatch)
+    csv, store = tmp_path / 'pubs.csv', tmp_path / 'rows-v1.arrow'
+    write_csv(csv, ["Bone loss", "Plant roots", "Bone loss"])
+    first = preprocess.process_publications(str(csv), workers=1, store_path=store)
+    assert first['title'].tolist() == ["Bone loss", "Plant roots"]
+    assert len(processed) == 3
+
+    processed.clear()
+    write_csv(csv, ["Bone loss", "Plant roots", "Bone loss", "Cosmic rays"])
+    second = preprocess.process_publications(str(csv), workers=1, store_path=store)
+    assert second['title'].tolist() == ["Bone loss", "Plant roots", "Cosmic rays"]
+    # Only the added row is processed; the duplicate was stored the first time
+    assert processed == ["Cosmic rays Abstract about Cosmic rays on the ISS."]
+
+def test_stale_cleanup_only_touches_versions_of_the_same_file(tmp_path):
+    frame = pd.DataFrame({'title': ['A']})
+    version = preprocess.PROCESSING_VERSION
+    for name in ['pubs-0123456789abcdef-v2.2.0.arrow', 'pubs-2024-fedcba9876543210-v2.2.0.arrow',
+                 'rows-v2.2.0.arrow', 'summaries.arrow']:
+        preprocess.save_corpus_artifact(frame, tmp_path / name)
+
+    preprocess.save_corpus_artifact(frame, tmp_path / f"pubs-fedcba9876543210-v{version}.arrow")
+    preprocess.save_corpus_artifact(frame, preprocess.row_store_path(str(tmp_path)))
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'pubs-2024-fedcba9876543210-v2.2.0.arrow', f"pubs-fedcba9876543210-v{version}.arrow",
+        f"rows-v{version}.arrow", 'summaries.arrow'
+    ]
+
+def test_metadata_pool_matches_serial_extraction():
+    texts = [f"Mice and arabidopsis aboard the ISS in {2000 + i} studied microgravity."
+             for i in range(8)]
+    pooled = preprocess.extract_metadata_batch(texts, workers=2)
+    serial = preprocess.extract_metadata_batch(texts, workers=1)
+    assert pooled == serial
+    assert pooled[0].organisms == ['mice', 'arabidopsis']
+
+def test_metadata_runs_ner_once_per_document(monkeypatch):
+    calls = []
+    monkeypatch.setattr(preprocess.MetadataExtractor, 'extract_entities',
+                        classmethod(lambda cls, text: calls.append(text) or
+                                    {'authors': ['Ada'], 'institutions': ['NASA']}))
+    metadata = preprocess.MetadataExtractor.extract_metadata("Bone loss in mice on the ISS.")
+    assert len(calls) == 1
+    assert (metadata.authors, metadata.institutions) == (['Ada'], ['NASA'])
+
+def test_missing_ner_data_is_reported_once_and_skipped(monkeypatch, caplog):
+    monkeypatch.setattr(preprocess, 'ensure_nltk_data', lambda: ['maxent_ne_chunker'])
+    calls = []
+    monkeypatch.setattr(preprocess.MetadataExtractor, 'extract_entities',
+                        classmethod(lambda cls, text: calls.append(text)))
+    texts = [f"Mice aboard the ISS in {2000 + i}." for i in range(5)]
+    with caplog.at_level('WARNING', logger=preprocess.logger.name):
+        metadata = preprocess.extract_metadata_batch(texts, workers=1)
+    assert calls == []
+    assert all(m.authors == [] and m.institutions == [] for m in metadata)
+    assert metadata[0].organisms == ['mice']
+    warnings = [r for r in caplog.records if r.levelname == 'WARNING']
+    assert len(warnings) == 1 and 'maxent_ne_chunker' in warnings[0].getMessage()
+
+def test_corpus_artifact_round_trips_and_tracks_csv_and_version(tmp_path, monkeypatch):
+    processed = count_extractions(monkeypatch)
+    csv, cache = tmp_path / 'pubs.csv', tmp_path / 'cache'
+    write_csv(csv, ["Bone loss", "Plant roots"])
+    built = preprocess.load_and_clean(str(csv), workers=1, cache_dir=str(cache))
+    artifact = preprocess.corpus_artifact_path(str(csv), str(cache))
+    assert artifact.exists()
+
+    processed.clear()
+    loaded = preprocess.load_and_clean(str(csv), workers=1, cache_dir=str(cache))
+    assert processed == []
+    pd.testing.assert_frame_equal(loaded, built)
+    assert isinstance(loaded['organisms'][0], list)
+
+    # An edited CSV gets a new artifact and the old one is removed
+    write_csv(csv, ["Bone loss", "Plant roots", "Cosmic rays"])
+    edited = preprocess.load_and_clean(str(csv), workers=1, cache_dir=str(cache))
+    assert len(edited) == 3
+    assert not artifact.exists()
+
+    # So does a new processing version, which also reprocesses every row
+    processed.clear()
+    artifact = preprocess.corpus_artifact_path(str(csv), str(cache))
+    monkeypatch.setattr(preprocess, 'PROCESSING_VERSION', '99.0.0')
+    preprocess.load_and_clean(str(csv), workers=1, cache_dir=str(cache))
+    assert len(processed) == 3
+    assert not artifact.exists()
+    assert preprocess.corpus_artifact_path(str(csv), str(cache)).name.endswith('-v99.0.0.arrow')
@@ -0,0 +1,59 @@
+from src.context import count_tokens
+from src.retrieval import ChunkIndex, chunk_text
+
+def publications():
+    return [
+        {'title': "Bone loss in mice", 'link': 'a',
+         'abstract': "Mice aboard the ISS lost bone density in microgravity."},
+        {'title': "Plant roots in orbit", 'link': 'b',
+         'abstract': "Arabidopsis roots grew toward light on the ISS."},
+        {'title': "Radiation and yeast", 'link': 'c',
+         'abstract': "Yeast exposed to cosmic radiation repaired DNA damage."}
+    ]
+
+def test_chunks_overlap_and_cover_the_text():
+    words = [f"w{i}" for i in range(250)]
+    chunks = chunk_text(' '.join(words), chunk_words=100, overlap=20)
+    assert [len(c.split()) for c in chunks] == [100, 100, 90]
+    # Consecutive chunks share `overlap` words
+    assert chunks[0].split()[-20:] == chunks[1].split()[:20]
+    assert chunks[-1].split()[-1] == 'w249'
+    assert chunk_text('short text') == ['short text']
+    assert chunk_text('   ') == []
+
+def test_retrieve_ranks_matching_chunk_first():
+    index = ChunkIndex.build(publications(), {'b': {'results': "Root gravitropism was lost."}})
+    ranked = index.retrieve("bone density in mice")
+    assert index.titles[ranked[0][0]] == "Bone loss in mice"
+    assert [score for _, score in ranked] == sorted((score for _, score in ranked), reverse=True)
+    # Crawled sections are indexed alongside the abstract
+    assert 'results' in index.sections
+    assert index.retrieve("unrelated words entirely") == []
+
+def test_empty_corpus_gives_empty_index():
+    for corpus in ([], [{'title': 'The', 'link': 'x', 'abstract': "the and of it"}]):
+        index = ChunkIndex.build(corpus)
+        assert index.retrieve("bone loss") == []
+        prompt, citations = index.build_prompt("bone loss")
+        assert citations == []
+        assert prompt.endswith("Question: bone loss")
+
+def test_prompt_stays_within_budget_and_numbers_citations():
+    records = [{'title': f"Study {i}", 'link': str(i),
+                'abstract': ' '.join(["microgravity bone loss in mice"] * 20)} for i in range(10)]
+    index = ChunkIndex.build(records)
+    budget = 3 * count_tokens(index.texts[0])
+    prompt, citations = index.build_prompt("bone loss", token_budget=budget)
+    excerpts = [line for line in prompt.splitlines() if line.startswith('[')]
+    assert len(excerpts) == 3
+    assert sum(count_tokens(line.split(': ', 1)[1]) for line in excerpts) <= budget
+    assert [c.number for c in citations] == [1, 2, 3]
+    for citation in citations:
+        assert f"[{citation.number}] {citation.title} (abstract)" in prompt
+
+def test_benchmark_reports_retrieval_latency():
+    from src.retrieval_benchmark import benchmark
+
+    [row] = benchmark([200], ["microgravity bone loss"], repeats=2)
+    assert row['chunks'] == 200
+    assert row['retrieve_p50_ms'] > 0
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+from src.async_runtime import AdmissionRejected
+from src.router import Backend, CircuitBreaker, Router
+
+class Reply:
+    def __init__(self, name, error=None):
+        self.name = name
+        self.error = error
+
+def fake_backend(name, delay, fail=False, reject=False):
+    """Local backend answering after `delay` seconds"""
+    async def summarize():
+        await asyncio.sleep(delay)
+        if reject:
+            raise AdmissionRejected(f"{name} is busy")
+        return Reply(name, "boom" if fail else None)
+    return Backend(name, name, summarize)
+
+def make_router(backends, **kwargs):
+    registry = {b.name: b for b in backends}
+    router = Router(registry, **kwargs)
+    return router, lambda name: registry[name].summarize()
+
+def test_hedges_slow_primary():
+    router, call = make_router([fake_backend('slow', 0.5), fake_backend('fast', 0.02)],
+                               hedge_delay=0.05)
+    started = time.monotonic()
+    reply = asyncio.run(router.run(call))
+    assert reply.name == 'fast'
+    assert router.hedges == 1
+    assert time.monotonic() - started < 0.3
+    # The cancelled loser still counts as at least that slow
+    assert router.ranked() == ['fast', 'slow']
+
+def test_fails_over_on_error():
+    router, call = make_router([fake_backend('bad', 0.01, fail=True), fake_backend('good', 0.01)])
+    reply = asyncio.run(router.run(call))
+    assert reply.name == 'good'
+    assert router.snapshot()['bad']['error_rate'] == 1.0
+
+def test_returns_last_failure_when_all_fail():
+    router, call = make_router([fake_backend('a', 0.01, fail=True), fake_backend('b', 0.01, fail=True)])
+    reply = asyncio.run(router.run(call))
+    assert reply.error == 'boom'
+
+def test_breaker_opens_and_recovers():
+    state = {'fail': True}
+
+    async def flaky():
+        await asyncio.sleep(0.01)
+        return Reply('flaky', 'boom' if state['fail'] else None)
+
+    registry = {'flaky': Backend('flaky', 'flaky', flaky), 'good': fake_backend('good', 0.01)}
+    router = Router(registry, failure_threshold=2, reset_timeout=0.1)
+    call = lambda name: registry[name].summarize()
+
+    for _ in range(2):
+        asyncio.run(router.run(call, ['flaky']))
+    assert router.breakers['flaky'].state == CircuitBreaker.OPEN
+    assert router.ranked() == ['good']
+
+    state['fail'] = False
+    time.sleep(0.12)
+    reply = asyncio.run(router.run(call, ['flaky']))
+    assert reply.name == 'flaky'
+    assert router.breakers['flaky'].state == CircuitBreaker.CLOSED
+
+def open_breaker(router, name):
+    breaker = router._breaker(name)
+    breaker.state = CircuitBreaker.OPEN
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout
+
+def test_cancelled_probe_is_released():
+    router, call = make_router([fake_backend('slow', 0.5), fake_backend('fast', 0.02)],
+                               hedge_delay=0.05)
+    open_breaker(router, 'slow')
+    reply = asyncio.run(router.run(call))
+    assert reply.name == 'fast'
+    breaker = router.breakers['slow']
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.available()
+
+def test_rejected_probe_is_released():
+    router, call = make_router([fake_backend('busy', 0.01, reject=True), fake_backend('ok', 0.01)])
+    open_breaker(router, 'busy')
+    reply = asyncio.run(router.run(call))
+    assert reply.name == 'ok'
+    assert router.breakers['busy'].available()
+
+def test_idle_backends_keep_latency_order():
+    router, _ = make_router([fake_backend('openai', 0), fake_backend('ollama', 0)], reset_timeout=0.05)
+    router.record('openai', 30.0, ok=True)
+    router.record('ollama', 1.0, ok=True)
+    time.sleep(0.06)
+    assert router.ranked() == ['ollama', 'openai']
+
+def test_failed_backend_is_explored_once_after_quiet_spell():
+    router, _ = make_router([fake_backend('a', 0), fake_backend('b', 0)], reset_timeout=0.05)
+    router.record('a', 0.1, ok=False)
+    router.record('b', 1.0, ok=True)
+    assert router.choose() == 'b'
+    time.sleep(0.06)
+    router._stats('b').last_used = time.monotonic()
+    assert router.choose() == 'a'
+    # The exploratory slot was taken; the next request goes by latency again
+    assert router.choose() == 'b'
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.search import KeywordIndex
+from src.taxonomy import CATEGORY_FILTERS
+
+def make_index(abstracts):
+    frame = pd.DataFrame({'title': [''] * len(abstracts), 'abstract': abstracts})
+    return KeywordIndex.build(frame)
+
+def test_whole_word_match_skips_longer_words():
+    index = make_index(["Samples were returned from the ISS.", "A known issue with sampling."])
+    assert index.match('iss').tolist() == [0, 1]
+    assert index.match('iss', prefix=False).tolist() == [0]
+
+def test_every_category_option_matches_a_publication():
+    abstracts = [
+        "Astronauts aboard the International Space Station showed bone loss.",
+        "Mice flown on the space shuttle had altered gene expression and genomics profiles.",
+        "Arabidopsis seedlings grown under radiation; ground control plants were kept in a vivarium.",
+        "Cultured cells and bacterial biofilms were studied for the Artemis program.",
+        "A Mars analog study examined sleep, stress and cognitive behavior with a systems biology network.",
+        "Cardiovascular physiology changed during bed rest."
+    ]
+    index = make_index(abstracts)
+    for category, options in CATEGORY_FILTERS.items():
+        for option, terms in options.items():
+            assert len(index.match_any(terms, prefix=False)), f"{category}: {option}"
+
+def publications():
+    return pd.DataFrame({
+        'title': ["Bone loss in mice", "Plant roots in orbit", "Radiation and yeast"],
+        'abstract': ["Mice aboard the ISS lost bone density.",
+                     "Arabidopsis roots grew on the ISS.",
+                     "Yeast exposed to cosmic radiation."],
+        'link': ['a', 'b', 'c'],
+        'organisms': [['mice'], ['arabidopsis'], ['yeast']],
+        'experiment_types': [['bone loss'], [], ['radiation']],
+        'missions': [['ISS'], ['ISS'], []]
+    })
+
+def test_search_index_boosts_and_filters_on_metadata_lists():
+    from src.search import SearchIndex
+
+    index = SearchIndex.build(publications())
+    assert index.frame['organisms'].tolist() == ['mice', 'arabidopsis', 'yeast']
+    results = index.query("iss", k=None, filters={'organisms': 'arabidopsis'})
+    assert results['title'].tolist() == ["Plant roots in orbit"]
+    # The metadata boost lifts rows whose extracted mission matches the query
+    scores = index.relevance("iss")
+    assert scores[0] > index.scores("iss")[0]
+
+def test_top_k_pages_match_a_full_sort():
+    from src.search import SearchIndex
+
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 20, size=500).astype(float)  # plenty of ties
+    mask = rng.random(500) < 0.6
+    candidates = np.flatnonzero(mask)
+    full = candidates[np.argsort(-scores[candidates], kind='stable')]
+    for page, size in [(1, 10), (3, 25), (7, 50)]:
+        order = SearchIndex.top_k(scores, mask, page * size)
+        page_rows = order[(page - 1) * size:]
+        expected = full[(page - 1) * size:page * size]
+        assert page_rows.tolist() == expected.tolist()
+
+def test_search_index_rejects_filters_on_columns_it_does_not_keep():
+    from src.search import SearchIndex
+
+    index = SearchIndex.build(publications().assign(year=[2019, 2020, 2021]))
+    with pytest.raises(ValueError, match='year'):
+        index.query("iss", filters={'year': '2020'})
+    # Non-metadata result columns filter on their exact value
+    assert index.query("iss", filters={'link': 'B'})['link'].tolist() == ['b']
+
+def test_corpus_stores_and_reloads_search_index(tmp_path):
+    from src.corpus import Corpus
+
+    frame = publications().assign(pub_id=['1', '2', '3'], row_hash=['x', 'y', 'z'])
+    path = tmp_path / 'publications-abc-v1.search'
+    built = Corpus(frame.copy(), path).search_index()
+    assert path.exists()
+    loaded = Corpus(frame.copy(), path).search_index()
+    assert np.allclose(built.relevance("radiation"), loaded.relevance("radiation"))
+
+def test_benchmark_agrees_with_row_by_row_scoring():
+    from src.search_benchmark import benchmark
+
+    [row] = benchmark([200], ["microgravity bone loss"], baseline_max=200)
+    assert row['publications'] == 200
+    assert row['top_k_agreement'] == 1.0
+
+def test_card_taxonomy_covers_inflected_forms():
+    from src.taxonomy import card_labels, card_tagger
+
+    assert card_labels("Genomic profiling of flown samples")[1] == 'Genomic'
+    assert card_labels("Genetics of long-duration crews")[1] == 'Genomic'
+    assert card_labels("Whole genome sequencing")[1] == 'Genomic'
+    assert card_labels("Cellular responses to unloading")[0] == 'Cell'
+    # Prefix terms still need a word start
+    assert card_tagger().tag("the heterogenous samples")['experiment_type'] == []
+
+def test_prefix_terms_in_category_filters():
+    index = make_index(["Transcriptomics of flown plants", "General procedures"])
+    assert index.match_any(['transcriptom*'], prefix=False).tolist() == [0]
+    assert len(index.match_any(CATEGORY_FILTERS['Experiment']['Genomics'], prefix=False)) == 1
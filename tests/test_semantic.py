@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.semantic as semantic
+from src.corpus import Corpus
+from src.semantic import IVFIndex, SemanticIndex, StaleIndexError, embedding_key
+
+def make_corpus(titles):
+    n = len(titles)
+    return Corpus(pd.DataFrame({
+        'title': titles,
+        'abstract': [f"Abstract of {t}." for t in titles],
+        'link': [f"https://example.org/PMC{i}" for i in range(n)],
+        'pub_id': [f"PMC{i}" for i in range(n)],
+        'row_hash': [f"hash{i}" for i in range(n)]
+    }))
+
+@pytest.fixture
+def saved_index(tmp_path, monkeypatch):
+    """Write a random index for a three-publication corpus and point the module at it"""
+    for name, filename in [('EMBEDDINGS_PATH', 'embeddings.npy'),
+                           ('ANN_INDEX_PATH', 'ivf.npz'), ('META_PATH', 'meta.json')]:
+        monkeypatch.setattr(semantic, name, str(tmp_path / filename))
+    semantic._load_index.cache_clear()
+    corpus = make_corpus(["Bone loss", "Plant roots", "Cosmic radiation"])
+    vectors = np.eye(3, 8, dtype=np.float16)
+    np.save(semantic.EMBEDDINGS_PATH, vectors)
+    IVFIndex.build(vectors, nlist=1).save(semantic.ANN_INDEX_PATH)
+    SemanticIndex(vectors, None, 'stub', corpus.ids, embedding_key(corpus.frame, 'stub')).save_meta(
+        semantic.META_PATH)
+    monkeypatch.setattr(SemanticIndex, 'encode_query', lambda self, query: np.eye(8, dtype=np.float32)[2])
+    return corpus
+
+def test_search_returns_rows_of_the_matching_corpus(saved_index):
+    results = semantic.semantic_search("radiation", k=1, corpus=saved_index)
+    assert results['pub_id'].tolist() == ['PMC2']
+
+def test_reingested_corpus_is_refused(saved_index):
+    reordered = make_corpus(["Cosmic radiation", "Bone loss", "Plant roots"])
+    with pytest.raises(StaleIndexError):
+        semantic.semantic_search("radiation", k=1, corpus=reordered)
+    edited = make_corpus(["Bone loss", "Plant roots", "Cosmic radiation"])
+    edited.frame.loc[2, 'abstract'] = "Revised abstract."
+    with pytest.raises(StaleIndexError):
+        semantic.semantic_search("radiation", k=1, corpus=edited)
+
+def clustered_vectors(n=2000, dim=16, clusters=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dim))
+    vectors = centres[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, dim))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+def test_holdout_recall_excludes_the_queries():
+    vectors = clustered_vectors()
+    # Probing every bucket is exhaustive search
+    assert semantic.holdout_recall(vectors, n_queries=50, nlist=10, nprobe=10) == 1.0
+    # A single probe misses neighbours across bucket borders
+    assert 0.0 < semantic.holdout_recall(vectors, n_queries=50, nlist=40, nprobe=1) < 1.0
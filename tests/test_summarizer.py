@@ -0,0 +1,242 @@
+import asyncio
+import json
+
+import src.summarizer as summarizer
+from src.async_runtime import get_background_loop
+from src.context import count_tokens
+from src.ollama_benchmark import STUB_JSON, StubOllamaServer, benchmark, stub_cli
+from src.summary_cache import SummaryCache
+from src.summarizer import BACKENDS, error_summary, prepare_prompt, register_backend, summarize_stream
+
+def fake_stream_backend(name, calls):
+    async def stream(prompt, model):
+        calls.append(prompt)
+        yield "Introduction: about plants\n"
+        await asyncio.sleep(0.02)
+        yield "Conclusion: they grow\n"
+
+    async def summarize(title, abstract, results=None, conclusion=None):
+        return error_summary(name, "not used")
+
+    return register_backend(name, name, summarize, stream)
+
+async def collect(stream):
+    chunks = [chunk async for chunk in stream]
+    return chunks[-1].result
+
+def test_follower_takes_over_when_leader_stops_early():
+    calls = []
+    fake_stream_backend('fake', calls)
+
+    async def scenario():
+        leader = summarize_stream('Title', 'Abstract', 'fake', use_cache=False)
+        await leader.__anext__()
+        follower = asyncio.create_task(
+            collect(summarize_stream('Title', 'Abstract', 'fake', use_cache=False)))
+        await asyncio.sleep(0.005)
+        await leader.aclose()
+        return await follower
+
+    try:
+        result = asyncio.run(scenario())
+    finally:
+        BACKENDS.pop('fake')
+    assert result.error is None
+    assert result.conclusion == 'they grow'
+    assert len(calls) == 2
+
+def test_follower_shares_finished_stream():
+    calls = []
+    fake_stream_backend('fake', calls)
+
+    async def scenario():
+        return await asyncio.gather(
+            collect(summarize_stream('Title', 'Abstract', 'fake', use_cache=False)),
+            collect(summarize_stream('Title', 'Abstract', 'fake', use_cache=False)))
+
+    try:
+        first, second = asyncio.run(scenario())
+    finally:
+        BACKENDS.pop('fake')
+    assert first is second
+    assert len(calls) == 1
+
+def test_task_is_kept_outside_the_content_budget():
+    abstract = ' '.join(f"Sentence {i} about plant roots in microgravity." for i in range(2000))
+    task = "\n".join(["Answer in three bullet points.", "Question: How do roots grow in orbit?"])
+    prompt = prepare_prompt('Title', abstract, model='gpt-4', task=task)
+    assert prompt.rstrip().endswith(task)
+    assert count_tokens(prompt, 'gpt-4') < count_tokens(abstract, 'gpt-4')
+
+def test_task_answer_is_kept_as_plain_text(monkeypatch):
+    answer = "Roots grow toward light in orbit [1], and auxin transport changes [2]."
+
+    async def stream(prompt, model):
+        for word in answer.split(' '):
+            yield word + ' '
+
+    async def summarize(title, abstract, results=None, conclusion=None):
+        return error_summary('fake', "not used")
+
+    register_backend('fake', 'fake', summarize, stream)
+    cache = SummaryCache(':memory:')
+    monkeypatch.setattr(summarizer, 'get_summary_cache', lambda: cache)
+    try:
+        fresh = asyncio.run(collect(summarize_stream('Title', '', 'fake', task="Question: roots?")))
+        cached = asyncio.run(collect(summarize_stream('Title', '', 'fake', task="Question: roots?")))
+    finally:
+        BACKENDS.pop('fake')
+    # No section headers in a free-form answer, but the reply itself survives
+    assert not any([fresh.introduction, fresh.methods, fresh.results, fresh.conclusion])
+    assert fresh.text.strip() == answer
+    assert cached.text == fresh.text
+
+def ollama_reply(text):
+    return 200, 'application/json', json.dumps({'response': text, 'done': True}).encode()
+
+def test_ollama_posts_to_generate_with_keep_alive(monkeypatch, stub_server):
+    server = stub_server(lambda method, path, body, headers: ollama_reply(STUB_JSON))
+    monkeypatch.setattr(summarizer, 'OLLAMA_HOST', server.url)
+
+    async def twice():
+        first = await summarizer.summarize_with_ollama('Title', 'Abstract')
+        second = await summarizer.summarize_with_ollama('Title', 'Abstract')
+        await summarizer.get_ollama_client().aclose()
+        return first, second
+
+    first, second = asyncio.run(twice())
+    assert first.error is None and second.error is None
+    assert first.key_findings == ['Bone volume fell', 'Osteoclasts increased']
+    method, path, body = server.calls[0]
+    payload = json.loads(body)
+    assert (method, path) == ('POST', '/api/generate')
+    assert payload['keep_alive'] == summarizer.OLLAMA_KEEP_ALIVE
+    assert payload['stream'] is False
+    assert len(server.calls) == 2
+
+def test_ollama_benchmark_against_stubs(monkeypatch):
+    stub = StubOllamaServer(delay=0.01)
+    monkeypatch.setattr(summarizer, 'OLLAMA_HOST', stub.url)
+    try:
+        rows = benchmark(n=2, concurrency=2, cli=stub_cli(0.01))
+    finally:
+        stub.close()
+    assert [row['path'] for row in rows] == ['subprocess', 'http x1', 'http x2']
+    assert all(row['requests'] == 2 for row in rows)
+
+def test_ollama_falls_back_to_text_when_schema_is_rejected(monkeypatch, stub_server):
+    from src.ollama_benchmark import STUB_TEXT
+
+    def old_server(method, path, body, headers):
+        if 'format' in json.loads(body):
+            return 400, 'application/json', b'{"error": "invalid format"}'
+        return ollama_reply(STUB_TEXT)
+
+    server = stub_server(old_server)
+    monkeypatch.setattr(summarizer, 'OLLAMA_HOST', server.url)
+    monkeypatch.setattr(summarizer, '_ollama_schema_rejected', set())
+    monkeypatch.setattr(summarizer, 'PARSE_STATS', dict.fromkeys(summarizer.PARSE_STATS, 0))
+
+    async def twice():
+        first = await summarizer.summarize_with_ollama('Title', 'Abstract')
+        second = await summarizer.summarize_with_ollama('Title', 'Abstract')
+        await summarizer.get_ollama_client().aclose()
+        return first, second
+
+    first, second = asyncio.run(twice())
+    assert first.error is None and second.error is None
+    assert first.introduction == 'Spaceflight causes bone loss.'
+    # The schema is sent once; afterwards the host gets the text prompt directly
+    assert ['format' in json.loads(body) for _, _, body in server.calls] == [True, False, False]
+    stats = summarizer.parse_stats()
+    assert stats['schema_rejected'] == 1
+    assert stats['text_ok'] == 2
+
+def test_default_openai_model_uses_structured_output(monkeypatch, stub_server):
+    requests = []
+
+    def openai_server(method, path, body, headers):
+        requests.append(json.loads(body))
+        return 200, 'application/json', json.dumps({
+            'id': 'chatcmpl-1', 'object': 'chat.completion', 'created': 0,
+            'model': summarizer.OPENAI_MODEL,
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': STUB_JSON}}]
+        }).encode()
+
+    server = stub_server(openai_server)
+    monkeypatch.setenv('OPENAI_BASE_URL', f"{server.url}/v1")
+    monkeypatch.setenv('OPENAI_API_KEY', 'test')
+    monkeypatch.setattr(summarizer, 'PARSE_STATS', dict.fromkeys(summarizer.PARSE_STATS, 0))
+    assert summarizer.supports_structured_output('openai', summarizer.OPENAI_MODEL)
+
+    async def run():
+        summary = await summarizer.summarize_with_openai('Title', 'Abstract')
+        await summarizer.get_openai_client().close()
+        return summary
+
+    summary = asyncio.run(run())
+    assert summary.error is None
+    assert summary.key_findings == ['Bone volume fell', 'Osteoclasts increased']
+    assert requests[0]['response_format']['type'] == 'json_schema'
+    assert summarizer.parse_stats()['structured_ok'] == 1
+    assert server.calls[0][1] == '/v1/chat/completions'
+
+def test_openai_client_is_pooled_per_loop(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test')
+
+    async def clients():
+        return summarizer.get_openai_client(), summarizer.get_openai_client()
+
+    first, second = summarizer.run_sync(clients())
+    assert first is second
+    # Later calls from any thread reuse the background loop's client
+    assert summarizer.run_sync(clients())[0] is first
+    other, _ = asyncio.run(clients())
+    assert other is not first
+
+def test_summarize_sync_runs_on_the_background_loop(monkeypatch):
+    loops = []
+
+    async def summarize(title, abstract, results=None, conclusion=None):
+        loops.append(asyncio.get_running_loop())
+        return error_summary('fake', None)
+
+    register_backend('fake', 'fake', summarize)
+    monkeypatch.setattr(summarizer, 'get_summary_cache', lambda: SummaryCache(':memory:'))
+    try:
+        result = summarizer.summarize_sync('Title', 'Abstract', 'fake')
+    finally:
+        BACKENDS.pop('fake')
+    assert result.model_used == 'fake'
+    assert loops == [get_background_loop().loop]
+
+def test_incremental_parser_matches_one_shot_parse():
+    from src.ollama_benchmark import STUB_TEXT
+    from src.summarizer import IncrementalSummaryParser, extract_key_findings, extract_sections
+
+    for size in (1, 3, 7, 64):
+        parser = IncrementalSummaryParser()
+        for i in range(0, len(STUB_TEXT), size):  # headers and bullets split across chunks
+            parser.feed(STUB_TEXT[i:i + size])
+        parser.finish()
+        assert parser.sections == extract_sections(STUB_TEXT)
+        assert parser.key_findings == extract_key_findings(STUB_TEXT)
+
+def test_stream_yields_partial_text_before_the_result(monkeypatch):
+    calls = []
+    fake_stream_backend('fake', calls)
+    monkeypatch.setattr(summarizer, 'get_summary_cache', lambda: SummaryCache(':memory:'))
+
+    async def chunks():
+        return [chunk async for chunk in summarize_stream('Title', 'Abstract', 'fake')]
+
+    try:
+        streamed = asyncio.run(chunks())
+    finally:
+        BACKENDS.pop('fake')
+    partial, final = streamed[:-1], streamed[-1]
+    assert [chunk.delta for chunk in partial] == ["Introduction: about plants\n", "Conclusion: they grow\n"]
+    assert partial[0].sections['introduction'] == 'about plants'
+    assert all(chunk.result is None for chunk in partial)
+    assert final.result.conclusion == 'they grow'
@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+from src.summary_cache import SummaryCache
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / 'summaries.sqlite')
+    key = SummaryCache.make_key('Title', 'prompt', 'openai:gpt-4o-mini')
+    SummaryCache(path).set(key, {'introduction': 'intro'})
+    cache = SummaryCache(path)
+    assert cache.get(key) == {'introduction': 'intro'}
+    assert cache.stats() == {'hits': 1, 'misses': 0, 'hit_rate': 1.0, 'entries': 1}
+
+def test_key_covers_title_prompt_and_model():
+    key = SummaryCache.make_key('Title', 'prompt', 'openai:gpt-4o-mini')
+    assert key == SummaryCache.make_key('Title', 'prompt', 'openai:gpt-4o-mini')
+    assert key != SummaryCache.make_key('Other', 'prompt', 'openai:gpt-4o-mini')
+    assert key != SummaryCache.make_key('Title', 'prompt with results', 'openai:gpt-4o-mini')
+    assert key != SummaryCache.make_key('Title', 'prompt', 'ollama:gpt-oss:20b-cloud')
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SummaryCache(':memory:', max_entries=2)
+    cache.set('a', {'n': 1})
+    time.sleep(0.01)
+    cache.set('b', {'n': 2})
+    time.sleep(0.01)
+    assert cache.get('a') == {'n': 1}  # 'b' is now the least recently used
+    time.sleep(0.01)
+    cache.set('c', {'n': 3})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'n': 1} and cache.get('c') == {'n': 3}
+
+def test_expired_entries_are_misses():
+    cache = SummaryCache(':memory:', ttl=0.05)
+    cache.set('a', {'n': 1})
+    time.sleep(0.1)
+    assert cache.get('a') is None
+    assert cache.stats()['entries'] == 0
+
+def test_summarize_serves_repeats_from_the_cache(monkeypatch):
+    import src.summarizer as summarizer
+    from src.summarizer import BACKENDS, error_summary, register_backend
+
+    calls = []
+
+    async def summarize(title, abstract, results=None, conclusion=None):
+        calls.append(title)
+        if title == 'Broken':
+            return error_summary('fake', 'model failed')
+        return summarizer.build_summary("Introduction: cached", 'fake')
+
+    register_backend('fake', 'fake', summarize)
+    cache = SummaryCache(':memory:')
+    monkeypatch.setattr(summarizer, 'get_summary_cache', lambda: cache)
+    try:
+        for title in ['Title', 'Title', 'Broken', 'Broken']:
+            result = asyncio.run(summarizer.summarize(title, 'Abstract', 'fake'))
+    finally:
+        BACKENDS.pop('fake')
+    assert result.error == 'model failed'
+    # The good summary is generated once; errors are retried every time
+    assert calls == ['Title', 'Broken', 'Broken']